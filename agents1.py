@@ -8,9 +8,20 @@ however only such which is considered to be publicly available already elsewhere
 If you want to be deleted from or added to this file please create a pull-request (preferred) or contact the author(s).
 """
 
+import importlib.util
+import os
+import sys
+from collections import defaultdict, Counter
 
 import pyirk as p
 
+# shared infrastructure (plain python module, see its docstring)
+if "ocse_statement_index" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("ocse_statement_index", os.path.abspath("./statement_index.py"))
+    sys.modules["ocse_statement_index"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["ocse_statement_index"])
+si = sys.modules["ocse_statement_index"]
+
 
 __URI__ =  "irk:/ocse/0.2/agents"
 
@@ -527,6 +538,15 @@ R8437 = p.create_relation(
 
 
 
+R8438 = p.create_relation(
+    R1__has_label="is segment of",
+    R2__has_description="specifies the source document to which the subject (a source segment) belongs",
+    R8__has_domain_of_argument_1=I7800["source segment"],
+    R11__has_range_of_result=I6591["source document"],
+    R22__is_functional=True,
+)
+
+
 SOURCE_SEGMENT_CACHE = {}
 
 @p.wrap_function_with_search_uri_context
@@ -546,6 +566,7 @@ def get_source_segment(source_doc: p.Item, segment_specification: str):
         item = p.instance_of(I7800["source segment"], r1=r1)
         SOURCE_SEGMENT_CACHE[key] = item
         item.R8437__has_segment_specification = segment_specification
+        item.R8438__is_segment_of = source_doc
     return item
 
 
@@ -557,6 +578,126 @@ R8439 = p.create_relation(
 )
 
 
+class CitationIndex(si.IncrementalStatementIndex):
+    """
+    Index for the citation graph, i.e. for the chain
+
+        knowledge artifact --R8439--> source segment --R8438--> source document --R8433--> authors
+
+    Forward and reverse adjacency are stored as lists of uris. The index is updated incrementally (see
+    si.IncrementalStatementIndex). The query methods are batched, i.e. they accept multiple items and return a dict
+    like {item_uri: [result_item1, ...]}.
+    """
+
+    def clear(self):
+        super().clear()
+        # forward adjacency
+        self.artifact_sources = defaultdict(list)
+        self.segment_document = {}
+        self.document_authors = defaultdict(list)
+
+        # reverse adjacency
+        self.source_artifacts = defaultdict(list)
+        self.document_segments = defaultdict(list)
+        self.author_documents = defaultdict(list)
+
+    def _process_new_statements(self):
+        """
+        process all R8433, R8438 and R8439 statements which are not yet known to the index
+        """
+
+        for stm in self._get_new_statements(R8438["is segment of"]):
+            self.segment_document[stm.subject.uri] = stm.object.uri
+            self.document_segments[stm.object.uri].append(stm.subject.uri)
+
+        for stm in self._get_new_statements(R8433["has authors"]):
+            self.document_authors[stm.subject.uri].append(stm.object.uri)
+            self.author_documents[stm.object.uri].append(stm.subject.uri)
+
+        for stm in self._get_new_statements(R8439["is described by source"]):
+            self.artifact_sources[stm.subject.uri].append(stm.object.uri)
+            self.source_artifacts[stm.object.uri].append(stm.subject.uri)
+
+    @staticmethod
+    def _items(uris) -> list:
+        # remove duplicates but keep the order
+        return [p.ds.get_entity_by_uri(uri) for uri in dict.fromkeys(uris)]
+
+    def _artifact_uris_of_document(self, doc_uri: str) -> list:
+        res = list(self.source_artifacts.get(doc_uri, []))
+        for segment_uri in self.document_segments.get(doc_uri, []):
+            res.extend(self.source_artifacts.get(segment_uri, []))
+        return res
+
+    def get_described_artifacts(self, *sources: p.Item) -> dict:
+        """
+        :param sources:     source documents or source segments
+
+        For every source return the knowledge artifacts which are described by it. For a source document this
+        includes the artifacts which refer to one of its segments.
+        """
+        res = {}
+        for source in sources:
+            if source.uri in self.segment_document:
+                res[source.uri] = self._items(self.source_artifacts.get(source.uri, []))
+            else:
+                res[source.uri] = self._items(self._artifact_uris_of_document(source.uri))
+        return res
+
+    def get_sources(self, *artifacts: p.Item) -> dict:
+        """
+        For every knowledge artifact return the source documents by which it is described (directly or via segments)
+        """
+        res = {}
+        for artifact in artifacts:
+            uris = self.artifact_sources.get(artifact.uri, [])
+            res[artifact.uri] = self._items(self.segment_document.get(uri, uri) for uri in uris)
+        return res
+
+    def get_documents_by_author(self, *authors: p.Item) -> dict:
+        return {author.uri: self._items(self.author_documents.get(author.uri, [])) for author in authors}
+
+    def get_artifacts_by_author(self, *authors: p.Item) -> dict:
+        res = {}
+        for author in authors:
+            uris = []
+            for doc_uri in self.author_documents.get(author.uri, []):
+                uris.extend(self._artifact_uris_of_document(doc_uri))
+            res[author.uri] = self._items(uris)
+        return res
+
+    def get_citation_counts(self, level: str = "segment") -> Counter:
+        """
+        :param level:   "segment" (count the objects of R8439 as they are) or "document" (aggregate segments)
+
+        :return:        Counter like {source_uri: number_of_R8439_statements}
+        """
+        assert level in ("segment", "document")
+        counter = Counter()
+        for source_uri, artifact_uris in self.source_artifacts.items():
+            if level == "document":
+                source_uri = self.segment_document.get(source_uri, source_uri)
+            counter[source_uri] += len(artifact_uris)
+        return counter
+
+    def get_most_cited(self, n: int = None, level: str = "segment") -> list:
+        """
+        :return:    list of pairs like [(source_item, count), ...] in descending order
+        """
+        counter = self.get_citation_counts(level=level)
+        return [(p.ds.get_entity_by_uri(uri), count) for uri, count in counter.most_common(n)]
+
+
+CITATION_INDEX = CitationIndex()
+
+
+def get_citation_index() -> CitationIndex:
+    """
+    Return the (incrementally updated) module-wide instance of CitationIndex
+    """
+    return CITATION_INDEX.update()
+
+
 
 p.end_mod()
 
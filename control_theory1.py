@@ -1,3 +1,11 @@
+import bisect
+import importlib.util
+import itertools
+import os
+import re
+import sys
+from collections import Counter, defaultdict, deque
+
 import pyirk as p
 
 
@@ -7,6 +15,13 @@ from ipydex import IPS, activate_ips_on_exception  # noqa
 ma = p.irkloader.load_mod_from_path("./math1.py", prefix="ma")
 ag = ma.ag
 
+# shared infrastructure (plain python module, see its docstring)
+if "ocse_statement_index" not in sys.modules:
+    _spec = importlib.util.spec_from_file_location("ocse_statement_index", os.path.abspath("./statement_index.py"))
+    sys.modules["ocse_statement_index"] = importlib.util.module_from_spec(_spec)
+    _spec.loader.exec_module(sys.modules["ocse_statement_index"])
+si = sys.modules["ocse_statement_index"]
+
 
 # todo: rename .scope("context") to .scope("setting")
 
@@ -391,6 +406,27 @@ I5325["Hurwitz polynomial"].set_relation(p.R37["has definition"], I4455["definit
 # </definition>
 
 
+def I5325_check_coefficients(self, coeffs, link_items=None):
+    """
+    Numerically decide for a batch of polynomials whether they are Hurwitz polynomials (see ma.routh_hurwitz_mask).
+
+    :param self:        class item I5325["Hurwitz polynomial"] (to which this function will be attached)
+    :param coeffs:      array-like of shape (N, n+1); each row contains the coefficients in descending order
+    :param link_items:  optional sequence of N polynomial items (corresponding to the rows of `coeffs`);
+                        if passed, every item for which the test succeeds is marked as secondary instance of
+                        I5325["Hurwitz polynomial"] (like in the assertion of its definition)
+    :return:            bool array of shape (N,)
+    """
+
+    mask = ma.routh_hurwitz_mask(coeffs)
+
+    _link_check_results(self, mask, link_items, relations=(p.R30["is secondary instance of"], None))
+    return mask
+
+
+I5325["Hurwitz polynomial"].add_method(I5325_check_coefficients, "check_coefficients")
+
+
 # TODO: open question should  I3007["stability theorem for a rational transfer function"] be constructed by using I5325["Hurwitz polynomial"]
 # con: BIBO-stability might be meaningful also for transfer functions with non-polynomial denominators
 
@@ -423,6 +459,165 @@ with I3007.scope("assertion") as cm:
 # </theorem>
 
 
+# numerical representation of many rational transfer functions G(s) = num(s) / den(s)
+
+
+class TransferFunctionBatch:
+    """
+    Coefficient arrays (descending order) of N rational transfer functions. Rows are left-padded with zeros to a
+    common length; the actual degrees are stored separately.
+    """
+
+    def __init__(self, numerators, denominators):
+        """
+        :param numerators:      sequence of N coefficient sequences (descending order, may have different lengths)
+        :param denominators:    sequence of N coefficient sequences
+        """
+        if len(numerators) != len(denominators):
+            msg = f"got {len(numerators)} numerators but {len(denominators)} denominators"
+            raise ValueError(msg)
+        self.num, self.num_degrees = self._pad(numerators)
+        self.den, self.den_degrees = self._pad(denominators)
+        if (self.den_degrees < 0).any():
+            msg = "denominator must not be the zero polynomial"
+            raise ValueError(msg)
+
+    @staticmethod
+    def _pad(coeff_rows):
+        import numpy as np
+
+        rows = [np.atleast_1d(np.asarray(row, dtype=float)) for row in coeff_rows]
+        length = max([len(row) for row in rows], default=1)
+        res = np.zeros((len(rows), length))
+        degrees = np.full(len(rows), -1)
+        for i, row in enumerate(rows):
+            res[i, length - len(row) :] = row
+            nonzero = np.flatnonzero(row)
+            if len(nonzero):
+                degrees[i] = len(row) - 1 - nonzero[0]
+        return res, degrees
+
+    @classmethod
+    def from_sympy(cls, exprs, s):
+        """
+        :param exprs:   sequence of rational sympy expressions in the variable `s`
+        """
+        import sympy as sp
+
+        numerators, denominators = [], []
+        for expr in exprs:
+            num, den = sp.fraction(sp.cancel(sp.together(expr)))
+            numerators.append([float(c) for c in sp.Poly(num, s).all_coeffs()])
+            denominators.append([float(c) for c in sp.Poly(den, s).all_coeffs()])
+        return cls(numerators, denominators)
+
+    def __len__(self):
+        return len(self.num)
+
+    def properness_mask(self):
+        return self.num_degrees <= self.den_degrees
+
+    def strict_properness_mask(self):
+        return self.num_degrees < self.den_degrees
+
+    def hurwitz_denominator_mask(self):
+        """
+        Routh-Hurwitz test of the denominators (grouped by degree such that leading zeros do not occur)
+        """
+        import numpy as np
+
+        res = np.zeros(len(self), dtype=bool)
+        width = self.den.shape[1]
+        for degree in np.unique(self.den_degrees):
+            idcs = np.flatnonzero(self.den_degrees == degree)
+            res[idcs] = ma.routh_hurwitz_mask(self.den[idcs, width - degree - 1 :])
+        return res
+
+    def bibo_stability_mask(self):
+        """
+        sufficient condition according to I3007: proper and all roots of the denominator in the open left half plane
+        (poles which are cancelled by zeros are not taken into account)
+        """
+        return self.properness_mask() & self.hurwitz_denominator_mask()
+
+    def frequency_response(self, omega):
+        """
+        :param omega:   array of shape (W,) (angular frequencies)
+        :return:        complex array of shape (N, W) with G(j·omega)
+        """
+        import numpy as np
+
+        s = 1j * np.asarray(omega, dtype=float)[np.newaxis, :]
+
+        def horner(coeffs):
+            res = np.zeros((len(coeffs), s.shape[1]), dtype=complex)
+            for k in range(coeffs.shape[1]):
+                res = res * s + coeffs[:, k, np.newaxis]
+            return res
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return horner(self.num) / horner(self.den)
+
+    def bode(self, omega):
+        """
+        :return:    pair (magnitude in dB, unwrapped phase in degree), both of shape (N, W)
+        """
+        import numpy as np
+
+        G = self.frequency_response(omega)
+        with np.errstate(divide="ignore"):
+            magnitude = 20 * np.log10(np.abs(G))
+        return magnitude, np.degrees(np.unwrap(np.angle(G), axis=1))
+
+
+def I2640_create_batch(self, numerators, denominators):
+    """
+    :param self:    class item (to which this function will be attached)
+    :return:        TransferFunctionBatch
+    """
+    return TransferFunctionBatch(numerators, denominators)
+
+
+def I8181_check_transfer_functions(self, batch, link_items=None):
+    """
+    :param self:        property item (to which this function will be attached)
+    :param batch:       TransferFunctionBatch
+    :param link_items:  optional sequence of N transfer function representation items
+    """
+    mask = batch.properness_mask()
+    # (like in the assertion of I3007 the properties are attached via R16)
+    _link_check_results(self, mask, link_items, relations=(p.R16["has property"], None))
+    return mask
+
+
+def I8182_check_transfer_functions(self, batch, link_items=None):
+    """
+    :param self:        property item (to which this function will be attached)
+    :param batch:       TransferFunctionBatch
+    :param link_items:  optional sequence of N transfer function representation items
+    """
+    mask = batch.strict_properness_mask()
+    _link_check_results(self, mask, link_items, relations=(p.R16["has property"], None))
+    return mask
+
+
+def I7208_check_transfer_functions(self, batch, link_items=None):
+    """
+    :param self:        property item (to which this function will be attached)
+    :param batch:       TransferFunctionBatch
+    :param link_items:  optional sequence of N system model items
+    """
+    mask = batch.bibo_stability_mask()
+    _link_check_results(self, mask, link_items, relations=(p.R16["has property"], None))
+    return mask
+
+
+I2640["transfer function representation"].add_method(I2640_create_batch, "create_batch")
+I8181["properness"].add_method(I8181_check_transfer_functions, "check_transfer_functions")
+I8182["strict properness"].add_method(I8182_check_transfer_functions, "check_transfer_functions")
+I7208["BIBO stability"].add_method(I7208_check_transfer_functions, "check_transfer_functions")
+
+
 
 # todo: find the context of this and reformulate as IntegerRangeSequence
 # p.Sequence("y", p._I000["time derivative of order i"], link_op=p._I000["listing"], start=0, stop="k")
@@ -533,6 +728,192 @@ I2753 = p.create_item(
 )
 # TODO: find a way to assign labels to the arguments: "initial value x", "time t", "vector field f"
 
+
+# numerical evaluation of the flow for many initial values (autonomous vector fields given as sympy expressions)
+
+# maps (f, x, params) to the lambdified right hand side
+VECTOR_FIELD_FUNCTION_CACHE = ma.LRUCache(maxsize=128)
+
+
+def compile_vector_field(f, x, params=()):
+    """
+    :param f:       sequence of sympy expressions (vector field)
+    :param x:       sequence of sympy symbols (state coordinates)
+    :param params:  sequence of additional symbols (parameters)
+    :return:        function X, *param_values -> array of shape (N, n), where X has shape (N, n)
+    """
+    import numpy as np
+    import sympy as sp
+
+    key = (tuple(sp.sympify(fi) for fi in f), tuple(x), tuple(params))
+    if key in VECTOR_FIELD_FUNCTION_CACHE:
+        return VECTOR_FIELD_FUNCTION_CACHE[key]
+
+    f, x, params = key
+    raw_func = sp.lambdify([*x, *params], f, modules="numpy")
+
+    def rhs(X, *param_values):
+        values = raw_func(*X.T, *param_values)
+        # constant components are returned as scalars -> broadcast them to the number of points
+        return np.stack([np.broadcast_to(v, X.shape[:1]) for v in values], axis=1)
+
+    VECTOR_FIELD_FUNCTION_CACHE[key] = rhs
+    return rhs
+
+
+class FlowSimulator:
+    """
+    Explicit Runge-Kutta method of order 5(4) (Dormand-Prince) for a batch of initial values. Every trajectory has
+    its own adaptive step size but all stages are evaluated for the whole (N, n) state array at once. Trajectories
+    which diverge (non finite values) or need too small steps are filled with nan.
+    """
+
+    C = (0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1)
+    A = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    )
+    # 5th order weights (identical to the last row of A) and difference to the embedded 4th order weights
+    B = (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0)
+    E = (71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+    def __init__(self, rhs, rtol=1e-6, atol=1e-9, max_steps=100000):
+        """
+        :param rhs:     function X -> X_dot for arrays of shape (N, n)
+        """
+        self.rhs = rhs
+        self.rtol = rtol
+        self.atol = atol
+        self.max_steps = max_steps
+
+    def _step(self, X, h):
+        import numpy as np
+
+        K = [self.rhs(X)]
+        for row in self.A[1:]:
+            dX = sum(a * k for a, k in zip(row, K) if a != 0)
+            K.append(self.rhs(X + h[:, np.newaxis] * dX))
+        X_new = X + h[:, np.newaxis] * sum(b * k for b, k in zip(self.B, K) if b != 0)
+        error = h[:, np.newaxis] * sum(e * k for e, k in zip(self.E, K) if e != 0)
+        scale = self.atol + self.rtol * np.maximum(np.abs(X), np.abs(X_new))
+        return X_new, np.sqrt(np.mean((error / scale) ** 2, axis=1))
+
+    def integrate(self, X0, t_eval):
+        """
+        :param X0:      array of shape (N, n) (initial values at time t_eval[0])
+        :param t_eval:  increasing sequence of time values
+        :return:        array of shape (N, len(t_eval), n)
+        """
+        import numpy as np
+
+        X = np.array(X0, dtype=float, ndmin=2)
+        t_eval = np.asarray(t_eval, dtype=float)
+        N, n = X.shape
+        T = len(t_eval)
+
+        res = np.full((N, T, n), np.nan)
+        res[:, 0, :] = X
+        t = np.full(N, t_eval[0])
+        h = np.full(N, (t_eval[-1] - t_eval[0]) / 100)
+        h_min = 1e-12 * max(1, abs(t_eval[-1]))
+        next_idx = np.ones(N, dtype=int)
+
+        for _ in range(self.max_steps):
+            active = np.flatnonzero(next_idx < T)
+            if len(active) == 0:
+                break
+            target = t_eval[next_idx[active]]
+            # the proposed step is clipped to the next evaluation time (but kept for the following steps)
+            h_prop = h[active]
+            h_act = np.minimum(h_prop, target - t[active])
+            clipped = h_act < h_prop
+
+            with np.errstate(all="ignore"):
+                X_new, err = self._step(X[active], h_act)
+            err = np.where(np.isfinite(err), err, np.inf)
+            accepted = err <= 1
+
+            acc = active[accepted]
+            t[acc] += h_act[accepted]
+            X[acc] = X_new[accepted]
+            reached = acc[np.isclose(t[acc], t_eval[next_idx[acc]], rtol=0, atol=h_min)]
+            res[reached, next_idx[reached], :] = X[reached]
+            t[reached] = t_eval[next_idx[reached]]
+            next_idx[reached] += 1
+
+            with np.errstate(divide="ignore"):
+                factor = np.clip(0.9 * err ** -0.2, 0.2, 5)
+            factor[~accepted] = np.minimum(factor[~accepted], 1)
+            # an accepted clipped step says nothing about the (larger) proposed step -> do not shrink the latter
+            h[active] = np.where(accepted & clipped, np.maximum(h_prop, h_act * factor), h_act * factor)
+
+            # give up for diverging trajectories
+            failed = active[(h[active] < h_min) | ~np.all(np.isfinite(X[active]), axis=1)]
+            next_idx[failed] = T
+        else:
+            msg = f"maximum number of steps ({self.max_steps}) exceeded"
+            raise RuntimeError(msg)
+
+        # for failed trajectories all values after the failure remain nan
+        return res
+
+
+def simulate_flow(rhs, X0, t_eval, fpath=None, chunk_size=10000, **kwargs):
+    """
+    Simulate the flow for many initial values chunk by chunk. If `fpath` is given, the result is written to a
+    .npy file (via memory mapping) such that the memory consumption is bounded by `chunk_size`.
+
+    :param rhs:     function X -> X_dot for arrays of shape (N, n)
+    :param X0:      array of shape (N, n) or path to a .npy file
+    :param kwargs:  passed to FlowSimulator
+    :return:        array (or memmap) of shape (N, len(t_eval), n)
+    """
+    import numpy as np
+
+    if isinstance(X0, str):
+        X0 = np.load(X0, mmap_mode="r")
+    if not isinstance(X0, np.ndarray):
+        X0 = np.asarray(X0, dtype=float)
+    # (arrays and memmaps are converted to float chunk by chunk in FlowSimulator.integrate)
+    if X0.ndim == 1:
+        X0 = X0[np.newaxis, :]
+    N, n = X0.shape
+    shape = (N, len(t_eval), n)
+
+    if fpath is None:
+        res = np.empty(shape)
+    else:
+        res = np.lib.format.open_memmap(fpath, mode="w+", dtype=float, shape=shape)
+
+    simulator = FlowSimulator(rhs, **kwargs)
+    for start in range(0, N, chunk_size):
+        res[start : start + chunk_size] = simulator.integrate(X0[start : start + chunk_size], t_eval)
+    if fpath is not None:
+        res.flush()
+    return res
+
+
+def I2753_simulate(self, f, x, X0, t_eval, params=(), param_values=(), fpath=None, chunk_size=10000, **kwargs):
+    """
+    :param self:        operator item (to which this function will be attached)
+    :param f:           sequence of sympy expressions (vector field)
+    :param x:           sequence of sympy symbols (state coordinates)
+    """
+    compiled_rhs = compile_vector_field(f, x, params)
+
+    def rhs(X):
+        return compiled_rhs(X, *param_values)
+
+    return simulate_flow(rhs, X0, t_eval, fpath=fpath, chunk_size=chunk_size, **kwargs)
+
+
+I2753["flow of a vector field"].add_method(I2753_simulate, "simulate")
+
 I4122 = p.create_item(
     R1__has_label="independent variable",
     R2__has_description="type for an independent variable",
@@ -677,6 +1058,108 @@ with I8302["definition of iterated Lie derivative of scalar field"].scope("setti
 
 # </definition>
 
+
+# concrete computation of (iterated) Lie derivatives for sympy expressions
+
+# maps (h, f, x) to the list [L_f^0 h, L_f^1 h, ..., L_f^k h] computed so far
+LIE_DERIVATIVE_CACHE = ma.LRUCache(maxsize=128)
+
+# maps (h, f, x, k, params) to a lambdified function
+LIE_DERIVATIVE_FUNCTION_CACHE = ma.LRUCache(maxsize=128)
+
+
+def _lie_derivative_key(h, f, x):
+    import sympy as sp
+
+    # expanded form: equivalent inputs share the cache entry and the expressions do not grow with every order
+    return (sp.expand(h), tuple(sp.expand(fi) for fi in f), tuple(x))
+
+
+def iterated_lie_derivatives(h, f, x, k):
+    """
+    Compute the iterated Lie derivatives L_f^0 h, ..., L_f^k h incrementally: L_f^j h = dL_f^{j-1} h/dx · f
+    reuses L_f^{j-1} h from the cache (key: (h, f, x)). All derivatives are stored in expanded form.
+
+    :param h:   sympy expression (scalar field)
+    :param f:   sequence of sympy expressions (vector field)
+    :param x:   sequence of sympy symbols (state coordinates); same length as `f`
+    :param k:   non-negative integer (highest order)
+    :return:    list of k + 1 sympy expressions
+    """
+    import sympy as sp
+
+    if len(f) != len(x):
+        msg = f"vector field and coordinates have different length ({len(f)} != {len(x)})"
+        raise ValueError(msg)
+
+    key = _lie_derivative_key(h, f, x)
+    h, f, x = key
+    derivatives = LIE_DERIVATIVE_CACHE.get(key)
+    if derivatives is None:
+        derivatives = LIE_DERIVATIVE_CACHE[key] = [h]
+
+    # zero components of f do not contribute
+    pairs = [(xi, fi) for xi, fi in zip(x, f) if fi != 0]
+    while len(derivatives) <= k:
+        last = derivatives[-1]
+        derivatives.append(sp.expand(sp.Add(*[sp.diff(last, xi) * fi for xi, fi in pairs])))
+
+    return derivatives[: k + 1]
+
+
+def lie_derivative_function(h, f, x, k, params=()):
+    """
+    Create a vectorized numerical function for L_f^0 h, ..., L_f^k h.
+
+    :param params:  sequence of additional symbols (parameters), passed as trailing arguments to the result
+    :return:        function X, *param_values -> array of shape (N, k + 1), where X has shape (N, n)
+    """
+    import numpy as np
+    import sympy as sp
+
+    h, f, x = _lie_derivative_key(h, f, x)
+    key = (h, f, x, k, tuple(params))
+    if key in LIE_DERIVATIVE_FUNCTION_CACHE:
+        return LIE_DERIVATIVE_FUNCTION_CACHE[key]
+
+    exprs = iterated_lie_derivatives(h, f, x, k)
+    raw_func = sp.lambdify([*x, *params], exprs, modules="numpy")
+
+    def func(X, *param_values):
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        values = raw_func(*X.T, *param_values)
+        # constant expressions are returned as scalars -> broadcast them to the number of points
+        return np.stack([np.broadcast_to(v, X.shape[:1]) for v in values], axis=1)
+
+    LIE_DERIVATIVE_FUNCTION_CACHE[key] = func
+    return func
+
+
+def I1347_compute(self, h, f, x):
+    """
+    :param self:    operator item (to which this function will be attached)
+    """
+    return iterated_lie_derivatives(h, f, x, 1)[1]
+
+
+def I1371_compute(self, h, f, x, k):
+    """
+    :param self:    operator item (to which this function will be attached)
+    """
+    return iterated_lie_derivatives(h, f, x, k)[k]
+
+
+def I1371_lambdify(self, h, f, x, k, params=()):
+    """
+    :param self:    operator item (to which this function will be attached)
+    """
+    return lie_derivative_function(h, f, x, k, params)
+
+
+I1347["Lie derivative of scalar field"].add_method(I1347_compute, "compute")
+I1371["iterated Lie derivative of scalar field"].add_method(I1371_compute, "compute")
+I1371["iterated Lie derivative of scalar field"].add_method(I1371_lambdify, "lambdify")
+
 # < Model Properties>
 
 # reminder of already existing entities
@@ -739,6 +1222,220 @@ I3227 = p.create_item(
     R17__is_subproperty_of=I9853["detectability"],
 )
 
+
+# numerical rank tests for linear time invariant models x_dot = A x + B u, y = C x
+# (vectorized over many (A, B) or (A, C) pairs; all functions accept single matrices or stacks of matrices)
+
+
+def _system_matrix_stack(A, B):
+    """
+    :return:    pair of arrays of shapes (N, n, n) and (N, n, m) (broadcasted w.r.t. the first axis)
+    """
+    import numpy as np
+
+    A = np.asarray(A, dtype=float)
+    B = np.asarray(B, dtype=float)
+    if A.ndim == 2:
+        A = A[np.newaxis, :, :]
+    if B.ndim == 1:
+        B = B[:, np.newaxis]
+    if B.ndim == 2:
+        B = B[np.newaxis, :, :]
+
+    N = max(A.shape[0], B.shape[0])
+    n = A.shape[1]
+    if A.shape[1:] != (n, n) or B.shape[1] != n:
+        msg = f"incompatible matrix shapes: {A.shape[1:]} and {B.shape[1:]}"
+        raise ValueError(msg)
+    return np.broadcast_to(A, (N, n, n)), np.broadcast_to(B, (N, n, B.shape[2]))
+
+
+def numerical_ranks(M, rtol=None, atol=0, norms=None):
+    """
+    Rank of a stack of matrices based on singular values: sigma_i counts if sigma_i > max(atol, rtol * norm) where
+    norm is sigma_max (the 2-norm of the matrix) by default.
+
+    :param M:       array of shape (..., r, c) (may be complex)
+    :param rtol:    relative tolerance (default: max(r, c) * machine epsilon, like numpy.linalg.matrix_rank)
+    :param atol:    absolute tolerance
+    :param norms:   optional array of shape (...) which replaces sigma_max as reference for rtol (e.g. the norm of
+                    the original matrix if M is derived from it)
+    """
+    import numpy as np
+
+    M = np.asarray(M)
+    sv = np.linalg.svd(M, compute_uv=False)
+    if rtol is None:
+        rtol = max(M.shape[-2:]) * np.finfo(float).eps
+    if norms is None:
+        norms = sv.max(axis=-1, initial=0)
+    tol = np.maximum(atol, rtol * np.asarray(norms))
+    return np.sum(sv > tol[..., np.newaxis], axis=-1)
+
+
+def kalman_controllability_matrices(A, B):
+    """
+    Build (B, A B, A^2 B, ..., A^(n-1) B) by repeated multiplication (no explicit matrix powers).
+
+    :return:    array of shape (N, n, n * m)
+    """
+    import numpy as np
+
+    A, B = _system_matrix_stack(A, B)
+    blocks = [B]
+    for _ in range(A.shape[1] - 1):
+        blocks.append(A @ blocks[-1])
+    return np.concatenate(blocks, axis=2)
+
+
+def kalman_observability_matrices(A, C):
+    """
+    Build (C, C A, ..., C A^(n-1)) (stacked vertically) as transpose of the dual controllability matrix.
+
+    :return:    array of shape (N, n * p, n)
+    """
+    import numpy as np
+
+    A, CT = _system_matrix_stack(np.swapaxes(A, -1, -2), np.swapaxes(np.atleast_2d(C), -1, -2))
+    return np.swapaxes(kalman_controllability_matrices(A, CT), 1, 2)
+
+
+def pbh_mask(A, B, only_unstable=False, rtol=None, atol=0):
+    """
+    Popov-Belevitch-Hautus test: rank [A - lambda I, B] == n for all eigenvalues lambda of A
+    (or only for those with Re(lambda) >= 0 -> stabilizability).
+
+    The relative tolerance refers to the 2-norm of [A, B] (like numpy.linalg.matrix_rank refers to the norm of the
+    matrix). Additionally, the computed eigenvalues are inexact: for an uncontrollable mode the smallest singular
+    value of [A - lambda I, B] is about |lambda - lambda_exact| ~ eps·||A||·kappa(lambda) (kappa: condition number of
+    the eigenvalue). Thus the tolerance for every eigenvalue is at least 10·n·eps·||A||·kappa(lambda), limited to
+    sqrt(eps)·||A|| (accuracy of double defective eigenvalues).
+
+    :return:    bool array of shape (N,)
+    """
+    import numpy as np
+
+    A, B = _system_matrix_stack(A, B)
+    N, n, m = B.shape
+    eigvals, V = np.linalg.eig(A)
+    norms = np.linalg.norm(np.concatenate([A, B], axis=2), ord=2, axis=(1, 2))
+
+    # condition numbers of the eigenvalues: |y_i|·|x_i| / |y_i^H x_i| with the rows y_i^H of V^-1 (y_i^H x_i = 1)
+    eps = np.finfo(float).eps
+    kappa = np.linalg.norm(np.linalg.pinv(V), axis=2) * np.linalg.norm(V, axis=1)
+    A_norms = np.linalg.norm(A, ord=2, axis=(1, 2))[:, np.newaxis]
+    eigval_errors = np.minimum(10 * n * eps * A_norms * kappa, np.sqrt(eps) * A_norms)
+
+    # shape (N, n_eigvals, n, n + m)
+    shifted = A[:, np.newaxis, :, :] - eigvals[:, :, np.newaxis, np.newaxis] * np.eye(n)
+    B_rep = np.broadcast_to(B[:, np.newaxis, :, :], (N, n, n, m))
+    ranks = numerical_ranks(
+        np.concatenate([shifted, B_rep], axis=3),
+        rtol=rtol,
+        atol=np.maximum(atol, eigval_errors),
+        norms=np.repeat(norms[:, np.newaxis], n, axis=1),
+    )
+
+    relevant = eigvals.real >= 0 if only_unstable else np.ones_like(ranks, dtype=bool)
+    return np.all((ranks == n) | ~relevant, axis=1)
+
+
+def controllability_mask(A, B, method="kalman", rtol=None, atol=0):
+    """
+    :param method:  "kalman" (rank of the controllability matrix) or "pbh"
+    :return:        bool array of shape (N,)
+    """
+    if method == "kalman":
+        A, B = _system_matrix_stack(A, B)
+        return numerical_ranks(kalman_controllability_matrices(A, B), rtol=rtol, atol=atol) == A.shape[1]
+    elif method == "pbh":
+        return pbh_mask(A, B, rtol=rtol, atol=atol)
+    msg = f"unknown method: {method}. Expected 'kalman' or 'pbh'."
+    raise ValueError(msg)
+
+
+def observability_mask(A, C, method="kalman", rtol=None, atol=0):
+    import numpy as np
+
+    return controllability_mask(
+        np.swapaxes(A, -1, -2), np.swapaxes(np.atleast_2d(C), -1, -2), method=method, rtol=rtol, atol=atol
+    )
+
+
+def _link_check_results(target_item, mask, link_items, relations=None):
+    """
+    Attach the results of a numerical test (e.g. of a system property or of the membership in a class) to items.
+
+    :param target_item:     object of the new statements (e.g. the property item)
+    :param mask:            bool sequence (one entry per link item)
+    :param relations:       pair (relation for positive results, relation for negative results or None); if the
+                            second one is None, negative results are not attached;
+                            default: (R8303["has general system property"], R6458["does not have general system
+                            property"])
+    """
+    if link_items is None:
+        return
+    if relations is None:
+        relations = (R8303["has general system property"], R6458["does not have general system property"])
+    relation, negated_relation = relations
+    assert len(link_items) == len(mask)
+    for item, has_property in zip(link_items, mask):
+        current_relation = relation if has_property else negated_relation
+        if current_relation is None:
+            continue
+        if target_item not in item.get_relations(current_relation.uri, return_obj=True):
+            item.set_relation(current_relation, target_item)
+
+
+def I7864_check_numerically(self, A, B, link_items=None, method="kalman", rtol=None, atol=0):
+    """
+    :param self:        property item I7864["controllability"] (to which this function will be attached)
+    :param link_items:  optional sequence of N system model items which get R8303/R6458 statements
+    """
+    mask = controllability_mask(A, B, method=method, rtol=rtol, atol=atol)
+    _link_check_results(self, mask, link_items)
+    return mask
+
+
+def I3227_check_numerically(self, A, C, link_items=None, method="kalman", rtol=None, atol=0):
+    """
+    :param self:        property item I3227["observability"] (to which this function will be attached)
+    :param link_items:  optional sequence of N system model items which get R8303/R6458 statements
+    """
+    mask = observability_mask(A, C, method=method, rtol=rtol, atol=atol)
+    _link_check_results(self, mask, link_items)
+    return mask
+
+
+def I9210_check_numerically(self, A, B, link_items=None, rtol=None, atol=0):
+    """
+    :param self:        property item I9210["stabilizability"] (to which this function will be attached)
+    :param link_items:  optional sequence of N system model items which get R8303/R6458 statements
+    """
+    mask = pbh_mask(A, B, only_unstable=True, rtol=rtol, atol=atol)
+    _link_check_results(self, mask, link_items)
+    return mask
+
+
+def I9853_check_numerically(self, A, C, link_items=None, rtol=None, atol=0):
+    """
+    :param self:        property item I9853["detectability"] (to which this function will be attached)
+    :param link_items:  optional sequence of N system model items which get R8303/R6458 statements
+    """
+    import numpy as np
+
+    mask = pbh_mask(
+        np.swapaxes(A, -1, -2), np.swapaxes(np.atleast_2d(C), -1, -2), only_unstable=True, rtol=rtol, atol=atol
+    )
+    _link_check_results(self, mask, link_items)
+    return mask
+
+
+I7864["controllability"].add_method(I7864_check_numerically, "check_numerically")
+I3227["observability"].add_method(I3227_check_numerically, "check_numerically")
+I9210["stabilizability"].add_method(I9210_check_numerically, "check_numerically")
+I9853["detectability"].add_method(I9853_check_numerically, "check_numerically")
+
 I3321 = p.create_item(
     R1__has_label="minimum phase",
     R2__has_description="states that the model of a dynamical system has stable zero dynamics",
@@ -1194,6 +1891,142 @@ I4201 = p.create_item(
 )
 
 
+# numerical computation of state feedback gains u = -K x such that eig(A - B K) equals the desired poles
+# (vectorized over many plants)
+
+# for single input systems with n <= this value Ackermann's formula is used by default
+ACKERMANN_MAX_DIM = 6
+
+
+def poly_coeffs_from_roots(roots):
+    """
+    :param roots:   array of shape (N, n) (complex roots must occur in conjugate pairs)
+    :return:        array of shape (N, n+1) (monic, descending order, real)
+    """
+    import numpy as np
+
+    roots = np.atleast_2d(np.asarray(roots, dtype=complex))
+    N, n = roots.shape
+    coeffs = np.zeros((N, n + 1), dtype=complex)
+    coeffs[:, 0] = 1
+    for k in range(n):
+        coeffs[:, 1 : k + 2] -= roots[:, k, np.newaxis] * coeffs[:, : k + 1]
+    return coeffs.real
+
+
+def _desired_charpoly_coeffs(poles, N, n):
+    """
+    :param poles:   array of shape (N, n) or (n,)
+    :return:        array of shape (N, n+1) (desired characteristic polynomials)
+    """
+    import numpy as np
+
+    return np.broadcast_to(poly_coeffs_from_roots(poles), (N, n + 1))
+
+
+def ackermann_gains(A, b, poles):
+    """
+    Ackermann's formula k^T = e_n^T Q_c^-1 p_d(A) (Q_c: controllability matrix, p_d: desired characteristic
+    polynomial) for a batch of single input systems. Rows for which Q_c is singular are filled with nan.
+
+    :return:    array of shape (N, 1, n)
+    """
+    import numpy as np
+
+    A, b = _system_matrix_stack(A, b)
+    N, n, m = b.shape
+    assert m == 1, "Ackermann's formula is only applicable to single input systems"
+
+    pA = ma.evaluate_matrix_polynomials(_desired_charpoly_coeffs(poles, N, n), A)
+
+    Qc = kalman_controllability_matrices(A, b)
+    K = np.full((N, 1, n), np.nan)
+    controllable = numerical_ranks(Qc) == n
+    if controllable.any():
+        e_n = np.zeros((controllable.sum(), n, 1))
+        e_n[:, -1, 0] = 1
+        y = np.linalg.solve(np.swapaxes(Qc[controllable], 1, 2), e_n)
+        K[controllable] = np.swapaxes(y, 1, 2) @ pA[controllable]
+    return K
+
+
+def robust_pole_placement_gains(A, B, poles):
+    """
+    Use scipy.signal.place_poles (Tits-Yang method) for every system; falls back to Ackermann's formula for single
+    input systems with repeated poles (not supported by place_poles). Failures are filled with nan.
+
+    :return:    array of shape (N, m, n)
+    """
+    import numpy as np
+    import scipy.signal
+
+    A, B = _system_matrix_stack(A, B)
+    N, n, m = B.shape
+    poles = np.broadcast_to(np.atleast_2d(poles), (N, n))
+    K = np.full((N, m, n), np.nan)
+    for i in range(N):
+        try:
+            K[i] = scipy.signal.place_poles(A[i], B[i], poles[i], method="YT").gain_matrix
+        except ValueError:
+            if m == 1:
+                K[i] = ackermann_gains(A[i], B[i], poles[i : i + 1])[0]
+    return K
+
+
+def pole_placement_gains(A, B, poles, method="auto"):
+    """
+    :param A:       array of shape (N, n, n) or (n, n)
+    :param B:       array of shape (N, n, m), (n, m) or (n,)
+    :param poles:   array of shape (N, n) or (n,) (desired closed loop poles)
+    :param method:  "ackermann", "robust" or "auto" (Ackermann only for single input systems with small n)
+    :return:        array of shape (N, m, n) with gains K (u = -K x)
+    """
+    A, B = _system_matrix_stack(A, B)
+    N, n, m = B.shape
+    if method == "auto":
+        method = "ackermann" if m == 1 and n <= ACKERMANN_MAX_DIM else "robust"
+    if method == "ackermann":
+        return ackermann_gains(A, B, poles)
+    elif method == "robust":
+        return robust_pole_placement_gains(A, B, poles)
+    msg = f"unknown method: {method}. Expected one of 'ackermann', 'robust' or 'auto'."
+    raise ValueError(msg)
+
+
+def closed_loop_charpoly_errors(A, B, K, poles):
+    """
+    Compare the characteristic polynomials of A - B K (see ma.charpoly_coeffs) with the desired ones (like in
+    `ackermann_gains`).
+
+    :return:    array of shape (N,) (maximum absolute coefficient error relative to the largest desired coefficient)
+    """
+    import numpy as np
+
+    A, B = _system_matrix_stack(A, B)
+    desired = _desired_charpoly_coeffs(poles, A.shape[0], A.shape[1])
+    # (the closed loop matrices are one-off -> they are not cached)
+    actual = ma.charpoly_coeffs(A - B @ K, use_cache=False)
+    return np.abs(actual - desired).max(axis=1) / np.abs(desired).max(axis=1)
+
+
+def I7916_compute_gains(self, A, B, poles, method="auto"):
+    """
+    :param self:    method item (to which this function will be attached)
+    """
+    return pole_placement_gains(A, B, poles, method=method)
+
+
+def I4201_compute_gains(self, A, b, poles):
+    """
+    :param self:    formula item (to which this function will be attached)
+    """
+    return ackermann_gains(A, b, poles)
+
+
+I7916["pole placement"].add_method(I7916_compute_gains, "compute_gains")
+I4201["Ackermanns Formula"].add_method(I4201_compute_gains, "compute_gains")
+
+
 I6950 = p.create_item(
     R1__has_label="controller",
     R2__has_description="sub system of a dynamical system which is designed to impose desired behavior to the overall system",
@@ -1448,6 +2281,211 @@ I9208 = p.create_item(
     R77__has_alternative_label="non-strict Lyapunov Function"
 )
 
+
+# sampling-based numerical verification of Lyapunov function candidates (premises of I4663, I8733, I2983)
+
+
+class LyapunovCandidateReport:
+    """
+    Result of `verify_lyapunov_candidate`. Counterexamples are arrays of shape (k, n), sorted such that the worst
+    violation comes first.
+    """
+
+    def __init__(self, n_samples, counterexamples):
+        self.n_samples = n_samples
+        self.counterexamples = counterexamples
+        self.V_positive_definite = len(counterexamples["V"]) == 0
+        self.LfV_negative_definite = len(counterexamples["LfV_definite"]) == 0
+        self.LfV_negative_semidefinite = len(counterexamples["LfV_semidefinite"]) == 0
+
+    @property
+    def lyapunov_class(self):
+        """
+        :return:    I9199["strong Lyapunov Function"], I9208["weak Lyapunov Function"] or None
+        """
+        if not self.V_positive_definite:
+            return None
+        if self.LfV_negative_definite:
+            return I9199["strong Lyapunov Function"]
+        if self.LfV_negative_semidefinite:
+            return I9208["weak Lyapunov Function"]
+        return None
+
+    def __repr__(self):
+        return (
+            f"<LyapunovCandidateReport ({self.n_samples} samples): V pd: {self.V_positive_definite}, "
+            f"LfV nd: {self.LfV_negative_definite}, LfV nsd: {self.LfV_negative_semidefinite}>"
+        )
+
+
+def _sample_box(lower, upper, n_samples, method, seed):
+    import numpy as np
+    import scipy.stats.qmc
+
+    d = len(lower)
+    if method == "grid":
+        k = max(2, int(round(n_samples ** (1 / d))))
+        axes = [np.linspace(lo, up, k) for lo, up in zip(lower, upper)]
+        return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, d)
+    elif method == "halton":
+        unit_points = scipy.stats.qmc.Halton(d, seed=seed).random(n_samples)
+        return lower + unit_points * (upper - lower)
+    msg = f"unknown sampling method: {method}. Expected 'halton' or 'grid'."
+    raise ValueError(msg)
+
+
+def _axis_degrees(expr, x, default=2):
+    """
+    :return:    list with the degree e_i of the leading term of the restriction of expr to the i-th coordinate axis
+                (expr(t·e_i) ~ t^e_i for t -> 0), None if expr vanishes on this axis (`default` if the degree can not
+                be determined)
+    """
+    import sympy as sp
+
+    expr = sp.sympify(expr)
+    res = []
+    for xi in x:
+        restricted = sp.expand(expr.subs({xj: 0 for xj in x if xj != xi}))
+        if restricted == 0:
+            res.append(None)
+            continue
+        try:
+            degree = restricted.as_leading_term(xi).as_coeff_exponent(xi)[1]
+        except (NotImplementedError, ValueError, TypeError):
+            degree = None
+        if degree is None or not (degree.is_number and degree.is_real and degree > 0):
+            res.append(float(default))
+        else:
+            res.append(float(degree))
+    return res
+
+
+def _normalization_exponents(exprs, x, default=2):
+    """
+    :return:    float array of shape (len(exprs), len(x)) with the exponents of the weights
+                rho(x) = sum_i |x_i|^e_i (see `verify_lyapunov_candidate`)
+    """
+    import numpy as np
+
+    res = []
+    for expr in exprs:
+        degrees = _axis_degrees(expr, x, default)
+        # (an expression which vanishes on an axis is not definite, see the axis samples)
+        fallback = max([d for d in degrees if d is not None], default=default)
+        res.append([fallback if d is None else d for d in degrees])
+    return np.array(res, dtype=float)
+
+
+def verify_lyapunov_candidate(
+    V,
+    f,
+    x,
+    bounds,
+    n_samples=4096,
+    method="halton",
+    refinement_steps=4,
+    n_refine=32,
+    tol=1e-3,
+    exclusion_radius=1e-6,
+    params=(),
+    param_values=(),
+    seed=0,
+):
+    """
+    Check the premises of the Lyapunov theorems (V positive definite, L_f V negative (semi)definite) for the
+    equilibrium x = 0 on the box given by `bounds` by evaluating V and L_f V on sample points. After the initial
+    sampling (low-discrepancy Halton sequence or regular grid, plus points on the coordinate axes) the points with the
+    smallest normalized margins (V/rho_V and -L_f V/rho_LfV; violations have negative margins) are refined by sampling
+    in shrinking boxes around them. This is no proof but it reliably rejects bad candidates.
+
+    The weights rho(x) = sum_i |x_i|^e_i use the lowest degree e_i of the respective expression on the i-th
+    coordinate axis, such that expressions with different degrees in different coordinates are compared to a matching
+    lower bound, e.g. rho(x) = x1^2 + x2^4 for L_f V = -2 x1^2 - 2 x2^4.
+
+    :param V:           sympy expression (candidate)
+    :param f:           sequence of sympy expressions (vector field)
+    :param x:           sequence of sympy symbols (state coordinates)
+    :param bounds:      sequence of (lower, upper) pairs (one for each coordinate)
+    :param tol:         relative tolerance: values with |value| <= tol·rho(x) are considered as zero (this allows to
+                        distinguish negative definite from negative semidefinite L_f V based on samples)
+    :param exclusion_radius:
+                        points with |x| < exclusion_radius are ignored (V and L_f V vanish at the equilibrium)
+    :return:            LyapunovCandidateReport
+    """
+    import numpy as np
+
+    lower, upper = np.asarray(bounds, dtype=float).T
+    func = lie_derivative_function(V, f, x, 1, params)
+    exponents = _normalization_exponents(iterated_lie_derivatives(V, f, x, 1), x)
+    rng = np.random.default_rng(seed)
+
+    def normalize(points, values):
+        rho = np.sum(np.abs(points)[:, np.newaxis, :] ** exponents[np.newaxis, :, :], axis=2)
+        return values / rho
+
+    def evaluate(points):
+        points = np.clip(points, lower, upper)
+        points = points[np.linalg.norm(points, axis=1) >= exclusion_radius]
+        values = func(points, *param_values)
+        return points, values, normalize(points, values)
+
+    # points on the coordinate axes (expressions which vanish on an axis are at most semidefinite)
+    axis_points = np.zeros((len(lower), 16, len(lower)))
+    for i, (lo, up) in enumerate(zip(lower, upper)):
+        axis_points[i, :, i] = np.linspace(lo, up, 16)
+    samples = np.concatenate([_sample_box(lower, upper, n_samples, method, seed), axis_points.reshape(-1, len(lower))])
+    points, values, normalized = evaluate(samples)
+    all_points, all_values = [points], [values]
+
+    # initial size of the refinement boxes: approximately the distance between neighboring samples
+    radius = (upper - lower) / max(2, len(points) ** (1 / len(lower)))
+    for _ in range(refinement_steps):
+        # candidates for refinement: the worst points w.r.t. both conditions
+        margins = np.concatenate([normalized[:, 0], -normalized[:, 1]])
+        worst = np.unique(np.argsort(margins)[:n_refine] % len(points))
+        centers = points[worst]
+        offsets = rng.uniform(-1, 1, size=(len(centers), 8, len(lower))) * radius
+        points, values, normalized = evaluate((centers[:, np.newaxis, :] + offsets).reshape(-1, len(lower)))
+        all_points.append(points)
+        all_values.append(values)
+        radius = radius / 2
+
+    points = np.concatenate(all_points)
+    values = np.concatenate(all_values)
+
+    def counterexamples(mask, key):
+        idcs = np.flatnonzero(mask)
+        return points[idcs[np.argsort(key[idcs])]]
+
+    normalized = normalize(points, values)
+    V_margin, LfV_margin = normalized[:, 0], -normalized[:, 1]
+    return LyapunovCandidateReport(
+        n_samples=len(points),
+        counterexamples={
+            "V": counterexamples(V_margin <= tol, V_margin),
+            "LfV_definite": counterexamples(LfV_margin <= tol, LfV_margin),
+            "LfV_semidefinite": counterexamples(LfV_margin < -tol, LfV_margin),
+        },
+    )
+
+
+def I2933_verify_candidate(self, V, f, x, bounds, link_item=None, **kwargs):
+    """
+    :param self:        class item I2933["Lyapunov Function"] (to which this function will be attached)
+    :param link_item:   optional item representing V; if the candidate passes the checks it is marked as secondary
+                        instance of I9199["strong Lyapunov Function"] or I9208["weak Lyapunov Function"]
+    :param kwargs:      passed to `verify_lyapunov_candidate`
+    :return:            LyapunovCandidateReport
+    """
+    report = verify_lyapunov_candidate(V, f, x, bounds, **kwargs)
+    lyapunov_class = report.lyapunov_class
+    if link_item is not None and lyapunov_class is not None:
+        _link_check_results(lyapunov_class, [True], [link_item], relations=(p.R30["is secondary instance of"], None))
+    return report
+
+
+I2933["Lyapunov Function"].add_method(I2933_verify_candidate, "verify_candidate")
+
 # <theorem>
 I4663 = p.create_item(
     R1__has_label="theorem for local Lyapunov stability of state space system", # TODO this is one formulation among many
@@ -1621,6 +2659,200 @@ I6338 = p.create_item(
     ag__R6876__is_named_after=ag.I2151["Aleksandr Lyapunov"],
 )
 
+
+# numerical solution of the Lyapunov equation -Q = A^T P + P A (see I3712, I2613)
+
+# for n <= this value stacks of equations with different matrices A are solved via the Kronecker formulation
+LYAPUNOV_KRONECKER_MAX_DIM = 6
+
+# the equation is considered singular if min |lambda_i + lambda_j| <= rtol * ||A|| (the eigenvalues of A are only known
+# with an accuracy of about sqrt(eps) * ||A|| (defective eigenvalues); the solution would be meaningless anyway)
+LYAPUNOV_SINGULARITY_RTOL = 1.5e-8
+
+
+def _lyapunov_singularity_mask(eigvals, A_norms, rtol=None):
+    """
+    :param eigvals:     array of shape (N, n) (eigenvalues of N matrices A)
+    :param A_norms:     array of shape (N,) (spectral norms of the matrices A)
+    :return:            bool array of shape (N,); True where some lambda_i + lambda_j is (numerically) zero, i.e. where
+                        the Lyapunov equation has no unique solution
+    """
+    import numpy as np
+
+    if rtol is None:
+        rtol = LYAPUNOV_SINGULARITY_RTOL
+    # (the eigenvalues of the operator P -> A^T P + P A are lambda_i + lambda_j)
+    sums = np.abs(eigvals[:, :, np.newaxis] + eigvals[:, np.newaxis, :]).min(axis=(1, 2), initial=np.inf)
+    return sums <= rtol * A_norms
+
+
+class LyapunovSolver:
+    """
+    Solves the equation -Q = A^T P + P A for a fixed real matrix A and (a stack of) matrices Q by means of the
+    Bartels-Stewart algorithm. The complex Schur decomposition A = U T U^H is computed only once. Then
+    T^H Y + Y T = -U^H Q U is solved column by column (triangular systems with all Q as right hand sides) and
+    P = U Y U^H.
+
+    If some lambda_i + lambda_j of the eigenvalues of A is zero (relative to ||A||, see LYAPUNOV_SINGULARITY_RTOL) the
+    equation has no unique solution and all results are nan.
+    """
+
+    def __init__(self, A, rtol=None):
+        import numpy as np
+        import scipy.linalg
+
+        self.A = np.asarray(A, dtype=float)
+        self.n = self.A.shape[0]
+        assert self.A.shape == (self.n, self.n)
+        self.T, self.U = scipy.linalg.schur(self.A, output="complex")
+        A_norm = np.linalg.norm(self.A, ord=2) if self.n else 0.0
+        self.is_singular = bool(_lyapunov_singularity_mask(np.diag(self.T)[np.newaxis], np.array([A_norm]), rtol)[0])
+
+    def solve(self, Q):
+        """
+        :param Q:   array of shape (N, n, n) or (n, n)
+        :return:    array P of the same shape as Q (filled with nan if the equation has no unique solution)
+        """
+        import numpy as np
+        import scipy.linalg
+
+        Q = np.asarray(Q, dtype=float)
+        single = Q.ndim == 2
+        if single:
+            Q = Q[np.newaxis, :, :]
+        N, n = Q.shape[0], self.n
+        if self.is_singular:
+            P = np.full((N, n, n), np.nan)
+            return P[0] if single else P
+
+        T, U = self.T, self.U
+        UH = U.conj().T
+        C = -UH @ Q @ U
+        Y = np.zeros((N, n, n), dtype=complex)
+        try:
+            for j in range(n):
+                rhs = C[:, :, j] - Y[:, :, :j] @ T[:j, j]
+                Y[:, :, j] = scipy.linalg.solve_triangular(
+                    T.conj().T + T[j, j] * np.eye(n), rhs.T, lower=True, check_finite=False
+                ).T
+        except np.linalg.LinAlgError:
+            # eigenvalues with lambda_i + lambda_j = 0 -> no unique solution
+            P = np.full((N, n, n), np.nan)
+        else:
+            P = (U @ Y @ UH).real
+
+        return P[0] if single else P
+
+
+LYAPUNOV_SOLVER_CACHE = ma.LRUCache(maxsize=128)
+
+
+def get_lyapunov_solver(A) -> LyapunovSolver:
+    """
+    Return a (cached) LyapunovSolver instance for the matrix A (the Schur decomposition is reused).
+    """
+    import numpy as np
+
+    A = np.ascontiguousarray(A, dtype=float)
+    key = (A.shape, A.tobytes())
+    if (solver := LYAPUNOV_SOLVER_CACHE.get(key)) is None:
+        solver = LYAPUNOV_SOLVER_CACHE[key] = LyapunovSolver(A)
+    return solver
+
+
+def _solve_lyapunov_kronecker(A, Q):
+    """
+    Solve a stack of (small) Lyapunov equations via (A^T ⊗ I + I ⊗ A^T) vec(P) = -vec(Q).
+    """
+    import numpy as np
+
+    N, n, _ = A.shape
+    singular = _lyapunov_singularity_mask(np.linalg.eigvals(A), np.linalg.norm(A, ord=2, axis=(1, 2)))
+    if singular.any():
+        P = np.full((N, n, n), np.nan)
+        if not singular.all():
+            P[~singular] = _solve_lyapunov_kronecker(A[~singular], Q[~singular])
+        return P
+    AT = np.swapaxes(A, 1, 2)
+    eye = np.eye(n)
+    K = AT[:, :, np.newaxis, :, np.newaxis] * eye[np.newaxis, np.newaxis, :, np.newaxis, :]
+    K = (K + eye[np.newaxis, :, np.newaxis, :, np.newaxis] * AT[:, np.newaxis, :, np.newaxis, :])
+    K = K.reshape(N, n * n, n * n)
+    rhs = -Q.reshape(N, n * n, 1)
+    try:
+        return np.linalg.solve(K, rhs).reshape(N, n, n)
+    except np.linalg.LinAlgError:
+        # at least one singular system -> solve them one by one
+        P = np.full((N, n, n), np.nan)
+        for i in range(N):
+            try:
+                P[i] = np.linalg.solve(K[i], rhs[i]).reshape(n, n)
+            except np.linalg.LinAlgError:
+                pass
+        return P
+
+
+def solve_lyapunov_equations(A, Q):
+    """
+    Numerically solve the I6338["Lyapunov equation"] -Q = A^T P + P A for stacks of matrices.
+
+    :param A:   array of shape (n, n) (same A for all Q) or (N, n, n)
+    :param Q:   array of shape (n, n) (same Q for all A) or (N, n, n)
+    :return:    array P of shape (N, n, n) (or (n, n) if both A and Q are 2d)
+
+    If A is fixed the (cached) Schur decomposition is reused (Bartels-Stewart). Within a stack, the equations of
+    repeated matrices A are solved together with one Schur decomposition per distinct A. The remaining small systems
+    are solved together via the Kronecker formulation and larger systems one by one.
+    """
+    import numpy as np
+
+    A = np.asarray(A, dtype=float)
+    Q = np.asarray(Q, dtype=float)
+    if A.ndim == 2:
+        return get_lyapunov_solver(A).solve(Q)
+
+    N, n, _ = A.shape
+    Q = np.broadcast_to(Q, (N, n, n))
+    P = np.empty((N, n, n))
+
+    unique_A, inverse, counts = np.unique(A.reshape(N, -1), axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+    repeated = counts[inverse] > 1
+    for k in np.flatnonzero(counts > 1):
+        idcs = np.flatnonzero(inverse == k)
+        P[idcs] = LyapunovSolver(unique_A[k].reshape(n, n)).solve(Q[idcs])
+
+    if (single := np.flatnonzero(~repeated)).size:
+        if n <= LYAPUNOV_KRONECKER_MAX_DIM:
+            P[single] = _solve_lyapunov_kronecker(A[single], np.ascontiguousarray(Q[single]))
+        else:
+            P[single] = [LyapunovSolver(A[i]).solve(Q[i]) for i in single]
+    return P
+
+
+def I6338_solve_numerically(self, A, Q):
+    """
+    :param self:    class item I6338["Lyapunov equation"] (to which this function will be attached)
+    :param A:       array of shape (n, n) or (N, n, n)
+    :param Q:       array of shape (n, n) or (N, n, n)
+
+    :return:        pair (P, is_pos_def); is_pos_def is a bool array of shape (N,) which states for every
+                    solution whether it is positive definite (see ma.positive_definiteness_mask). According to
+                    I3712 (with Q positive definite) this is equivalent to A being a Hurwitz matrix.
+    """
+    import numpy as np
+
+    P = solve_lyapunov_equations(A, Q)
+
+    # symmetrize to compensate numerical errors (for symmetric Q the solution is symmetric)
+    P_stack = P if P.ndim == 3 else P[np.newaxis, :, :]
+    is_pos_def = ma.positive_definiteness_mask((P_stack + np.swapaxes(P_stack, 1, 2)) / 2)
+    return P, is_pos_def
+
+
+I6338["Lyapunov equation"].add_method(I6338_solve_numerically, "solve_numerically")
+
+
 # <theorem>
 I3712 = p.create_item(
     R1__has_label="theorem on Lyapunov equation and Stability",
@@ -1635,12 +2867,12 @@ I3712 = p.create_item(
 with I3712.scope("setting") as cm:
     n = cm.new_var(n=p.uq_instance_of(p.I39["positive integer"]))
     A = cm.new_var(A=p.instance_of(ma.I9906["square matrix"]))
-    Q = cm.new_var(Q=p.instance_of(ma.I9906["square matrix"]))
+    Q = cm.new_var(Q=p.uq_instance_of(ma.I9906["square matrix"]))
 
     cm.new_rel(A, ma.R5938["has row number"], n)
     cm.new_rel(Q, ma.R5938["has row number"], n)
 
-    cm.new_rel(Q, p.R16["has property"], ma.I3135["positive semidefiniteness"]) # todo matrix
+    cm.new_rel(Q, p.R16["has property"], ma.I3648["positive definiteness (matrix)"])
 
     eig = cm.new_var(eig=p.instance_of(ma.I5484["finite set of complex numbers"]))
     cm.new_equation(eig, ma.I9160["set of eigenvalues of a matrix"](A))
@@ -1651,6 +2883,7 @@ with I3712.scope("premise") as cm:
 with I3712.scope("assertion") as cm:
     P = cm.new_var(P=p.instance_of(ma.I9906["square matrix"], qualifiers=[p.exis_quant(True)]))
     cm.new_rel(P, ma.R5938["has row number"], n)
+    cm.new_rel(P, ma.R5939["has column number"], n)
     cm.new_rel(P, p.R16["has property"], ma.I3648["positive definiteness (matrix)"])
 
     E = cm.new_equation(ma.I1536["matneg"](cm.Q), ma.I9493["matadd"](ma.I5177["matmul"](cm.P, cm.A), ma.I5177["matmul"]
@@ -1676,6 +2909,155 @@ I4432 = p.create_item(
 )
 
 
+# implementation of the recursive algorithm for polynomial vector fields f = F_1 + F_2 + ... (F_i homogeneous of
+# degree i, F_1(x) = A x): V = V_2 + V_3 + ... with homogeneous V_m which solve the linear equations
+#
+#   grad(V_m) · A x = -R_m(x),  R_2 = x^T Q x,  R_m = sum_{j=2}^{m-1} grad(V_j) · F_{m+1-j}  (m >= 3)
+#
+# The operator V_m -> grad(V_m) · A x is represented as sparse matrix w.r.t. the monomial basis of degree m. It is
+# invertible if A is Hurwitz (its eigenvalues are sums of m eigenvalues of A). The LU factorizations are cached by
+# (A, m) such that they are reused e.g. for different nonlinear parts or when the degree is increased later.
+
+# maps (matrix_hash(A), degree) to a scipy.sparse.linalg.SuperLU object
+VANNELLI_FACTORIZATION_CACHE = ma.LRUCache(maxsize=128)
+
+
+def _get_vannelli_factorization(A, degree):
+    import numpy as np
+    import scipy.sparse.linalg
+
+    key = (ma.matrix_hash(A), degree)
+    lu = VANNELLI_FACTORIZATION_CACHE.get(key)
+    if lu is None:
+        n = A.shape[0]
+        # the linear vector field x -> A x
+        F1 = [ma.SparsePolynomial(np.eye(n, dtype=int), A[i], n=n) for i in range(n)]
+        basis = ma.monomial_exponents(n, degree)
+        L = ma.lie_derivative_matrix(F1, basis, basis)
+        lu = VANNELLI_FACTORIZATION_CACHE[key] = scipy.sparse.linalg.splu(L)
+    return lu
+
+
+def vannelli_lyapunov_function(f, x, max_degree=4, Q=None):
+    """
+    :param f:           sequence of polynomial sympy expressions (vector field with f(0) = 0)
+    :param x:           sequence of sympy symbols (state coordinates)
+    :param max_degree:  highest degree of the homogeneous parts V_m
+    :param Q:           positive definite matrix (default: identity)
+    :return:            sympy expression V (or None if the linearization is not asymptotically stable)
+    """
+    import numpy as np
+
+    n = len(x)
+    f_polys = [ma.SparsePolynomial.from_sympy(fi, x) for fi in f]
+    # homogeneous parts: {degree: [F_1i, ..., F_ni]}
+    parts = {}
+    for i, fi in enumerate(f_polys):
+        for degree, part in fi.homogeneous_parts().items():
+            parts.setdefault(degree, [ma.SparsePolynomial.zero(n) for _ in range(n)])[i] = part
+    if 0 in parts:
+        msg = "the origin is not an equilibrium of the vector field"
+        raise ValueError(msg)
+
+    A = np.zeros((n, n))
+    for i, Fi in enumerate(parts.get(1, [])):
+        A[i, np.argmax(Fi.exponents, axis=1)] = Fi.coeffs.real
+    if not ma.olhp_mask(A[np.newaxis])[0]:
+        return None
+
+    Q = np.eye(n) if Q is None else np.asarray(Q, dtype=float)
+    eye = np.eye(n, dtype=int)
+    R = ma.SparsePolynomial((eye[:, None, :] + eye[None, :, :]).reshape(-1, n), Q.ravel(), n=n)
+
+    V_parts = {}
+    for m in range(2, max_degree + 1):
+        if m > 2:
+            R = ma.SparsePolynomial.zero(n)
+            for j in range(2, m):
+                F = parts.get(m + 1 - j)
+                if F is not None:
+                    R = R + V_parts[j].gradient_dot(F)
+        basis = ma.monomial_exponents(n, m)
+        coeffs = _get_vannelli_factorization(A, m).solve(-R.coefficient_vector(basis).real)
+        V_parts[m] = ma.SparsePolynomial(basis, coeffs, n=n)
+
+    return sum(V_parts.values(), ma.SparsePolynomial.zero(n)).to_sympy(x)
+
+
+def _solution_value_key(value):
+    # (lists, e.g. of Darboux pairs, are not hashable)
+    if isinstance(value, (list, tuple)):
+        return tuple(_solution_value_key(elt) for elt in value)
+    return value
+
+
+class AlgorithmSolutionIndex(si.IncrementalStatementIndex):
+    """
+    Index for the recorded solutions of algorithms (ma.R3263["has solution"]) by their symbolic value (see
+    ma.set_symbolic_value). The value is read when the statement is processed, i.e. it has to be set before the
+    solution is linked to the algorithm (like in `_record_algorithm_solution`).
+    """
+
+    def clear(self):
+        super().clear()
+        # {(algorithm uri, value key): solution uri}
+        self.solutions = {}
+
+    def _process_new_statements(self):
+        for stm in self._get_new_statements(ma.R3263["has solution"]):
+            value = ma.get_symbolic_value(stm.object)
+            if value is not None:
+                self.solutions.setdefault((stm.subject.uri, _solution_value_key(value)), stm.object.uri)
+
+    def get_solution(self, algorithm: p.Item, value):
+        """
+        :return:    solution item of `algorithm` with the symbolic value `value` or None
+        """
+        uri = self.solutions.get((algorithm.uri, _solution_value_key(value)))
+        return None if uri is None else p.ds.get_entity_by_uri(uri)
+
+
+ALGORITHM_SOLUTION_INDEX = AlgorithmSolutionIndex()
+
+
+def _record_algorithm_solution(algorithm: p.Item, value, secondary_class: p.Item = None) -> p.Item:
+    """
+    Record `value` as solution of `algorithm` via ma.R3263["has solution"] by a new instance of
+    ma.I2378["solution to a mathematical algorithm"] (see ma.set_symbolic_value). An already recorded solution with
+    the same value is reused (see AlgorithmSolutionIndex).
+
+    :param secondary_class: optional class of which the solution is marked as secondary instance (R30)
+    :return:                solution item
+    """
+    solution = ALGORITHM_SOLUTION_INDEX.update().get_solution(algorithm, value)
+    if solution is not None and ma.get_symbolic_value(solution) == value:
+        return solution
+
+    solution = p.instance_of(ma.I2378["solution to a mathematical algorithm"])
+    ma.set_symbolic_value(solution, value)
+    if secondary_class is not None:
+        solution.set_relation(p.R30["is secondary instance of"], secondary_class)
+    algorithm.set_relation(ma.R3263["has solution"], solution)
+    return solution
+
+
+def I4432_compute(self, f, x, max_degree=4, Q=None, record=False):
+    """
+    :param self:        algorithm item (to which this function will be attached)
+    :param record:      if True (and a solution exists) record V as solution (instance of
+                        ma.I2378["solution to a mathematical algorithm"] and secondary instance of
+                        I2933["Lyapunov Function"], see `_record_algorithm_solution`; requires an active module context)
+    :return:            sympy expression V or None
+    """
+    V = vannelli_lyapunov_function(f, x, max_degree=max_degree, Q=Q)
+    if V is not None and record:
+        _record_algorithm_solution(self, V, secondary_class=I2933["Lyapunov Function"])
+    return V
+
+
+I4432["Vannelli recursive algorithm to find Lyapunov function"].add_method(I4432_compute, "compute")
+
+
 # <theorem>
 I8142 = p.create_item(
     R1__has_label="theorem by Vannelli for Lyapunov functions for homogeneous systems",
@@ -1776,6 +3158,165 @@ I7006 = p.create_item(
     # Portland, OR, USA: IEEE, Jun. 2014, pp. 3571–3578. doi: 10.1109/ACC.2014.6859330.
 )
 
+
+# implementation of the Darboux polynomial search (first phase of the Goubault algorithm)
+#
+# p is a Darboux polynomial of f with cofactor lambda if L_f p = lambda p. For a fixed candidate cofactor this is a
+# linear equation (L - M_lambda) c = 0 for the coefficient vector c of p w.r.t. the monomial basis of degree <= d
+# (without the constant monomial). The matrices for all candidate cofactors of one degree are stacked and handled
+# by a backend at once (null space via SVD or an LP feasibility problem solved by scipy's HiGHS interface).
+
+
+def _darboux_matrices(f_polys, cofactor_polys, degree, f_degree):
+    """
+    :return:    array of shape (len(cofactor_polys), n_target, n_basis)
+    """
+    import numpy as np
+
+    n = len(f_polys)
+    basis = ma.monomial_basis(n, degree)[1:]
+    target_basis = ma.monomial_basis(n, degree + f_degree - 1)
+    L = ma.lie_derivative_matrix(f_polys, basis, target_basis).toarray()
+    return np.array(
+        [L - ma.multiplication_matrix(cofactor, basis, target_basis).toarray() for cofactor in cofactor_polys],
+        dtype=complex,
+    ).reshape(len(cofactor_polys), len(target_basis), len(basis))
+
+
+def _svd_null_space_backend(matrices, tol=1e-9):
+    """
+    :param matrices:    array of shape (K, r, c)
+    :return:            list of K arrays of shape (k_i, c) (basis vectors of the null spaces)
+    """
+    import numpy as np
+
+    _, sv, Vh = np.linalg.svd(matrices, full_matrices=True)
+    res = []
+    for s, vh in zip(sv, Vh):
+        rank = int(np.sum(s > tol * max(1, s.max(initial=0))))
+        res.append(vh[rank:].conj())
+    return res
+
+
+def _linprog_backend(matrices, tol=1e-9):
+    """
+    Find one nonzero real solution of M c = 0 for each matrix by solving the LP
+    max w^T c s.t. M c = 0, -1 <= c <= 1 (with a fixed positive weight vector w).
+    """
+    import numpy as np
+    import scipy.optimize
+
+    res = []
+    for M in matrices:
+        if np.abs(M.imag).max(initial=0) > tol:
+            # complex cofactors are not supported by this backend
+            res.append(np.zeros((0, M.shape[1])))
+            continue
+        M = M.real
+        w = np.linspace(1, 2, M.shape[1])
+        sol = scipy.optimize.linprog(-w, A_eq=M, b_eq=np.zeros(M.shape[0]), bounds=(-1, 1), method="highs")
+        if sol.status == 0 and -sol.fun > tol:
+            res.append(sol.x[np.newaxis, :])
+        else:
+            res.append(np.zeros((0, M.shape[1])))
+    return res
+
+
+DARBOUX_BACKENDS = {"svd": _svd_null_space_backend, "linprog": _linprog_backend}
+
+
+def _real_if_possible(poly, tol=0):
+    import numpy as np
+
+    if np.abs(poly.coeffs.imag).max(initial=0) <= tol:
+        return ma.SparsePolynomial(poly.exponents, poly.coeffs.real, n=poly.n)
+    return poly
+
+
+def _default_cofactors(f_polys, degree):
+    """
+    Constant candidate cofactors: the cofactor of a Darboux polynomial whose lowest order part has degree k starts
+    with a sum of k eigenvalues of the linearization.
+    """
+    import numpy as np
+
+    n = len(f_polys)
+    A = np.zeros((n, n), dtype=complex)
+    for i, fi in enumerate(f_polys):
+        linear_part = fi.homogeneous_part(1)
+        A[i, np.argmax(linear_part.exponents, axis=1)] = linear_part.coeffs
+    eigvals = np.linalg.eigvals(A)
+    candidates = {0}
+    for k in range(1, degree + 1):
+        for combination in itertools.combinations_with_replacement(eigvals, k):
+            candidates.add(complex(np.round(sum(combination), 10)))
+    return [
+        ma.SparsePolynomial([[0] * n], [c], n=n) for c in sorted(candidates, key=lambda c: (c.real, c.imag))
+    ]
+
+
+def darboux_polynomials(f, x, degrees=(1, 2), cofactors=None, backend="svd", max_workers=None, tol=1e-9):
+    """
+    Search for Darboux polynomials of the polynomial vector field f.
+
+    :param f:           sequence of polynomial sympy expressions
+    :param x:           sequence of sympy symbols (state coordinates)
+    :param degrees:     candidate degrees of p (handled in parallel threads)
+    :param cofactors:   sequence of candidate cofactors (sympy expressions of degree < deg(f));
+                        default: constant cofactors derived from the eigenvalues of the linearization at the origin
+    :param backend:     "svd", "linprog" or a callable with the signature of `_svd_null_space_backend`
+    :return:            list of pairs (p, lambda) of sympy expressions
+    """
+    import concurrent.futures
+    import numpy as np
+
+    n = len(x)
+    f_polys = [ma.SparsePolynomial.from_sympy(fi, x) for fi in f]
+    f_degree = max(1, *[fi.degree for fi in f_polys])
+    backend_func = DARBOUX_BACKENDS[backend] if isinstance(backend, str) else backend
+
+    def search(degree):
+        if cofactors is None:
+            cofactor_polys = _default_cofactors(f_polys, degree)
+        else:
+            cofactor_polys = [ma.SparsePolynomial.from_sympy(c, x) for c in cofactors]
+        matrices = _darboux_matrices(f_polys, cofactor_polys, degree, f_degree)
+        basis = ma.monomial_basis(n, degree)[1:]
+        results = []
+        for cofactor, vectors in zip(cofactor_polys, backend_func(matrices, tol=tol)):
+            for vector in vectors:
+                # normalize such that the largest coefficient is 1 and drop numerical noise
+                vector = vector / vector[np.argmax(np.abs(vector))]
+                vector[np.abs(vector) < tol**0.5] = 0
+                poly = _real_if_possible(ma.SparsePolynomial(basis, vector, n=n), tol=tol**0.5)
+                if poly.degree < degree:
+                    # already found for a lower degree
+                    continue
+                results.append((poly.to_sympy(x), _real_if_possible(cofactor).to_sympy(x)))
+        return results
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results_per_degree = list(executor.map(search, degrees))
+
+    return [pair for results in results_per_degree for pair in results]
+
+
+def I7006_compute(self, f, x, record=False, **kwargs):
+    """
+    :param self:        algorithm item (to which this function will be attached)
+    :param record:      if True (and Darboux polynomials were found) record the list of pairs as solution (see
+                        `_record_algorithm_solution`; requires an active module context)
+    :param kwargs:      passed to `darboux_polynomials`
+    :return:            list of pairs (p, lambda) of sympy expressions
+    """
+    pairs = darboux_polynomials(f, x, **kwargs)
+    if pairs and record:
+        _record_algorithm_solution(self, pairs)
+    return pairs
+
+
+I7006["Goubault algorithm to find Lyapunov function"].add_method(I7006_compute, "compute")
+
 with I4274["theorem by Goubault for Lyapunov functions for polynomial systems"].scope("setting") as cm:
     sys = cm.new_var(sys=p.instance_of(I7641["general system model"]))
     cm.sys.set_relation(R8303["has general system property"], I7733["time invariance"])
@@ -2098,6 +3639,7 @@ def apply_theorems_to_systems():
     res = p.RuleResult()
     for s, t in res_list:
         res.new_statements.append(t.set_relation(p.R80["applies to"], s))
+    return res
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -2145,7 +3687,1229 @@ def create_constraint_violation_item(anchor_item, main_arg, rule, prop1, prop2):
 with I5073.scope("assertion") as cm:
     cm.new_consequent_func(create_constraint_violation_item, cm.x, cm.rule, cm.prop1, cm.prop2)
 
+I5073["create I48__constraint_violation for is_opposite_of relation"].add_method(
+    ma.I5073_apply_with_statistics, "apply_with_statistics"
+)
+
 # res = p.ruleengine.apply_semantic_rule(I4147, __URI__)
+
+
+class LabelSearchIndex(si.IncrementalStatementIndex):
+    """
+    In-process search index for the labels (R1, all languages), alternative labels (R77) and descriptions (R2) of the
+    entities of some namespaces (default: ag, ma, ct).
+
+    Structure: inverted index {word: {doc_id, ...}} where a doc is one (entity, field, text) triple plus a trigram
+    index {trigram: {word, ...}} for fuzzy matching of query words. A query word matches a word of the vocabulary
+    exactly, as prefix (useful for autocompletion) or via trigram similarity. Results are ranked by the field
+    (label > alternative label > description), the fraction of matched query words and the length of the text.
+
+    The index is updated incrementally (see si.IncrementalStatementIndex). New words are collected unsorted and merged
+    into the sorted vocabulary (for the prefix search) only when it is needed by a query.
+    """
+
+    FIELDS = {"label": "R1", "alt_label": "R77", "description": "R2"}
+    FIELD_WEIGHTS = {"label": 3.0, "alt_label": 2.0, "description": 1.0}
+    MATCH_WEIGHTS = {"exact": 1.0, "prefix": 0.9, "fuzzy": 0.7}
+
+    word_pattern = re.compile(r"[^\W_]+")
+
+    def __init__(self, namespaces=None):
+        if namespaces is None:
+            namespaces = (ag.__URI__, ma.__URI__, __URI__)
+        self.namespaces = tuple(namespaces)
+        super().__init__()
+
+    def clear(self):
+        super().clear()
+        # list of (uri, field, lang, normalized text, original text (str or rdflib Literal))
+        self.docs = []
+        self.word_docs = defaultdict(set)
+        self.vocabulary = []
+        self.new_words = []
+        self.trigram_words = defaultdict(set)
+        self.word_trigrams = {}
+
+    @classmethod
+    def normalize(cls, text: str) -> list:
+        return cls.word_pattern.findall(str(text).casefold())
+
+    @staticmethod
+    def trigrams(word: str) -> set:
+        padded = f"  {word} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def _add_word(self, word: str):
+        self.new_words.append(word)
+        trigrams = self.word_trigrams[word] = self.trigrams(word)
+        for trigram in trigrams:
+            self.trigram_words[trigram].add(word)
+
+    def _process_new_statements(self):
+        """
+        process all R1, R77 and R2 statements which are not yet known to the index
+        """
+
+        for field, short_key in self.FIELDS.items():
+            for stm in self._get_new_statements(p.ds.get_entity_by_uri(f"{p.settings.BUILTINS_URI}#{short_key}").uri):
+                subject = stm.subject
+                if not subject.uri.startswith(self.namespaces) or subject.R20__has_defining_scope:
+                    # ignore entities from other modules and variables of scopes
+                    continue
+                words = self.normalize(stm.object)
+                lang = getattr(stm.object, "language", None)
+                doc_id = len(self.docs)
+                self.docs.append((subject.uri, field, lang, " ".join(words), stm.object))
+                for word in words:
+                    if word not in self.word_trigrams:
+                        self._add_word(word)
+                    self.word_docs[word].add(doc_id)
+        return self
+
+    def _get_sorted_vocabulary(self) -> list:
+        if self.new_words:
+            # (one sort of the already sorted part plus the new words instead of an insertion per word)
+            self.vocabulary.extend(self.new_words)
+            self.vocabulary.sort()
+            self.new_words = []
+        return self.vocabulary
+
+    def _match_word(self, query_word: str, fuzzy: bool, min_similarity: float) -> dict:
+        """
+        :return:    dict {vocabulary word: weight}
+        """
+        res = {}
+        if fuzzy:
+            query_trigrams = self.trigrams(query_word)
+            shared = Counter()
+            for trigram in query_trigrams:
+                shared.update(self.trigram_words.get(trigram, ()))
+            for word, n_shared in shared.items():
+                similarity = n_shared / (len(query_trigrams) + len(self.word_trigrams[word]) - n_shared)
+                if similarity >= min_similarity:
+                    res[word] = self.MATCH_WEIGHTS["fuzzy"] * similarity
+
+        vocabulary = self._get_sorted_vocabulary()
+        i = bisect.bisect_left(vocabulary, query_word)
+        while i < len(vocabulary) and vocabulary[i].startswith(query_word):
+            res[vocabulary[i]] = self.MATCH_WEIGHTS["prefix"]
+            i += 1
+
+        if query_word in self.word_docs:
+            res[query_word] = self.MATCH_WEIGHTS["exact"]
+        return res
+
+    def search(self, query: str, n: int = 10, fuzzy=True, lang: str = None, min_similarity=0.3) -> list:
+        """
+        :param query:           search string (one or more words)
+        :param n:               maximum number of results
+        :param fuzzy:           bool; also match similar words (trigram similarity)
+        :param lang:            None or language code like "de"; restrict the matches to texts in that language
+        :param min_similarity:  threshold for the trigram similarity (Jaccard index) of fuzzy matches
+
+        :return:    list of triples [(entity, score, matched_text), ...] in descending order of the score
+        """
+        query_words = self.normalize(query)
+        if not query_words:
+            return []
+
+        # {doc_id: [weight for every query word]}
+        doc_weights = defaultdict(lambda: [0.0] * len(query_words))
+        for i, query_word in enumerate(query_words):
+            for word, weight in self._match_word(query_word, fuzzy, min_similarity).items():
+                for doc_id in self.word_docs[word]:
+                    weights = doc_weights[doc_id]
+                    weights[i] = max(weights[i], weight)
+
+        normalized_query = " ".join(query_words)
+        best = {}
+        for doc_id, weights in doc_weights.items():
+            uri, field, doc_lang, normalized_text, text = self.docs[doc_id]
+            if lang is not None and doc_lang != lang:
+                continue
+            score = self.FIELD_WEIGHTS[field] * sum(weights) / len(weights)
+            # prefer short texts (i.e. texts which are covered by the query to a large extent)
+            score *= 0.5 + 0.5 * min(1, len(weights) / (normalized_text.count(" ") + 1))
+            if normalized_text == normalized_query:
+                score *= 2
+            if uri not in best or score > best[uri][0]:
+                best[uri] = (score, text)
+
+        ranking = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        return [(p.ds.get_entity_by_uri(uri), score, text) for uri, (score, text) in ranking[:n]]
+
+
+# (built on the first query, see get_label_search_index)
+LABEL_SEARCH_INDEX = LabelSearchIndex()
+
+
+def get_label_search_index() -> LabelSearchIndex:
+    """
+    Return the (incrementally updated) module-wide instance of LabelSearchIndex. It is built on the first call.
+    """
+    return LABEL_SEARCH_INDEX.update()
+
+
+def get_superclass_uris(cls: p.Item, cache: dict) -> set:
+    """
+    :param cls:     class item
+    :param cache:   dict {class uri: result} which is used and updated
+
+    :return:    set of the uris of cls and all its (direct and indirect) superclasses (R3)
+    """
+    # note: `p.is_subclass_of` raises an exception for classes which are not instantiable (e.g. I1793)
+    if cls.uri not in cache:
+        superclasses = cache[cls.uri] = {cls.uri}
+        stack = [cls]
+        while stack:
+            for superclass in stack.pop().get_relations(p.R3["is subclass of"].uri, return_obj=True):
+                if superclass.uri not in superclasses:
+                    superclasses.add(superclass.uri)
+                    stack.append(superclass)
+    return cache[cls.uri]
+
+
+class PropertyProfileIndex(si.IncrementalStatementIndex):
+    """
+    Index for queries of system models by their properties, e.g.
+
+        index.query("lti but not controllability")
+        index.query('I4761["linearity"], time invariance, without I7864')
+
+    A query is a conjunction of conditions (separated by "and", "but" or ","). Every condition refers to a property
+    (by short key, optionally with prefix and label, or by label) and has one of the forms
+
+        P           the model has P or a subproperty (R17) of P
+        not P       the model explicitly does not have P or a superproperty of P
+        without P   the model is not known to have P (closed world assumption)
+
+    The properties of a model are its R8303/R6458 statements and the R5100/R2279 statements of its model
+    representations (R2928). For every property the index stores a bitset (python int) of the models which have
+    (or do not have) it. The index is updated incrementally (see si.IncrementalStatementIndex).
+    """
+
+    query_split_pattern = re.compile(r"\s*(?:,|\band\b|\bbut\b)\s*")
+    condition_pattern = re.compile(r"^(?:(not|without)\s+)?(.+)$")
+    key_pattern = re.compile(r"""^(?:(\w+?)(?:__|\.))?(I\d+)(?:\[["'].*["']\])?$""")
+
+    def __init__(self):
+        self.prefixes = {"ct": __URI__, "ma": ma.__URI__, "ag": ag.__URI__}
+        super().__init__()
+
+    def clear(self):
+        super().clear()
+        # bit position -> uri and vice versa
+        self.model_uris = []
+        self.model_bits = {}
+
+        # {"has"|"has_not": {property uri: bitset of models}}
+        self.bitsets = {"has": defaultdict(int), "has_not": defaultdict(int)}
+
+        # {representation uri: bit positions of the corresponding models}
+        self.representation_models = defaultdict(list)
+        # {representation uri: [("has"|"has_not", property uri), ...]}
+        self.representation_properties = defaultdict(list)
+
+        # R17 hierarchy
+        self.parents = defaultdict(set)
+        self.children = defaultdict(set)
+        self.closure_cache = {}
+
+        self.properties = set()
+        self.scope_variables = set()
+        self.label_cache = None
+        # {class uri: uris of the class and all its superclasses}
+        self.class_cache = {}
+
+    def _is_subclass(self, cls: p.Item, parent_uris: tuple) -> bool:
+        superclass_uris = get_superclass_uris(cls, self.class_cache)
+        return any(uri in superclass_uris for uri in parent_uris)
+
+    def _get_model_bit(self, uri: str) -> int:
+        if uri not in self.model_bits:
+            self.model_bits[uri] = len(self.model_uris)
+            self.model_uris.append(uri)
+        return self.model_bits[uri]
+
+    def _apply_pending(self, pending: dict):
+        """
+        :param pending:     {("has"|"has_not", property uri): [bit positions]}; set all these bits at once (cheaper
+                            than setting them one by one for long bitsets)
+        """
+        n_bytes = (len(self.model_uris) + 7) // 8
+        for (kind, prop_uri), positions in pending.items():
+            bitsets = self.bitsets[kind]
+            buffer = bytearray(bitsets[prop_uri].to_bytes(n_bytes, "little"))
+            for i in positions:
+                buffer[i >> 3] |= 1 << (i & 7)
+            bitsets[prop_uri] = int.from_bytes(buffer, "little")
+
+    def _process_new_statements(self):
+        """
+        process all statements which are relevant for the index and which are not yet known to it
+        """
+
+        for stm in self._get_new_statements(p.R17["is subproperty of"].uri):
+            self.parents[stm.subject.uri].add(stm.object.uri)
+            self.children[stm.object.uri].add(stm.subject.uri)
+            self.closure_cache.clear()
+
+        # note: attribute access like `stm.subject.R20__has_defining_scope` is too slow for large graphs
+        for stm in self._get_new_statements(p.R20["has defining scope"].uri):
+            self.scope_variables.add(stm.subject.uri)
+
+        model_classes = (I7641.uri,)
+        property_classes = (I5356.uri, I1793.uri)
+        pending = defaultdict(list)
+        for stm in self._get_new_statements(p.R4["is instance of"].uri):
+            if stm.subject.uri in self.scope_variables:
+                continue
+            if self._is_subclass(stm.object, model_classes):
+                self._get_model_bit(stm.subject.uri)
+            elif self._is_subclass(stm.object, property_classes):
+                self.properties.add(stm.subject.uri)
+
+        for relation, kind in ((R8303, "has"), (R6458, "has_not")):
+            for stm in self._get_new_statements(relation.uri):
+                if stm.subject.uri in self.scope_variables:
+                    continue
+                pending[(kind, stm.object.uri)].append(self._get_model_bit(stm.subject.uri))
+                self.properties.add(stm.object.uri)
+
+        for stm in self._get_new_statements(R2928.uri):
+            if stm.subject.uri in self.scope_variables:
+                continue
+            bit = self._get_model_bit(stm.subject.uri)
+            self.representation_models[stm.object.uri].append(bit)
+            for kind, prop_uri in self.representation_properties[stm.object.uri]:
+                pending[(kind, prop_uri)].append(bit)
+
+        for relation, kind in ((R5100, "has"), (R2279, "has_not")):
+            for stm in self._get_new_statements(relation.uri):
+                if stm.subject.uri in self.scope_variables:
+                    continue
+                self.representation_properties[stm.subject.uri].append((kind, stm.object.uri))
+                pending[(kind, stm.object.uri)].extend(self.representation_models.get(stm.subject.uri, []))
+                self.properties.add(stm.object.uri)
+
+        self._apply_pending(pending)
+        self.label_cache = None
+
+    def _closure(self, uri: str, graph: dict) -> set:
+        """
+        :return:    set of all uris which are reachable from uri (including uri itself)
+        """
+        key = (uri, id(graph))
+        if key not in self.closure_cache:
+            res = {uri}
+            stack = [uri]
+            while stack:
+                for other in graph.get(stack.pop(), ()):
+                    if other not in res:
+                        res.add(other)
+                        stack.append(other)
+            self.closure_cache[key] = res
+        return self.closure_cache[key]
+
+    def resolve_property(self, designation: str) -> set:
+        """
+        :param designation:     short key like 'I7864', 'ct__I7864' or 'I7864["controllability"]' or label
+
+        :return:    set of property uris (labels are not unique, e.g. "linearity")
+        """
+        designation = designation.strip().strip("\"'")
+        if match := self.key_pattern.match(designation):
+            prefix, short_key = match.groups()
+            mod_uris = [self.prefixes[prefix]] if prefix else list(self.prefixes.values())
+            for mod_uri in mod_uris:
+                uri = f"{mod_uri}#{short_key}"
+                if uri in p.ds.items:
+                    return {uri}
+            msg = f"unknown property key: {designation}"
+            raise KeyError(msg)
+
+        if self.label_cache is None:
+            self.label_cache = defaultdict(lambda: (set(), set()))
+            for uri in self.properties:
+                self.label_cache[str(p.ds.get_entity_by_uri(uri).R1).casefold()][0].add(uri)
+            for uri in itertools.chain(self.parents, self.children):
+                self.label_cache[str(p.ds.get_entity_by_uri(uri).R1).casefold()][1].add(uri)
+
+        # prefer the properties of system models and model representations over other items of the R17 hierarchy
+        properties, hierarchy_items = self.label_cache.get(designation.casefold(), (None, None))
+        if not properties and not hierarchy_items:
+            msg = f"unknown property label: {designation}"
+            raise KeyError(msg)
+        return properties or hierarchy_items
+
+    def get_bitset(self, condition: str) -> int:
+        """
+        :param condition:   one condition of a query, e.g. "not controllability"
+
+        :return:    bitset of all models which satisfy the condition
+        """
+        mode, designation = self.condition_pattern.match(condition.strip()).groups()
+        res = 0
+        for uri in self.resolve_property(designation):
+            if mode == "not":
+                for ancestor in self._closure(uri, self.parents):
+                    res |= self.bitsets["has_not"].get(ancestor, 0)
+            else:
+                for descendant in self._closure(uri, self.children):
+                    res |= self.bitsets["has"].get(descendant, 0)
+        if mode == "without":
+            res = ((1 << len(self.model_uris)) - 1) & ~res
+        return res
+
+    def query_bitset(self, query: str) -> int:
+        res = (1 << len(self.model_uris)) - 1
+        for condition in self.query_split_pattern.split(query.strip()):
+            res &= self.get_bitset(condition)
+            if not res:
+                break
+        return res
+
+    def query(self, query: str) -> list:
+        """
+        :param query:   conjunction of conditions, e.g. "linearity and time invariance but not controllability"
+
+        :return:    list of the matching system models (in the order in which they are known to the index)
+        """
+        bits = bin(self.query_bitset(query))[:1:-1]
+        res = []
+        i = bits.find("1")
+        while i >= 0:
+            res.append(p.ds.get_entity_by_uri(self.model_uris[i]))
+            i = bits.find("1", i + 1)
+        return res
+
+
+PROPERTY_PROFILE_INDEX = PropertyProfileIndex()
+
+
+def get_property_profile_index() -> PropertyProfileIndex:
+    """
+    Return the (incrementally updated) module-wide instance of PropertyProfileIndex
+    """
+    return PROPERTY_PROFILE_INDEX.update()
+
+
+def query_system_models(query: str) -> list:
+    """
+    Convenience function, see PropertyProfileIndex.query
+    """
+    return get_property_profile_index().query(query)
+
+
+class TheoremRecord:
+    """
+    Precompiled content of the scopes of a mathematical proposition (I14 or subclass). All entities are represented
+    by their uris (literals by their value):
+
+        variables:  {scope name: ((var uri, label, (type uri, ...)), ...)}
+        statements: {scope name: ((subject uri, relation uri, object uri or literal), ...)}
+
+    The required (excluded) properties are taken from the R8303/R5100 (R6458/R2279) statements of setting and
+    premise.
+    """
+
+    __slots__ = (
+        "uri",
+        "label",
+        "type_uri",
+        "variables",
+        "statements",
+        "sources",
+        "required_system_properties",
+        "required_representation_properties",
+        "excluded_system_properties",
+        "excluded_representation_properties",
+    )
+
+    SCOPE_NAMES = {"SETTING": "setting", "PREMISE": "premise", "ASSERTION": "assertion"}
+
+    def __init__(self, theorem: p.Item):
+        self.uri = theorem.uri
+        self.label = str(theorem.R1__has_label)
+        self.type_uri = theorem.R4__is_instance_of.uri
+        self.sources = tuple(src.uri for src in theorem.get_relations(ag.R8439.uri, return_obj=True))
+
+        variables = {name: [] for name in self.SCOPE_NAMES.values()}
+        statements = {name: [] for name in self.SCOPE_NAMES.values()}
+        for scope in theorem.get_inv_relations(p.R21["is scope of"].uri, return_subj=True):
+            name = self.SCOPE_NAMES.get(str(scope.R64__has_scope_type))
+            if name is None:
+                continue
+            for elt in scope.get_inv_relations(p.R20["has defining scope"].uri, return_subj=True):
+                if isinstance(elt, p.Statement):
+                    obj = elt.object.uri if isinstance(elt.object, p.Entity) else elt.object
+                    statements[name].append((elt.subject.uri, elt.predicate.uri, obj))
+                else:
+                    types = tuple(cls.uri for cls in elt.get_relations(p.R4["is instance of"].uri, return_obj=True))
+                    variables[name].append((elt.uri, str(elt.R1__has_label), types))
+        self.variables = {name: tuple(value) for name, value in variables.items()}
+        self.statements = {name: tuple(value) for name, value in statements.items()}
+
+        def objects(relation):
+            return frozenset(
+                obj
+                for name in ("setting", "premise")
+                for subj, rel_uri, obj in self.statements[name]
+                if rel_uri == relation.uri
+            )
+
+        self.required_system_properties = objects(R8303)
+        self.required_representation_properties = objects(R5100)
+        self.excluded_system_properties = objects(R6458)
+        self.excluded_representation_properties = objects(R2279)
+
+    @property
+    def required_properties(self) -> frozenset:
+        return self.required_system_properties | self.required_representation_properties
+
+    def as_dict(self) -> dict:
+        """
+        :return:    JSON-serializable representation (e.g. for documentation tools)
+        """
+        res = {}
+        for name in self.__slots__:
+            value = getattr(self, name)
+            res[name] = sorted(value) if isinstance(value, frozenset) else value
+        return res
+
+    def __repr__(self):
+        return f'<TheoremRecord {self.uri} ["{self.label}"]>'
+
+
+class TheoremCatalog(si.IncrementalStatementIndex):
+    """
+    Catalog of precompiled TheoremRecord objects with O(1) lookup by theorem uri (or item) and a reverse index of the
+    required properties.
+
+    The catalog is updated incrementally (see si.IncrementalStatementIndex). Every new R4 (instance of I14), R21
+    (scope), R20 (scope content) or R8439 (source) statement marks the corresponding theorem for recompilation.
+    """
+
+    def clear(self):
+        super().clear()
+        # {theorem uri: TheoremRecord}
+        self.records = {}
+        # {property uri: set of theorem uris}
+        self.property_theorems = defaultdict(set)
+        # {scope uri: theorem uri}
+        self.scope_theorems = {}
+        # {class uri: uris of the class and all its superclasses}
+        self.class_cache = {}
+
+    def _is_theorem_class(self, cls: p.Item) -> bool:
+        return p.I14.uri in get_superclass_uris(cls, self.class_cache)
+
+    def _process_new_statements(self):
+        """
+        (re)compile all theorems which are new or whose scopes have changed since the last call
+        """
+
+        dirty = set()
+        for stm in self._get_new_statements(p.R4["is instance of"].uri):
+            if isinstance(stm.object, p.Item) and self._is_theorem_class(stm.object):
+                dirty.add(stm.subject.uri)
+
+        for stm in self._get_new_statements(p.R21["is scope of"].uri):
+            self.scope_theorems[stm.subject.uri] = stm.object.uri
+            dirty.add(stm.object.uri)
+
+        for stm in self._get_new_statements(p.R20["has defining scope"].uri):
+            if theorem_uri := self.scope_theorems.get(stm.object.uri):
+                dirty.add(theorem_uri)
+
+        for stm in self._get_new_statements(ag.R8439.uri):
+            dirty.add(stm.subject.uri)
+
+        for uri in dirty:
+            if uri in self.records:
+                self._remove(uri)
+            theorem = p.ds.items.get(uri)
+            # dirty uris might also belong to rules (scopes) or to other items (sources)
+            if theorem is not None and isinstance(theorem.R4__is_instance_of, p.Item):
+                if self._is_theorem_class(theorem.R4__is_instance_of):
+                    self._add(TheoremRecord(theorem))
+
+    def _add(self, record: TheoremRecord):
+        self.records[record.uri] = record
+        for prop_uri in record.required_properties:
+            self.property_theorems[prop_uri].add(record.uri)
+
+    def _remove(self, uri: str):
+        record = self.records.pop(uri)
+        for prop_uri in record.required_properties:
+            self.property_theorems[prop_uri].discard(uri)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records.values())
+
+    def __getitem__(self, theorem) -> TheoremRecord:
+        """
+        :param theorem:     theorem item or uri
+        """
+        return self.records[getattr(theorem, "uri", theorem)]
+
+    def get_theorems_requiring(self, prop: p.Item) -> list:
+        """
+        :return:    list of the theorems whose setting or premise requires the given system or representation
+                    property (exactly this property, not considering the R17 hierarchy)
+        """
+        return [p.ds.get_entity_by_uri(uri) for uri in sorted(self.property_theorems.get(prop.uri, ()))]
+
+
+THEOREM_CATALOG = TheoremCatalog().update()
+
+
+def get_theorem_catalog() -> TheoremCatalog:
+    """
+    Return the (incrementally updated) module-wide instance of TheoremCatalog
+    """
+    return THEOREM_CATALOG.update()
+
+
+# {module uri: {uri of an item which was created by TheoremInferenceEngine in this module: uris of the theorems which
+# were involved in its creation}} (such that repeated runs do not apply theorems to their own results; the entries of
+# unloaded modules are removed when the next engine is created)
+THEOREM_INFERENCE_CREATOR_RULES = defaultdict(dict)
+
+
+class InferenceRule:
+    """
+    Horn rule which is compiled from a TheoremRecord. The atoms are (subject, relation uri, object)-triples of terms:
+
+        "irk:/..."                      entity (uri)
+        ("lit", value)                  literal
+        ("var", uri)                    scope variable of the theorem
+        ("map", operator, (arg, ...))   evaluated mapping (operator and arguments are terms)
+
+    Equations are represented by R31 atoms. The body consists of the setting and premise statements (and of
+    `theorem R80 sys` if the setting contains a system model), the head of the assertion statements.
+
+    Universally quantified setting variables for which a witness can be constructed (see WITNESS_CONSTRUCTORS, e.g.
+    the matrix Q of the Lyapunov equation) are witness variables: their atoms are not part of core_body, i.e. the rule
+    also applies if no such entity exists yet.
+    """
+
+    __slots__ = ("uri", "body", "head", "var_types", "existential_vars", "labels", "core_body", "witness_vars")
+
+    def __init__(self, uri, body, head, var_types, existential_vars, labels, witness_vars):
+        self.uri = uri
+        self.body = body
+        self.head = head
+        # {var uri: (type uri, ...)}
+        self.var_types = var_types
+        # {var uri: (label, (type uri, ...))} for the assertion variables which are not bound by the body
+        self.existential_vars = existential_vars
+        # {var uri: label}
+        self.labels = labels
+        # {var uri: (atom, ...)}
+        self.witness_vars = witness_vars
+        witness_atoms = {atom for atoms in witness_vars.values() for atom in atoms}
+        self.core_body = tuple(atom for atom in body if atom not in witness_atoms)
+
+    def __repr__(self):
+        return f"<InferenceRule {self.uri} ({len(self.body)} -> {len(self.head)} atoms)>"
+
+
+def _get_term_vars(term, res: set) -> set:
+    if isinstance(term, tuple):
+        if term[0] == "var":
+            res.add(term[1])
+        elif term[0] == "map":
+            _get_term_vars(term[1], res)
+            for arg in term[2]:
+                _get_term_vars(arg, res)
+    return res
+
+
+def _get_term_uris(term) -> set:
+    """
+    :return:    set of the uris of all entities which occur in a term
+    """
+    if isinstance(term, str):
+        return {term}
+    if term[0] == "map":
+        return _get_term_uris(term[1]).union(*map(_get_term_uris, term[2]))
+    return set()
+
+
+def _decide_eigenvalues_in_olhp(term):
+    """
+    Decision procedure for `I9160["set of eigenvalues of a matrix"](A) R14 I2739["open left half plane"]`
+    (based on the term such that the evaluated mapping does not need to exist)
+    """
+    if not (isinstance(term, tuple) and term[0] == "map" and term[1] == ma.I9160.uri and len(term[2]) == 1):
+        return None
+    if not isinstance(matrix_uri := term[2][0], str):
+        return None
+    return ma.decide_matrix_eigenvalues_in_olhp(p.ds.get_entity_by_uri(matrix_uri))
+
+
+def _identity_matrix_witness(atoms):
+    """
+    Witness for a universally quantified square matrix Q with atoms like `Q R5938 n` and `Q R16 I3648` (positive
+    definiteness): the n x n identity matrix.
+
+    :param atoms:   ((relation uri, ground object term), ...)
+    :return:        (class item, numeric value or None) or None if the atoms are not supported
+    """
+    import numpy as np
+
+    dimension_uris = {ma.R5938["has row number"].uri, ma.R5939["has column number"].uri}
+    dimensions = {obj for rel_uri, obj in atoms if rel_uri in dimension_uris}
+    properties = {obj for rel_uri, obj in atoms if rel_uri == p.R16.uri}
+    if len(dimensions) != 1 or len(dimensions) + len(properties) < len(set(atoms)):
+        return None
+    if not properties <= {ma.I3648["positive definiteness (matrix)"].uri}:
+        return None
+
+    (dimension,) = dimensions
+    if isinstance(dimension, str):
+        n = ma.get_numeric_value(p.ds.get_entity_by_uri(dimension))
+    else:
+        n = dimension[1] if dimension[0] == "lit" else None
+    value = np.eye(n) if isinstance(n, int) else None
+    return ma.I1608["identity matrix"], value
+
+
+class TheoremInferenceEngine:
+    """
+    Forward chaining of the theorems of the TheoremCatalog: For every theorem whose setting and premise are satisfied
+    by concrete entities (for theorems about system models: by a system to which the theorem applies, see
+    `apply_theorems_to_systems`) the assertion is instantiated, i.e. the corresponding statements (and equations) are
+    created in the active module. Assertion variables which are not bound by setting or premise (e.g. the matrix P of
+    the Lyapunov equation) are instantiated as new items (once per theorem and binding).
+
+    The evaluation is semi-naive: Initially every fact (statement outside of scopes) is on the worklist. A fact from
+    the worklist only triggers the body atoms with the same relation and the remaining atoms are joined against the
+    fact index. Derived facts are appended to the worklist, i.e. only new facts trigger further rule applications and
+    the fixpoint is reached when the worklist is empty.
+
+    Additionally to plain matching:
+
+    - R31 (equation) atoms are also satisfied by identical terms, e.g. `eig R31 I9160(A)` binds eig to I9160(A)
+    - property atoms (PROPERTY_RELATION_URIS) also match subproperties (R17) of the required property
+    - the arguments of commutative operators (COMMUTATIVE_OPERATOR_URIS) are matched in both orders
+    - premises for which a decision procedure exists (DECISION_PROCEDURES, e.g. eigenvalues in the open left half
+      plane) are decided numerically (positive results become facts)
+
+    - universally quantified setting variables are instantiated by a witness (WITNESS_CONSTRUCTORS) if no matching
+      entity exists, e.g. the identity matrix as positive definite Q for the Lyapunov theorem I3712
+
+    New items are only created if the assertion is not yet satisfied by existing entities and a theorem is never
+    applied to items which were created by itself (directly or via other theorems). This guarantees that the fixpoint
+    is reached and that repeated runs do not create anything new. Evaluated mappings are created without the search
+    of `p.create_evaluated_mapping` (the engine knows all existing ones), i.e. the run time is proportional to the
+    number of derived facts.
+    """
+
+    PROPERTY_RELATION_URIS = frozenset((p.R16.uri, R8303.uri, R5100.uri))
+    COMMUTATIVE_OPERATOR_URIS = frozenset((ma.I9493["matadd"].uri,))
+    # {(relation uri, object uri): function(subject term) -> True, False or None}
+    DECISION_PROCEDURES = {(p.R14.uri, ma.I2739["open left half plane"].uri): _decide_eigenvalues_in_olhp}
+    # {type uri: function(atoms) -> (class, numeric value) or None}
+    WITNESS_CONSTRUCTORS = {ma.I9906["square matrix"].uri: _identity_matrix_witness}
+
+    def __init__(self, catalog: TheoremCatalog = None, mod_context_uri: str = None):
+        """
+        :param catalog:         TheoremCatalog (default: module-wide instance)
+        :param mod_context_uri: uri of the module in which the new entities and statements are created (default:
+                                active module)
+        """
+        if catalog is None:
+            catalog = get_theorem_catalog()
+        self.mod_context_uri = mod_context_uri
+
+        self.class_cache = {}
+        self.type_cache = {}
+        self.subproperty_cache = {}
+        # {entity uri: term}
+        self.term_cache = {}
+        # {term: uri} for all evaluated mappings (`create_evaluated_mapping` has to search all instances of the result
+        # class to find an existing one)
+        self.mapping_items = {}
+
+        # {property uri: set of direct subproperty uris}
+        self.subproperties = defaultdict(set)
+        for stm in p.ds.relation_statements[p.R17["is subproperty of"].uri]:
+            self.subproperties[stm.object.uri].add(stm.subject.uri)
+
+        # evaluated mappings: {item uri: operator item}, {item uri: argument tuple item}
+        self.mapping_operators = {
+            stm.subject.uri: stm.object for stm in p.ds.relation_statements[p.R35["is applied mapping of"].uri]
+        }
+        self.mapping_arguments = {
+            stm.subject.uri: stm.object for stm in p.ds.relation_statements[p.R36["has argument tuple"].uri]
+        }
+        for uri in self.mapping_operators:
+            # index all existing evaluated mappings (see `_materialize`)
+            self._term(p.ds.get_entity_by_uri(uri))
+
+        self.universally_quantified_uris = {
+            stm.subject.uri
+            for stm in p.ds.relation_statements[p.R44["is universally quantified"].uri]
+            if stm.object is True
+        }
+
+        self.rules = [rule for record in catalog if (rule := self._compile_rule(record)) is not None]
+        # {relation uri: [(rule, body, index of atom), ...]} where body is rule.body or rule.core_body
+        self.triggers = defaultdict(list)
+        for rule in self.rules:
+            bodies = [rule.body, rule.core_body] if rule.witness_vars and rule.core_body else [rule.body]
+            for body in bodies:
+                for i, atom in enumerate(body):
+                    self.triggers[atom[1]].append((rule, body, i))
+
+        self.facts = set()
+        self.facts_by_relation = defaultdict(list)
+        self.facts_by_subject = defaultdict(list)
+        self.facts_by_object = defaultdict(list)
+        self.worklist = deque()
+        self.decided = {}
+        # {(rule uri, binding)} of all rule applications (such that every application happens only once)
+        self.fired = set()
+        # {(type uri, atoms): uri}
+        self.witnesses = {}
+        # list of (fact, rule uri or None for decision procedures and witnesses)
+        self.derivations = []
+
+        for mod_uri in list(THEOREM_INFERENCE_CREATOR_RULES):
+            if mod_uri not in p.ds.uri_keymanager_dict:
+                del THEOREM_INFERENCE_CREATOR_RULES[mod_uri]
+        self.result = p.RuleResult()
+
+        self._load_facts()
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # terms
+
+    def _term(self, obj):
+        """
+        :return:    term for a concrete entity or literal
+        """
+        if not isinstance(obj, p.Entity):
+            return ("lit", obj)
+        if (res := self.term_cache.get(obj.uri)) is not None:
+            return res
+        if (operator := self.mapping_operators.get(obj.uri)) is not None:
+            arg_tuple = self.mapping_arguments[obj.uri]
+            args = tuple(self._term(arg) for arg in arg_tuple.get_relations(p.R39.uri, return_obj=True))
+            res = ("map", self._term(operator), args)
+            self.mapping_items.setdefault(res, obj.uri)
+        else:
+            res = obj.uri
+        self.term_cache[obj.uri] = res
+        return res
+
+    def _pattern(self, obj, var_uris):
+        """
+        :return:    term for an entity or literal from the scope of a theorem
+        """
+        if isinstance(obj, p.Entity) and obj.uri in var_uris:
+            return ("var", obj.uri)
+        if isinstance(obj, p.Entity) and (operator := self.mapping_operators.get(obj.uri)) is not None:
+            arg_tuple = self.mapping_arguments[obj.uri]
+            args = tuple(self._pattern(arg, var_uris) for arg in arg_tuple.get_relations(p.R39.uri, return_obj=True))
+            return ("map", self._pattern(operator, var_uris), args)
+        return self._term(obj)
+
+    @staticmethod
+    def _is_ground(term) -> bool:
+        if isinstance(term, str):
+            return True
+        if term[0] == "var":
+            return False
+        if term[0] == "map":
+            return TheoremInferenceEngine._is_ground(term[1]) and all(map(TheoremInferenceEngine._is_ground, term[2]))
+        return True
+
+    @staticmethod
+    def _subst(term, binding: dict):
+        if isinstance(term, str):
+            return term
+        if term[0] == "var":
+            return binding.get(term[1], term)
+        if term[0] == "map":
+            subst = TheoremInferenceEngine._subst
+            return ("map", subst(term[1], binding), tuple(subst(arg, binding) for arg in term[2]))
+        return term
+
+    def _materialize(self, term):
+        """
+        :return:    entity or literal for a ground term (evaluated mappings are created if necessary)
+        """
+        if isinstance(term, str):
+            return p.ds.get_entity_by_uri(term)
+        if term[0] == "lit":
+            return term[1]
+        if (uri := self.mapping_items.get(term)) is not None:
+            return p.ds.get_entity_by_uri(uri)
+        operator = self._materialize(term[1])
+        # all existing evaluated mappings are in self.mapping_items -> create a new one
+        item = ma.new_evaluated_mapping(operator, *(self._materialize(arg) for arg in term[2]))
+        self.term_cache[item.uri] = term
+        self.mapping_items[term] = item.uri
+        return item
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # rules and facts
+
+    def _compile_rule(self, record: TheoremRecord):
+        """
+        :return:    InferenceRule or None (if the theorem has no applicable assertion)
+        """
+        var_types = {}
+        labels = {}
+        for scope_vars in record.variables.values():
+            for var_uri, label, types in scope_vars:
+                var_types[var_uri] = types
+                labels[var_uri] = label
+
+        def get_atoms(*scope_names):
+            res = []
+            for name in scope_names:
+                for subj_uri, rel_uri, obj in record.statements[name]:
+                    subj = p.ds.items.get(subj_uri)
+                    if subj is None:
+                        # statements about statements (qualifiers) are not supported
+                        return None
+                    if isinstance(obj, str) and (entity := p.ds.get_entity_by_uri(obj, strict=False)) is not None:
+                        obj = entity
+                    res.append((self._pattern(subj, var_types), rel_uri, self._pattern(obj, var_types)))
+            return res
+
+        body = get_atoms("setting", "premise")
+        head = get_atoms("assertion")
+        if not body or not head:
+            return None
+
+        if not record.statements["premise"]:
+            # a premise scope without statements is expressed by other means (e.g. ImplicationStatement) which can not
+            # be evaluated here
+            theorem = p.ds.items[record.uri]
+            for scope in theorem.get_inv_relations(p.R21["is scope of"].uri, return_subj=True):
+                if str(scope.R64__has_scope_type) == "PREMISE":
+                    return None
+
+        system_vars = [
+            var_uri
+            for var_uri, _, types in record.variables["setting"]
+            if any(I7641.uri in get_superclass_uris(p.ds.get_entity_by_uri(t), self.class_cache) for t in types)
+        ]
+        if len(system_vars) == 1:
+            body.insert(0, (record.uri, p.R80["applies to"].uri, ("var", system_vars[0])))
+
+        body_vars = set()
+        for subj, _, obj in body:
+            _get_term_vars(obj, _get_term_vars(subj, body_vars))
+        head_vars = set()
+        for subj, _, obj in head:
+            _get_term_vars(obj, _get_term_vars(subj, head_vars))
+
+        assertion_vars = {var_uri for var_uri, _, _ in record.variables["assertion"]}
+        unbound_vars = head_vars - body_vars
+        if not unbound_vars <= assertion_vars:
+            # the assertion refers to setting variables which are not determined by setting and premise
+            return None
+        existential_vars = {var_uri: (labels[var_uri], var_types[var_uri]) for var_uri in sorted(unbound_vars)}
+
+        witness_vars = {}
+        for var_uri, _, types in record.variables["setting"]:
+            if var_uri not in self.universally_quantified_uris:
+                continue
+            if not any(type_uri in self.WITNESS_CONSTRUCTORS for type_uri in types):
+                continue
+            atoms = [atom for atom in body if var_uri in _get_term_vars(atom[0], _get_term_vars(atom[2], set()))]
+            if all(atom[0] == ("var", var_uri) and var_uri not in _get_term_vars(atom[2], set()) for atom in atoms):
+                witness_vars[var_uri] = tuple(atoms)
+
+        return InferenceRule(
+            record.uri, tuple(body), tuple(head), var_types, existential_vars, labels, witness_vars
+        )
+
+    def _load_facts(self):
+        # statements inside of scopes (and statements about scope variables) are patterns, not facts
+        # (this includes evaluated mappings of scope variables, e.g. `f(x)` in a setting)
+        scoped_uris = {stm.subject.uri for stm in p.ds.relation_statements[p.R20["has defining scope"].uri]}
+        # (the relations of the heads are needed to avoid duplicate statements)
+        rel_uris = set(self.triggers).union(atom[1] for rule in self.rules for atom in rule.head)
+        for rel_uri in sorted(rel_uris):
+            for stm in p.ds.relation_statements[rel_uri]:
+                if stm.uri in scoped_uris:
+                    continue
+                fact = (self._term(stm.subject), rel_uri, self._term(stm.object))
+                if fact in self.facts or not _get_term_uris(fact[0]).isdisjoint(scoped_uris):
+                    continue
+                if not _get_term_uris(fact[2]).isdisjoint(scoped_uris):
+                    continue
+                self._add_fact(fact)
+
+    def _add_fact(self, fact):
+        subj, rel_uri, obj = fact
+        self.facts.add(fact)
+        self.facts_by_relation[rel_uri].append(fact)
+        self.facts_by_subject[(rel_uri, subj)].append(fact)
+        self.facts_by_object[(rel_uri, obj)].append(fact)
+        self.worklist.append(fact)
+
+    def _derive(self, fact, rule_uri):
+        """
+        Create the statement (or equation) for a new fact and put the fact on the worklist.
+        """
+        subj, rel_uri, obj = fact
+        subj_entity = self._materialize(subj)
+        obj_entity = self._materialize(obj)
+        if rel_uri == p.R31["is in mathematical relation with"].uri:
+            self.result.new_entities.append(p.new_equation(subj_entity, obj_entity))
+        else:
+            relation = p.ds.get_entity_by_uri(rel_uri)
+            self.result.new_statements.append(subj_entity.set_relation(relation, obj_entity))
+        self._add_fact(fact)
+        self.derivations.append((fact, rule_uri))
+
+    def _get_subproperty_uris(self, prop_uri: str) -> set:
+        if prop_uri not in self.subproperty_cache:
+            res = self.subproperty_cache[prop_uri] = {prop_uri}
+            stack = [prop_uri]
+            while stack:
+                for sub_uri in self.subproperties.get(stack.pop(), ()):
+                    if sub_uri not in res:
+                        res.add(sub_uri)
+                        stack.append(sub_uri)
+        return self.subproperty_cache[prop_uri]
+
+    def _has_type(self, term, types) -> bool:
+        if not types or not isinstance(term, str):
+            # mappings and literals are not checked
+            return True
+        key = (term, types)
+        if key not in self.type_cache:
+            entity = p.ds.get_entity_by_uri(term)
+            superclass_uris = set()
+            if not isinstance(entity, p.Item):
+                classes = []
+            else:
+                classes = entity.get_relations(p.R4["is instance of"].uri, return_obj=True)
+            for cls in classes:
+                superclass_uris.update(get_superclass_uris(cls, self.class_cache))
+            self.type_cache[key] = all(type_uri in superclass_uris for type_uri in types)
+        return self.type_cache[key]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # matching
+
+    def _unify(self, pattern, term, binding: dict, var_types: dict):
+        """
+        Generator of all extensions of binding such that `_subst(pattern, binding) == term` (term is ground)
+        """
+        if isinstance(pattern, str) or pattern[0] == "lit":
+            if pattern == term:
+                yield binding
+        elif pattern[0] == "var":
+            var_uri = pattern[1]
+            if var_uri in binding:
+                if binding[var_uri] == term:
+                    yield binding
+            elif self._has_type(term, var_types.get(var_uri)):
+                yield {**binding, var_uri: term}
+        elif isinstance(term, tuple) and term[0] == "map" and len(term[2]) == len(pattern[2]):
+            argument_orders = [term[2]]
+            if len(term[2]) == 2 and term[1] in self.COMMUTATIVE_OPERATOR_URIS and term[2][0] != term[2][1]:
+                argument_orders.append(term[2][::-1])
+            for binding2 in self._unify(pattern[1], term[1], binding, var_types):
+                for args in argument_orders:
+                    yield from self._unify_sequence(pattern[2], args, binding2, var_types)
+
+    def _unify_sequence(self, patterns, terms, binding: dict, var_types: dict):
+        if not patterns:
+            yield binding
+            return
+        for binding2 in self._unify(patterns[0], terms[0], binding, var_types):
+            yield from self._unify_sequence(patterns[1:], terms[1:], binding2, var_types)
+
+    def _match(self, atom, fact, binding: dict, var_types: dict):
+        subj, rel_uri, obj = atom
+        for binding2 in self._unify(subj, fact[0], binding, var_types):
+            if isinstance(obj, str) and rel_uri in self.PROPERTY_RELATION_URIS:
+                if fact[2] in self._get_subproperty_uris(obj):
+                    yield binding2
+            else:
+                yield from self._unify(obj, fact[2], binding2, var_types)
+
+    def _count_candidates(self, atom, binding: dict) -> int:
+        subj, rel_uri, obj = (self._subst(atom[0], binding), atom[1], self._subst(atom[2], binding))
+        if self._is_ground(subj):
+            return len(self.facts_by_subject.get((rel_uri, subj), ())) + 1
+        if self._is_ground(obj):
+            if isinstance(obj, str) and rel_uri in self.PROPERTY_RELATION_URIS:
+                uris = self._get_subproperty_uris(obj)
+                return sum(len(self.facts_by_object.get((rel_uri, uri), ())) for uri in uris) + 1
+            return len(self.facts_by_object.get((rel_uri, obj), ())) + 1
+        return len(self.facts_by_relation.get(rel_uri, ())) + 2
+
+    def _get_candidates(self, atom, binding: dict) -> list:
+        """
+        :return:    list of the facts which might match the atom (w.r.t. the binding)
+        """
+        subj, rel_uri, obj = (self._subst(atom[0], binding), atom[1], self._subst(atom[2], binding))
+        subj_is_ground, obj_is_ground = self._is_ground(subj), self._is_ground(obj)
+        if subj_is_ground:
+            res = list(self.facts_by_subject.get((rel_uri, subj), ()))
+            procedure = self.DECISION_PROCEDURES.get((rel_uri, obj))
+            if procedure is not None and (subj, rel_uri, obj) not in self.facts:
+                key = (subj, rel_uri, obj)
+                if key not in self.decided:
+                    self.decided[key] = procedure(subj)
+                    if self.decided[key]:
+                        self._derive(key, None)
+                        res.append(key)
+        elif obj_is_ground:
+            if isinstance(obj, str) and rel_uri in self.PROPERTY_RELATION_URIS:
+                res = []
+                for uri in self._get_subproperty_uris(obj):
+                    res.extend(self.facts_by_object.get((rel_uri, uri), ()))
+            else:
+                res = list(self.facts_by_object.get((rel_uri, obj), ()))
+        else:
+            res = list(self.facts_by_relation.get(rel_uri, ()))
+
+        if rel_uri == p.R31.uri and (subj_is_ground or obj_is_ground):
+            # every term is equal to itself
+            term = subj if subj_is_ground else obj
+            res.append((term, rel_uri, term))
+        return res
+
+    def _join(self, atoms: tuple, binding: dict, var_types: dict):
+        """
+        Generator of all extensions of binding which satisfy all atoms
+        """
+        if not atoms:
+            yield binding
+            return
+        # continue with the most selective atom
+        i = min(range(len(atoms)), key=lambda j: self._count_candidates(atoms[j], binding))
+        atom, rest = atoms[i], atoms[:i] + atoms[i + 1 :]
+        for fact in self._get_candidates(atom, binding):
+            for binding2 in self._match(atom, fact, binding, var_types):
+                yield from self._join(rest, binding2, var_types)
+
+    def _fire(self, rule: InferenceRule, binding: dict):
+        key = (rule.uri, frozenset(binding.items()))
+        if key in self.fired:
+            return
+        self.fired.add(key)
+
+        if rule.existential_vars:
+            # a theorem is not applied to the entities which it has created itself (directly or indirectly), otherwise
+            # e.g. the Lyapunov theorem would create a new P for every P (as positive definite Q) -> no fixpoint
+            ancestors = set()
+            for value in binding.values():
+                for uri in _get_term_uris(value):
+                    mod_uri = uri.rpartition("#")[0]
+                    ancestors.update(THEOREM_INFERENCE_CREATOR_RULES.get(mod_uri, {}).get(uri, ()))
+            if rule.uri in ancestors:
+                return
+            ancestors.add(rule.uri)
+
+            if next(self._join(rule.head, binding, rule.var_types), None) is not None:
+                # the assertion is already satisfied by existing entities
+                return
+
+        binding = dict(binding)
+        for var_uri, (label, types) in rule.existential_vars.items():
+            cls = p.ds.get_entity_by_uri(types[0]) if types else p.I1["general item"]
+            item = p.instance_of(cls, r1=label)
+            self.result.new_entities.append(item)
+            THEOREM_INFERENCE_CREATOR_RULES[item.uri.rpartition("#")[0]][item.uri] = frozenset(ancestors)
+            binding[var_uri] = self.term_cache[item.uri] = item.uri
+
+        for subj, rel_uri, obj in rule.head:
+            fact = (self._subst(subj, binding), rel_uri, self._subst(obj, binding))
+            if fact not in self.facts:
+                self._derive(fact, rule.uri)
+
+    def _fire_with_witnesses(self, rule: InferenceRule, binding: dict):
+        """
+        Apply the rule for a binding of rule.core_body, i.e. instantiate the witness variables.
+        """
+        witness_atoms = tuple(atom for atoms in rule.witness_vars.values() for atom in atoms)
+        if next(self._join(witness_atoms, binding, rule.var_types), None) is not None:
+            # there are matching entities (-> the rule is applied with the complete body)
+            return
+
+        binding = dict(binding)
+        for var_uri, atoms in rule.witness_vars.items():
+            ground_atoms = tuple(sorted((rel_uri, self._subst(obj, binding)) for _, rel_uri, obj in atoms))
+            if not all(self._is_ground(obj) for _, obj in ground_atoms):
+                return
+            witness = self._get_witness(rule.var_types[var_uri], rule.labels[var_uri], var_uri, ground_atoms)
+            if witness is None:
+                return
+            binding[var_uri] = witness
+        self._fire(rule, binding)
+
+    def _get_witness(self, types: tuple, label: str, var_uri: str, atoms: tuple):
+        """
+        :return:    uri of an item of the given types which satisfies the atoms (of the variable) or None
+        """
+        for type_uri in types:
+            key = (type_uri, atoms)
+            if key in self.witnesses:
+                return self.witnesses[key]
+            if (constructor := self.WITNESS_CONSTRUCTORS.get(type_uri)) is None:
+                continue
+            if (res := constructor(atoms)) is None:
+                continue
+            cls, value = res
+            item = p.instance_of(cls, r1=label)
+            self.result.new_entities.append(item)
+            if value is not None:
+                ma.set_numeric_value(item, value)
+            uri = self.witnesses[key] = self.term_cache[item.uri] = item.uri
+            for rel_uri, obj in atoms:
+                self._derive((uri, rel_uri, obj), None)
+            return uri
+        return None
+
+    def run(self) -> p.RuleResult:
+        """
+        Process the worklist until the fixpoint is reached.
+
+        :return:    RuleResult with the new statements and entities (of this and all previous runs)
+        """
+        if self.mod_context_uri is None:
+            self._run()
+        else:
+            with p.uri_context(uri=self.mod_context_uri):
+                self._run()
+        return self.result
+
+    def _run(self):
+        while self.worklist:
+            fact = self.worklist.popleft()
+            for rule, body, i in self.triggers.get(fact[1], ()):
+                rest = body[:i] + body[i + 1 :]
+                fire = self._fire if body is rule.body else self._fire_with_witnesses
+                for binding in self._match(body[i], fact, {}, rule.var_types):
+                    # materialize the bindings because `_fire` extends the fact index
+                    for binding2 in list(self._join(rest, binding, rule.var_types)):
+                        fire(rule, binding2)
+
+
+def infer_theorem_assertions(mod_context_uri: str = None) -> p.RuleResult:
+    """
+    Convenience function: instantiate the assertions of all applicable theorems (see TheoremInferenceEngine)
+    """
+    return TheoremInferenceEngine(mod_context_uri=mod_context_uri).run()
+
+
 # <new_entities>
 
 # this section in the source file is helpful for bulk-insertion of new items
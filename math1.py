@@ -1,3 +1,8 @@
+import collections
+import functools
+import itertools
+import random
+import time
 from typing import Union
 import pyirk as p
 
@@ -15,6 +20,253 @@ p.start_mod(__URI__)
 # data store on module level
 ds = {}
 
+# maximum number of entries of the numerical result caches (spectral abscissas, characteristic polynomials)
+MATRIX_CACHE_MAXSIZE = 2**16
+
+
+class LRUCache(collections.OrderedDict):
+    """
+    Dict with bounded size: if more than `maxsize` entries are stored the least recently used ones are dropped (like
+    functools.lru_cache but for explicitly keyed caches, e.g. by `matrix_keys`).
+    """
+
+    def __init__(self, maxsize=128):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def set_numeric_value(item: p.Item, value):
+    """
+    Associate a concrete numerical value (scalar or numpy array, e.g. a matrix) with an item. This allows numerical
+    evaluation of operators and premises for concrete system models.
+    """
+    import numpy as np
+
+    ds.setdefault("numeric_values", {})[item.uri] = np.asarray(value)
+
+
+def get_numeric_value(item: p.Item, default=None):
+    return ds.get("numeric_values", {}).get(item.uri, default)
+
+
+def set_symbolic_value(item: p.Item, expr):
+    """
+    Associate a concrete sympy expression (e.g. a computed Lyapunov function) with an item.
+    """
+    ds.setdefault("symbolic_values", {})[item.uri] = expr
+
+
+def get_symbolic_value(item: p.Item, default=None):
+    return ds.get("symbolic_values", {}).get(item.uri, default)
+
+
+# <operator instrumentation>
+# All operators route through `create_evaluated_mapping` (as `_custom_call`-method) plus optional
+# `_custom_call_post_process`-methods. The following wrappers count these calls such that e.g. a runaway
+# construction of expressions can be spotted from outside (see `get_operator_stats`). The instrumentation is opt-in:
+# set `OPERATOR_INSTRUMENTATION.enabled = True` to activate it.
+
+
+class OperatorInstrumentation:
+    """
+    Counters and cumulative latencies per operator item (keys: uri) and an optional sampling tracer.
+    """
+
+    def __init__(self, enabled=False, sample_rate=0.0, max_samples=1000, seed=None):
+        """
+        :param enabled:         bool; if False the wrappers only forward the calls
+        :param sample_rate:     float in [0, 1]; fraction of calls which are recorded in detail (see `samples`)
+        :param max_samples:     int; only the latest samples are kept
+        :param seed:            seed for the random sampling decisions
+        """
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.max_samples = max_samples
+        self.seed = seed
+        self.reset()
+
+    def reset(self):
+        self.labels = {}
+        self.calls = collections.Counter()
+        self.created = collections.Counter()
+        self.reused = collections.Counter()
+        self.call_seconds = collections.Counter()
+        self.post_process_calls = collections.Counter()
+        self.post_process_seconds = collections.Counter()
+        self.samples = collections.deque(maxlen=self.max_samples)
+        self._rng = random.Random(self.seed)
+
+    def record_call(self, operator: p.Item, args, res: p.Item, seconds: float, created: bool):
+        uri = operator.uri
+        if uri not in self.labels:
+            self.labels[uri] = str(operator.R1__has_label)
+        self.calls[uri] += 1
+        self.call_seconds[uri] += seconds
+        if created:
+            self.created[uri] += 1
+        else:
+            self.reused[uri] += 1
+
+        if self.sample_rate and self._rng.random() < self.sample_rate:
+            self.samples.append(
+                {
+                    "timestamp": time.time(),
+                    "operator": uri,
+                    "label": self.labels[uri],
+                    "args": [getattr(arg, "uri", repr(arg)) for arg in args],
+                    "result": res.uri,
+                    "created": created,
+                    "seconds": seconds,
+                }
+            )
+
+    def record_post_process(self, operator: p.Item, seconds: float):
+        self.post_process_calls[operator.uri] += 1
+        self.post_process_seconds[operator.uri] += seconds
+
+    def as_dict(self) -> dict:
+        return {
+            uri: {
+                "label": label,
+                "calls": self.calls[uri],
+                "created": self.created[uri],
+                "reused": self.reused[uri],
+                "call_seconds": self.call_seconds[uri],
+                "post_process_calls": self.post_process_calls[uri],
+                "post_process_seconds": self.post_process_seconds[uri],
+            }
+            for uri, label in self.labels.items()
+        }
+
+    def as_prometheus_text(self, prefix="ocse_operator") -> str:
+        metrics = [
+            ("calls_total", "counter", "number of calls", self.calls),
+            ("results_created_total", "counter", "number of newly created result items", self.created),
+            ("results_reused_total", "counter", "number of already existing result items", self.reused),
+            ("call_seconds_total", "counter", "cumulative time of the calls", self.call_seconds),
+            ("post_process_calls_total", "counter", "number of post processing calls", self.post_process_calls),
+            ("post_process_seconds_total", "counter", "cumulative post processing time", self.post_process_seconds),
+        ]
+        lines = []
+        for name, metric_type, help_text, counter in metrics:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for uri, label in self.labels.items():
+                label = label.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+                lines.append(f'{prefix}_{name}{{operator="{uri}",label="{label}"}} {counter[uri]}')
+        return "\n".join(lines) + "\n"
+
+
+OPERATOR_INSTRUMENTATION = OperatorInstrumentation()
+
+
+def instrumented_evaluated_mapping(self, *args):
+    """
+    Drop-in replacement for `p.create_evaluated_mapping` (to be used as `_custom_call`-method) which records
+    the call in OPERATOR_INSTRUMENTATION.
+
+    :param self:    mapping item (to which this function will be attached)
+    :param args:    arg tuple with which the mapping is called
+    """
+    instrumentation = OPERATOR_INSTRUMENTATION
+    if not instrumentation.enabled:
+        return p.create_evaluated_mapping(self, *args)
+
+    # create_evaluated_mapping returns an existing item if the mapping was already applied to the same args; other
+    # items might be created anyway (e.g. by post processing) -> check whether the result itself is new (p.ds.items
+    # keeps the insertion order, i.e. new items are at the end)
+    n_items = len(p.ds.items)
+    t0 = time.perf_counter()
+    res = p.create_evaluated_mapping(self, *args)
+    seconds = time.perf_counter() - t0
+    new_uris = itertools.islice(reversed(p.ds.items), max(len(p.ds.items) - n_items, 0))
+    instrumentation.record_call(self, args, res, seconds, created=res.uri in new_uris)
+    return res
+
+
+def new_evaluated_mapping(mapping: p.Item, *args) -> p.Item:
+    """
+    Create the evaluated mapping `mapping(*args)` like `p.create_evaluated_mapping` (including the
+    `_custom_call_post_process`-method of the mapping) but without searching for an existing one, which takes time
+    proportional to the number of instances of the result class. Thus the caller has to ensure that the evaluated
+    mapping does not exist yet (e.g. by an index of all R35 statements).
+    """
+    arg_labels = []
+    for arg in args:
+        try:
+            arg_labels.append(arg.R1)
+        except AttributeError:
+            arg_labels.append(str(arg))
+
+    target_classes = mapping.R11__has_range_of_result
+    target_class = target_classes[0] if target_classes else p.I32["evaluated mapping"]
+
+    t0 = time.perf_counter()
+    res = p.instance_of(target_class, r1=f"{target_class.R1}: {mapping.R1}({', '.join(arg_labels)})")
+    res.set_relation(p.R35["is applied mapping of"], mapping)
+    res.set_relation(p.R36["has argument tuple"], p.new_tuple(*args))
+    res.add_method(p.builtin_entities.get_arguments, "get_arguments")
+    res.finalize()
+    if OPERATOR_INSTRUMENTATION.enabled:
+        OPERATOR_INSTRUMENTATION.record_call(mapping, args, res, time.perf_counter() - t0, created=True)
+
+    if post_process := getattr(mapping, "_custom_call_post_process", None):
+        res = post_process(res, *args)
+    return res
+
+
+def instrument_post_process(func):
+    """
+    Decorator for `_custom_call_post_process`-functions which records their latency in OPERATOR_INSTRUMENTATION.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, res, *args, **kwargs):
+        instrumentation = OPERATOR_INSTRUMENTATION
+        if not instrumentation.enabled:
+            return func(self, res, *args, **kwargs)
+        t0 = time.perf_counter()
+        res = func(self, res, *args, **kwargs)
+        instrumentation.record_post_process(self, time.perf_counter() - t0)
+        return res
+
+    return wrapper
+
+
+def get_operator_stats(format="dict", reset=False):
+    """
+    :param format:  "dict" (keys: operator uris) or "prometheus" (text exposition format)
+    :param reset:   bool; reset all counters after reading them
+
+    :return:        dict or str
+    """
+    if format == "dict":
+        res = OPERATOR_INSTRUMENTATION.as_dict()
+    elif format == "prometheus":
+        res = OPERATOR_INSTRUMENTATION.as_prometheus_text()
+    else:
+        msg = f"unknown format: {format}"
+        raise ValueError(msg)
+    if reset:
+        OPERATOR_INSTRUMENTATION.reset()
+    return res
+
+# </operator instrumentation>
+
 
 I5000 = p.create_item(
     R1__has_label="scalar zero",
@@ -39,7 +291,7 @@ I4895 = p.create_item(
 )
 
 # make all instances of operators callable:
-I4895["mathematical operator"].add_method(p.create_evaluated_mapping, "_custom_call")
+I4895["mathematical operator"].add_method(instrumented_evaluated_mapping, "_custom_call")
 
 
 I9904 = p.create_item(
@@ -71,7 +323,7 @@ I3240 = p.create_item(
     ),
 )
 
-I3240["matrix element"].add_method(p.create_evaluated_mapping, "_custom_call")
+I3240["matrix element"].add_method(instrumented_evaluated_mapping, "_custom_call")
 
 
 I9192 = p.create_item(
@@ -493,6 +745,7 @@ I3263 = p.create_item(
     R11__has_range_of_result=I9904["matrix"],
 )
 
+@instrument_post_process
 def I3263_cc_pp(self, res: p.Item, *args, **kwargs):
     """
     :param self:    mapping item (to which this function will be attached)
@@ -562,7 +815,7 @@ I4237 = p.create_item(
     R3__is_subclass_of=I1063["scalar function"],
 )
 
-I4237["monovariate rational function"].add_method(p.create_evaluated_mapping, "_custom_call")
+I4237["monovariate rational function"].add_method(instrumented_evaluated_mapping, "_custom_call")
 
 I6209 = p.create_item(
     R1__has_label="scalneg",
@@ -581,6 +834,296 @@ I4239 = p.create_item(
 )
 
 
+# numerical polynomial kernel: multivariate polynomials as exponent arrays with coefficient vectors
+# (sympy is only used for conversion at the boundary)
+
+
+@functools.lru_cache(maxsize=None)
+def monomial_exponents(n, degree):
+    """
+    :return:    read-only int array of shape (k, n) with all exponent rows of total degree `degree`
+                (lexicographically descending)
+    """
+    import numpy as np
+
+    def rows(n, degree):
+        if n == 1:
+            return [(degree,)]
+        return [(k, *rest) for k in range(degree, -1, -1) for rest in rows(n - 1, degree - k)]
+
+    res = np.array(rows(n, degree), dtype=int).reshape(-1, n)
+    res.flags.writeable = False
+    return res
+
+
+@functools.lru_cache(maxsize=None)
+def monomial_basis(n, degree):
+    """
+    :return:    read-only int array of shape (k, n) with all exponent rows of total degree <= `degree`
+                (ascending degree, starting with the constant monomial)
+    """
+    import numpy as np
+
+    res = np.concatenate([monomial_exponents(n, d)[::-1] for d in range(degree + 1)])
+    res.flags.writeable = False
+    return res
+
+
+def monomial_positions(exponents, basis):
+    """
+    :param exponents:   int array of shape (k, n)
+    :param basis:       int array of shape (m, n) (unique rows)
+    :return:            int array of shape (k,) with the row index of every exponent row in `basis` (-1 if missing)
+    """
+    import numpy as np
+
+    exponents = np.asarray(exponents, dtype=int)
+    basis = np.asarray(basis, dtype=int)
+    if len(exponents) == 0 or len(basis) == 0:
+        return np.full(len(exponents), -1)
+
+    radix = int(max(exponents.max(), basis.max())) + 1
+    if min(exponents.min(), basis.min()) < 0 or radix ** basis.shape[1] > np.iinfo(np.int64).max:
+        # the codes below would overflow -> compare the rows (slower)
+        _, inverse = np.unique(np.concatenate([basis, exponents]), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        positions = np.full(inverse.max() + 1, -1)
+        positions[inverse[: len(basis)]] = np.arange(len(basis))
+        return positions[inverse[len(basis) :]]
+
+    # encode every exponent row as integer (mixed radix)
+    weights = radix ** np.arange(basis.shape[1], dtype=np.int64)
+    basis_codes = basis @ weights
+    codes = exponents @ weights
+    order = np.argsort(basis_codes)
+    idcs = np.minimum(np.searchsorted(basis_codes, codes, sorter=order), len(basis) - 1)
+    res = order[idcs]
+    res[basis_codes[res] != codes] = -1
+    return res
+
+
+class SparsePolynomial:
+    """
+    Multivariate polynomial sum_j c_j x^(e_j) represented by an int array of exponents (shape (k, n)) and a coefficient
+    vector (shape (k,)). Instances are kept in canonical form (unique exponent rows, no zero coefficients).
+    """
+
+    def __init__(self, exponents, coeffs, n=None):
+        import numpy as np
+
+        coeffs = np.asarray(coeffs)
+        if not np.iscomplexobj(coeffs):
+            coeffs = coeffs.astype(float)
+        exponents = np.asarray(exponents, dtype=int)
+        if n is None:
+            n = exponents.shape[1]
+        exponents = exponents.reshape(-1, n)
+
+        if len(exponents) > 1:
+            exponents, inverse = np.unique(exponents, axis=0, return_inverse=True)
+            summed = np.zeros(len(exponents), dtype=coeffs.dtype)
+            np.add.at(summed, inverse.ravel(), coeffs)
+            coeffs = summed
+        nonzero = coeffs != 0
+        self.exponents = exponents[nonzero]
+        self.coeffs = coeffs[nonzero]
+        self.n = n
+
+    @classmethod
+    def zero(cls, n):
+        return cls([], [], n=n)
+
+    @classmethod
+    def from_dict(cls, terms, n):
+        """
+        :param terms:   dict {exponent_tuple: coeff}
+        """
+        return cls(list(terms.keys()), list(terms.values()), n=n)
+
+    @classmethod
+    def from_sympy(cls, expr, x):
+        import sympy as sp
+
+        terms = sp.Poly(expr, *x).terms()
+        coeffs = [complex(c) if not c.is_real else float(c) for _, c in terms]
+        return cls([e for e, _ in terms], coeffs, n=len(x))
+
+    def to_dict(self):
+        return {tuple(int(k) for k in e): c for e, c in zip(self.exponents, self.coeffs.tolist())}
+
+    def to_sympy(self, x):
+        import sympy as sp
+
+        return sp.Add(*[c * sp.Mul(*[xi**int(k) for xi, k in zip(x, e)]) for e, c in zip(self.exponents, self.coeffs)])
+
+    def to_dense_coeffs(self):
+        """
+        :return:    coefficients in descending order (like numpy.polyval) (only for n == 1)
+        """
+        import numpy as np
+
+        assert self.n == 1
+        res = np.zeros(max(self.degree, 0) + 1, dtype=self.coeffs.dtype)
+        res[self.degree - self.exponents[:, 0]] = self.coeffs
+        return res
+
+    @property
+    def degree(self):
+        """
+        total degree (-1 for the zero polynomial)
+        """
+        return int(self.exponents.sum(axis=1).max(initial=-1))
+
+    def is_homogeneous(self):
+        import numpy as np
+
+        return len(np.unique(self.exponents.sum(axis=1))) <= 1
+
+    def homogeneous_part(self, degree):
+        mask = self.exponents.sum(axis=1) == degree
+        return SparsePolynomial(self.exponents[mask], self.coeffs[mask], n=self.n)
+
+    def homogeneous_parts(self):
+        """
+        :return:    dict {degree: SparsePolynomial} (only for degrees with nonzero part)
+        """
+        import numpy as np
+
+        return {int(d): self.homogeneous_part(d) for d in np.unique(self.exponents.sum(axis=1))}
+
+    def derivative(self, i):
+        mask = self.exponents[:, i] > 0
+        exponents = self.exponents[mask].copy()
+        coeffs = self.coeffs[mask] * exponents[:, i]
+        exponents[:, i] -= 1
+        return SparsePolynomial(exponents, coeffs, n=self.n)
+
+    def gradient_dot(self, F):
+        """
+        :param F:   sequence of n SparsePolynomial objects (vector field)
+        :return:    grad(self) · F (i.e. the Lie derivative along F)
+        """
+        res = SparsePolynomial.zero(self.n)
+        for i, Fi in enumerate(F):
+            if len(Fi.coeffs) and (self.exponents[:, i] > 0).any():
+                res = res + self.derivative(i) * Fi
+        return res
+
+    def coefficient_vector(self, basis):
+        """
+        :param basis:   int array of shape (m, n) (must contain all exponents of self)
+        :return:        array of shape (m,)
+        """
+        import numpy as np
+
+        positions = monomial_positions(self.exponents, basis)
+        if (positions < 0).any():
+            msg = "basis does not contain all monomials of the polynomial"
+            raise ValueError(msg)
+        res = np.zeros(len(basis), dtype=self.coeffs.dtype)
+        res[positions] = self.coeffs
+        return res
+
+    def evaluate(self, X):
+        """
+        :param X:   array of shape (N, n)
+        :return:    array of shape (N,)
+        """
+        import numpy as np
+
+        X = np.atleast_2d(np.asarray(X))
+        return np.prod(X[:, np.newaxis, :] ** self.exponents[np.newaxis, :, :], axis=2) @ self.coeffs
+
+    def __add__(self, other):
+        import numpy as np
+
+        if not isinstance(other, SparsePolynomial):
+            other = SparsePolynomial([[0] * self.n], [other], n=self.n)
+        return SparsePolynomial(
+            np.concatenate([self.exponents, other.exponents]), np.concatenate([self.coeffs, other.coeffs]), n=self.n
+        )
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return SparsePolynomial(self.exponents, -self.coeffs, n=self.n)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if not isinstance(other, SparsePolynomial):
+            return SparsePolynomial(self.exponents, self.coeffs * other, n=self.n)
+        exponents = self.exponents[:, None, :] + other.exponents[None, :, :]
+        coeffs = self.coeffs[:, None] * other.coeffs[None, :]
+        return SparsePolynomial(exponents.reshape(-1, self.n), coeffs.ravel(), n=self.n)
+
+    __rmul__ = __mul__
+
+    def __len__(self):
+        return len(self.coeffs)
+
+    def __repr__(self):
+        return f"<SparsePolynomial (n={self.n}, {len(self)} terms, degree {self.degree})>"
+
+
+def lie_derivative_matrix(F, basis, target_basis):
+    """
+    Sparse matrix of the linear map p -> grad(p) · F from span(basis) to span(target_basis).
+
+    :param F:   sequence of n SparsePolynomial objects (vector field)
+    :return:    scipy.sparse.csc_matrix of shape (len(target_basis), len(basis))
+    """
+    import numpy as np
+
+    basis = np.asarray(basis, dtype=int)
+    columns = np.arange(len(basis))
+    rows, cols, data = [], [], []
+    for i, Fi in enumerate(F):
+        mask = basis[:, i] > 0
+        if not mask.any() or len(Fi) == 0:
+            continue
+        # d/dx_i x^alpha = alpha_i x^(alpha - e_i), multiplied with all terms of F_i at once
+        reduced = basis[mask].copy()
+        reduced[:, i] -= 1
+        exponents = reduced[:, None, :] + Fi.exponents[None, :, :]
+        values = basis[mask, i][:, None] * Fi.coeffs[None, :]
+        rows.append(monomial_positions(exponents.reshape(-1, basis.shape[1]), target_basis))
+        cols.append(np.repeat(columns[mask], len(Fi)))
+        data.append(values.ravel())
+    return _assemble_operator_matrix(rows, cols, data, (len(target_basis), len(basis)))
+
+
+def multiplication_matrix(q, basis, target_basis):
+    """
+    Sparse matrix of the linear map p -> q·p from span(basis) to span(target_basis).
+    """
+    import numpy as np
+
+    basis = np.asarray(basis, dtype=int)
+    exponents = basis[:, None, :] + q.exponents[None, :, :]
+    rows = monomial_positions(exponents.reshape(-1, basis.shape[1]), target_basis)
+    cols = np.repeat(np.arange(len(basis)), len(q))
+    data = np.tile(q.coeffs, len(basis))
+    return _assemble_operator_matrix([rows], [cols], [data], (len(target_basis), len(basis)))
+
+
+def _assemble_operator_matrix(rows, cols, data, shape):
+    import numpy as np
+    import scipy.sparse
+
+    if not rows:
+        return scipy.sparse.csc_matrix(shape)
+    rows, cols, data = np.concatenate(rows), np.concatenate(cols), np.concatenate(data)
+    if (rows < 0).any():
+        msg = "target basis does not contain all monomials of the image"
+        raise ValueError(msg)
+    return scipy.sparse.csc_matrix((data, (rows, cols)), shape=shape)
+
+
 R1757 = p.create_relation(
     R1__has_label="has set of roots",
     R2__has_description="set of roots for a monovariate function",
@@ -639,6 +1182,93 @@ with I1594["Stodolas necessary condition for polynomial coefficients"].scope("as
     cm.new_math_relation(lhs=I5807["sign"](cm.c1), rsgn="==", rhs=I5807["sign"](cm.c2))
 
 
+# numerical evaluation of polynomial coefficients (vectorized over many polynomials)
+
+
+def _as_coeff_array(coeffs):
+    """
+    :param coeffs:  array-like of shape (N, n+1) (or (n+1,) for a single polynomial); every row contains the
+                    coefficients of a polynomial of degree n in descending order (a_n, ..., a_1, a_0),
+                    like in `numpy.polyval`
+    """
+    import numpy as np
+
+    coeffs = np.atleast_2d(np.asarray(coeffs, dtype=float))
+    assert coeffs.ndim == 2, f"unexpected shape of coefficient array: {coeffs.shape}"
+    return coeffs
+
+
+def stodola_mask(coeffs):
+    """
+    Evaluate Stodolas necessary condition (see I1594) for a batch of polynomials.
+
+    :param coeffs:  array-like of shape (N, n+1) (see `_as_coeff_array`)
+    :return:        bool array of shape (N,); True for rows where all coefficients are nonzero and have the same sign
+    """
+    import numpy as np
+
+    coeffs = _as_coeff_array(coeffs)
+    signs = np.sign(coeffs)
+    return np.all(signs == signs[:, :1], axis=1) & (signs[:, 0] != 0)
+
+
+def routh_hurwitz_mask(coeffs):
+    """
+    Evaluate the Routh-Hurwitz criterion for a batch of polynomials, i.e. decide whether all roots are located
+    in I2739["open left half plane"].
+
+    The Routh table is computed for all rows simultaneously. Rows which violate Stodolas necessary condition are
+    sorted out beforehand. A zero in the first column of the Routh table means "not Hurwitz".
+
+    :param coeffs:  array-like of shape (N, n+1) (see `_as_coeff_array`)
+    :return:        bool array of shape (N,)
+    """
+    import numpy as np
+
+    coeffs = _as_coeff_array(coeffs)
+    N, n_coeffs = coeffs.shape
+    degree = n_coeffs - 1
+
+    mask = stodola_mask(coeffs)
+    idcs = np.flatnonzero(mask)
+    if degree < 2 or len(idcs) == 0:
+        # for degree <= 1 the necessary condition is also sufficient
+        return mask
+
+    # normalize such that the leading coefficient is 1 (all entries of the first Routh column must be positive)
+    c = coeffs[idcs] / coeffs[idcs, :1]
+
+    width = (n_coeffs + 1) // 2
+    row0 = c[:, 0::2]
+    row1 = np.zeros_like(row0)
+    row1[:, :n_coeffs // 2] = c[:, 1::2]
+
+    sub_mask = np.ones(len(idcs), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(degree):
+            sub_mask &= row1[:, 0] > 0
+            row2 = np.zeros((len(idcs), width))
+            row2[:, :-1] = row0[:, 1:] - row0[:, :1] / row1[:, :1] * row1[:, 1:]
+            row0, row1 = row1, row2
+
+    mask[idcs] = sub_mask
+    return mask
+
+
+def I1594_check_coefficients(self, coeffs):
+    """
+    :param self:    theorem item (to which this function will be attached)
+    :param coeffs:  array-like of shape (N, n+1) (see `_as_coeff_array`)
+    :return:        bool array of shape (N,) (see `stodola_mask`)
+    """
+    return stodola_mask(coeffs)
+
+
+I1594["Stodolas necessary condition for polynomial coefficients"].add_method(
+    I1594_check_coefficients, "check_coefficients"
+)
+
+
 I4240 = p.create_item(
     R1__has_label="matrix polynomial",
     R2__has_description="monovariate polynomial of quadratic matrices",
@@ -681,6 +1311,7 @@ I6324 = p.create_item(
 )
 
 
+@instrument_post_process
 def I6324_cc_pp(self, res, *args, **kwargs):
     """
     :param self:    mapping item (to which this function will be attached)
@@ -709,6 +1340,7 @@ I5359 = p.create_item(
 )
 
 
+@instrument_post_process
 def I5359_cc_pp(self, res, *args, **kwargs):
     """
     Function which will be attached as custom-call-post-process-method to I5359["determinant"].
@@ -770,6 +1402,167 @@ with I1373["definition of set of eigenvalues of a matrix"].scope("premise") as c
 with I1373["definition of set of eigenvalues of a matrix"].scope("assertion") as cm:
     cm.new_equation(I9160["set of eigenvalues of a matrix"](cm.A), cm.r)
 
+
+# numerical evaluation of eigenvalues (vectorized over many matrices)
+
+
+def matrix_hash(M) -> str:
+    """
+    Return a hash string of a numerical matrix (depends on shape, dtype and data)
+    """
+    import hashlib
+    import numpy as np
+
+    M = np.ascontiguousarray(M)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{M.shape}{M.dtype.str}".encode())
+    h.update(M.tobytes())
+    return h.hexdigest()
+
+
+# matrices up to this size (in bytes) are represented by their data in the result caches (see `matrix_keys`)
+MATRIX_KEY_MAX_BYTES = 256
+
+
+def matrix_keys(matrices) -> list:
+    """
+    Return hashable cache keys (bytes) for a stack of matrices (shape (N, n, n)) without hashing every matrix in python:
+    small matrices are represented by their data (one vectorized conversion for the whole stack), larger ones by a
+    blake2b digest (then the per-matrix overhead is small compared to the numerical computation).
+    """
+    import hashlib
+    import numpy as np
+
+    matrices = np.ascontiguousarray(matrices, dtype=float)
+    N = matrices.shape[0]
+    matrix_bytes = matrices[0].nbytes if N else 0
+    if matrix_bytes == 0:
+        return [b""] * N
+    if matrix_bytes <= MATRIX_KEY_MAX_BYTES:
+        return matrices.reshape(N, -1).view(np.dtype((np.void, matrix_bytes))).ravel().tolist()
+    return [hashlib.blake2b(M.tobytes(), digest_size=16).digest() for M in matrices]
+
+
+def _get_result_cache(name: str) -> LRUCache:
+    # (the cache is only constructed if it does not exist yet)
+    if (cache := ds.get(name)) is None:
+        cache = ds[name] = LRUCache(MATRIX_CACHE_MAXSIZE)
+    return cache
+
+
+def _matrix_stack(matrices):
+    """
+    :param matrices:    one of the following:
+                        - array-like of shape (N, n, n) or (n, n)
+                        - path (str) of a .npy-file containing such an array (will be memory-mapped)
+                        - sequence of items with associated numerical values (see `set_numeric_value`)
+    """
+    import numpy as np
+
+    if isinstance(matrices, str):
+        matrices = np.load(matrices, mmap_mode="r")
+    elif isinstance(matrices, (list, tuple)) and matrices and isinstance(matrices[0], p.Item):
+        values = [get_numeric_value(itm) for itm in matrices]
+        if any(v is None for v in values):
+            msg = "at least one item has no associated numerical value (see `set_numeric_value`)"
+            raise p.aux.PyIRKError(msg)
+        matrices = np.array(values, dtype=float)
+    elif not isinstance(matrices, np.ndarray):
+        matrices = np.asarray(matrices, dtype=float)
+
+    if matrices.ndim == 2:
+        matrices = matrices[np.newaxis, :, :]
+    assert matrices.ndim == 3 and matrices.shape[1] == matrices.shape[2], f"unexpected shape: {matrices.shape}"
+    return matrices
+
+
+def spectral_abscissas(matrices, chunk_size=10000):
+    """
+    Compute the spectral abscissa (maximum real part of all eigenvalues) for a stack of square matrices.
+
+    The matrices are processed in chunks (such that memory-mapped files of arbitrary size can be used). Results are
+    cached by `matrix_keys`; only matrices which are not yet in the cache are passed to the eigenvalue solver.
+
+    :param matrices:    see `_matrix_stack`
+    :param chunk_size:  number of matrices which are processed at once
+    :return:            float array of shape (N,)
+    """
+    import numpy as np
+
+    matrices = _matrix_stack(matrices)
+    cache = _get_result_cache("spectral_abscissa_cache")
+    N = matrices.shape[0]
+    res = np.empty(N)
+
+    for start in range(0, N, chunk_size):
+        chunk = np.asarray(matrices[start:start + chunk_size], dtype=float)
+        hashes = matrix_keys(chunk)
+        # (the results of this chunk are collected separately because the cache might drop them)
+        values = {h: cache[h] for h in hashes if h in cache}
+        missing = [i for i, h in enumerate(hashes) if h not in values]
+        if missing:
+            abscissas = np.linalg.eigvals(chunk[missing]).real.max(axis=1)
+            for i, value in zip(missing, abscissas):
+                values[hashes[i]] = cache[hashes[i]] = float(value)
+        res[start:start + len(chunk)] = [values[h] for h in hashes]
+
+    return res
+
+
+def olhp_mask(matrices, chunk_size=10000):
+    """
+    Decide for a stack of matrices whether I9160["set of eigenvalues of a matrix"] is a subset of
+    I2739["open left half plane"].
+
+    :param matrices:    see `_matrix_stack`
+    :return:            bool array of shape (N,)
+    """
+    return spectral_abscissas(matrices, chunk_size=chunk_size) < 0
+
+
+def decide_eigenvalues_in_olhp(set_item: p.Item):
+    """
+    Decide the premise `set_item R14__is_subset_of I2739["open left half plane"]` numerically, where `set_item` is an
+    evaluated mapping I9160["set of eigenvalues of a matrix"](A) and A has an associated numerical value.
+
+    :return:    True, False or None (if the premise cannot be decided numerically)
+    """
+    if set_item.R35__is_applied_mapping_of != I9160["set of eigenvalues of a matrix"]:
+        return None
+    (matrix_item,) = set_item.R36__has_argument_tuple.R39__has_element
+    return decide_matrix_eigenvalues_in_olhp(matrix_item)
+
+
+def decide_matrix_eigenvalues_in_olhp(matrix_item: p.Item):
+    """
+    Like `decide_eigenvalues_in_olhp` but for the matrix A itself (i.e. the evaluated mapping does not need to exist).
+
+    :return:    True, False or None (if A has no associated numerical value)
+    """
+    if (value := get_numeric_value(matrix_item)) is None:
+        return None
+    return bool(olhp_mask(value)[0])
+
+
+def I9160_spectral_abscissas(self, matrices, chunk_size=10000):
+    """
+    :param self:        operator item (to which this function will be attached)
+    :param matrices:    see `_matrix_stack`
+    """
+    return spectral_abscissas(matrices, chunk_size=chunk_size)
+
+
+def I2739_contains_eigenvalues(self, matrices, chunk_size=10000):
+    """
+    :param self:        set item (to which this function will be attached)
+    :param matrices:    see `_matrix_stack`
+    """
+    return olhp_mask(matrices, chunk_size=chunk_size)
+
+
+I9160["set of eigenvalues of a matrix"].add_method(I9160_spectral_abscissas, "spectral_abscissas")
+I2739["open left half plane"].add_method(I2739_contains_eigenvalues, "contains_eigenvalues")
+
 # TODO: relate/unify this with R3668__has_sequence_of_coefficients
 I3058 = p.create_item(
     R1__has_label="coefficients of characteristic polynomial",
@@ -871,6 +1664,179 @@ with I3749["Cayley-Hamilton theorem"].scope("assertion") as cm:
 # </theorem>
 
 
+# numerical evaluation of characteristic polynomials (vectorized over many matrices)
+
+# for n <= this value the Faddeev-LeVerrier algorithm is used by default (otherwise Hessenberg-based recursion)
+CHARPOLY_LEVERRIER_MAX_DIM = 8
+
+
+def _charpoly_leverrier(A):
+    """
+    Faddeev-LeVerrier algorithm for a stack of matrices (only matrix products, no divisions apart from 1/k)
+
+    :param A:   array of shape (N, n, n)
+    :return:    array of shape (N, n+1) (coefficients in descending order, leading coefficient 1)
+    """
+    import numpy as np
+
+    N, n, _ = A.shape
+    coeffs = np.zeros((N, n + 1))
+    coeffs[:, 0] = 1
+    eye = np.eye(n)
+    M = np.zeros_like(A)
+    for k in range(1, n + 1):
+        M = A @ M + coeffs[:, k - 1, np.newaxis, np.newaxis] * eye
+        coeffs[:, k] = -np.trace(A @ M, axis1=1, axis2=2) / k
+    return coeffs
+
+
+def _charpoly_hessenberg(A):
+    """
+    Reduce every matrix to upper Hessenberg form H and apply the recursion
+
+        p_k(s) = (s - h_kk) p_{k-1}(s) - sum_{i<k} h_ik (h_{i+1,i} ... h_{k,k-1}) p_{i-1}(s)
+
+    for all matrices simultaneously.
+
+    :param A:   array of shape (N, n, n)
+    :return:    array of shape (N, n+1) (coefficients in descending order, leading coefficient 1)
+    """
+    import numpy as np
+    import scipy.linalg
+
+    N, n, _ = A.shape
+    H = np.array([scipy.linalg.hessenberg(M) for M in A])
+
+    # polys[k] contains the ascending coefficients of p_k (shape (N, n+1))
+    polys = np.zeros((n + 1, N, n + 1))
+    polys[0, :, 0] = 1
+    for k in range(1, n + 1):
+        # (s - h_kk) p_{k-1}
+        polys[k, :, 1:] = polys[k - 1, :, :-1]
+        polys[k] -= H[:, k - 1, k - 1, np.newaxis] * polys[k - 1]
+
+        beta = np.ones(N)
+        for i in range(k - 1, 0, -1):
+            beta = beta * H[:, i, i - 1]
+            polys[k] -= (H[:, i - 1, k - 1] * beta)[:, np.newaxis] * polys[i - 1]
+
+    return polys[n, :, ::-1]
+
+
+def charpoly_coeffs(matrices, method="auto", use_cache=True):
+    """
+    Compute the coefficients of the characteristic polynomial det(s·I - A) for a stack of matrices.
+    Results are cached by `matrix_keys`.
+
+    :param matrices:    see `_matrix_stack`
+    :param method:      "leverrier", "hessenberg" or "auto" (depending on CHARPOLY_LEVERRIER_MAX_DIM)
+    :param use_cache:   bool; False for one-off matrices (e.g. for verification) which would only displace the
+                        cached results of other matrices
+    :return:            array of shape (N, n+1) (coefficients in descending order like in `numpy.polyval`)
+    """
+    import numpy as np
+
+    matrices = _matrix_stack(matrices)
+    N, n, _ = matrices.shape
+    if method == "auto":
+        method = "leverrier" if n <= CHARPOLY_LEVERRIER_MAX_DIM else "hessenberg"
+    algorithms = {"leverrier": _charpoly_leverrier, "hessenberg": _charpoly_hessenberg}
+    if method not in algorithms:
+        msg = f"unknown method: {method}. Expected one of {list(algorithms)} or 'auto'."
+        raise ValueError(msg)
+
+    matrices = np.asarray(matrices, dtype=float)
+    if not use_cache:
+        return algorithms[method](matrices).reshape(N, n + 1)
+
+    cache = _get_result_cache("charpoly_cache")
+    keys = [(method, key) for key in matrix_keys(matrices)]
+    rows = {key: cache[key] for key in keys if key in cache}
+    missing = [i for i, key in enumerate(keys) if key not in rows]
+    if missing:
+        for i, row in zip(missing, algorithms[method](matrices[missing])):
+            rows[keys[i]] = cache[keys[i]] = row
+    return np.array([rows[key] for key in keys]).reshape(N, n + 1)
+
+
+def evaluate_matrix_polynomials(coeffs, matrices):
+    """
+    Evaluate polynomials at matrices (Horner scheme): sum_k c_k A^(d-k).
+
+    :param coeffs:      array of shape (N, d+1) (descending order like in `numpy.polyval`)
+    :param matrices:    array of shape (N, n, n)
+    :return:            array of shape (N, n, n)
+    """
+    import numpy as np
+
+    eye = np.eye(matrices.shape[-1])
+    R = np.zeros_like(matrices)
+    for k in range(coeffs.shape[1]):
+        R = R @ matrices + coeffs[:, k, np.newaxis, np.newaxis] * eye
+    return R
+
+
+def cayley_hamilton_residuals(matrices, coeffs=None):
+    """
+    Numerical test oracle for I3749["Cayley-Hamilton theorem"]: evaluate the characteristic polynomial at the
+    matrix itself (Horner scheme) and return the relative residual ||P(A)|| / max(1, ||A||^n) for every matrix.
+
+    :param matrices:    see `_matrix_stack`
+    :param coeffs:      optional array of shape (N, n+1) (default: result of `charpoly_coeffs`)
+    """
+    import numpy as np
+
+    matrices = np.asarray(_matrix_stack(matrices), dtype=float)
+    N, n, _ = matrices.shape
+    if coeffs is None:
+        coeffs = charpoly_coeffs(matrices)
+
+    R = evaluate_matrix_polynomials(coeffs, matrices)
+    scale = np.maximum(1, np.linalg.norm(matrices, axis=(1, 2)) ** n)
+    return np.linalg.norm(R, axis=(1, 2)) / scale
+
+
+def I3058_evaluate_numerically(self, matrices, method="auto"):
+    """
+    :param self:        operator item (to which this function will be attached)
+    :param matrices:    see `_matrix_stack`
+    """
+    return charpoly_coeffs(matrices, method=method)
+
+
+def I5359_evaluate_numerically(self, arg):
+    """
+    :param self:    determinant operator item (to which this function will be attached)
+    :param arg:     either a stack of matrices (see `_matrix_stack`) or an evaluated mapping
+                    I6324["canonical first order monic polynomial matrix"](A, s) where A has a numerical value
+
+    :return:        determinants (shape (N,)) or, in case of sI - A, the coefficients of the characteristic polynomial
+                    (shape (n+1,))
+    """
+    import numpy as np
+
+    if isinstance(arg, p.Item):
+        if arg.R35__is_applied_mapping_of == I6324["canonical first order monic polynomial matrix"]:
+            matrix_item, _ = arg.R36__has_argument_tuple.R39__has_element
+            return charpoly_coeffs([matrix_item])[0]
+        arg = [arg]
+    return np.linalg.det(_matrix_stack(arg))
+
+
+def I3749_verify_numerically(self, matrices, tol=1e-8):
+    """
+    :param self:        theorem item (to which this function will be attached)
+    :param matrices:    see `_matrix_stack`
+    :return:            bool array of shape (N,) (True if the Cayley-Hamilton residual is smaller than `tol`)
+    """
+    return cayley_hamilton_residuals(matrices) < tol
+
+
+I3058["coefficients of characteristic polynomial"].add_method(I3058_evaluate_numerically, "evaluate_numerically")
+I5359["determinant"].add_method(I5359_evaluate_numerically, "evaluate_numerically")
+I3749["Cayley-Hamilton theorem"].add_method(I3749_verify_numerically, "verify_numerically")
+
+
 
 I7559 = p.create_item(
     R1__has_label="cardinality",
@@ -889,6 +1855,19 @@ I3589 = p.create_item(
     R11__has_range_of_result=p.I38["non-negative integer"],
 )
 
+
+def I3589_compute(self, poly, x=None):
+    """
+    :param self:    operator item (to which this function will be attached)
+    :param poly:    SparsePolynomial or sympy expression (then `x` is required)
+    """
+    if not isinstance(poly, SparsePolynomial):
+        poly = SparsePolynomial.from_sympy(poly, x)
+    return poly.degree
+
+
+I3589["monovariate polynomial degree"].add_method(I3589_compute, "compute")
+
 I9628 = p.create_item(
     R1__has_label="theorem on the number of roots of a polynomial",
     R2__has_description=(
@@ -1179,6 +2158,21 @@ I1778 = p.create_item(
     R78__is_applicable_to=I1060["general function"],
 )
 
+
+def I1778_check_polynomials(self, polys, x=None):
+    """
+    :param self:    property item (to which this function will be attached)
+    :param polys:   sequence of SparsePolynomial objects or sympy expressions (then `x` is required)
+    :return:        bool array (True if the polynomial is homogeneous)
+    """
+    import numpy as np
+
+    polys = [poly if isinstance(poly, SparsePolynomial) else SparsePolynomial.from_sympy(poly, x) for poly in polys]
+    return np.array([poly.is_homogeneous() for poly in polys], dtype=bool)
+
+
+I1778["homogeneity"].add_method(I1778_check_polynomials, "check_polynomials")
+
 I4864 = p.create_item(
     R1__has_label="infinity class",
     R2__has_description="class for typechecking of infinity-object",
@@ -1226,6 +2220,7 @@ I9489 = p.create_item(
     R18__has_usage_hint="Use this operator to convert to matrix, then use matmul, matadd etc.",
 )
 
+@instrument_post_process
 def I9489_cc_pp(self, res: p.Item, *args, **kwargs):
     """
     :param self:    mapping item (to which this function will be attached)
@@ -1261,6 +2256,7 @@ I1284 = p.create_item(
 )
 
 
+@instrument_post_process
 def I1284_cc_pp(self, res: p.Item, *args, **kwargs):
     """
     :param self:    mapping item (to which this function will be attached)
@@ -1309,6 +2305,120 @@ I7481 = p.create_item(
     R11__has_range_of_result=I9906["square matrix"],
 )
 
+
+class JacobianEvaluator:
+    """
+    Symbolic Jacobian of a concrete vector field (sympy expressions) together with its sparsity pattern and a
+    compiled function which evaluates only the structurally nonzero entries for many points at once.
+    """
+
+    def __init__(self, F, x, params=()):
+        import numpy as np
+        import sympy as sp
+
+        self.F = sp.Matrix(F)
+        self.x = tuple(x)
+        self.params = tuple(params)
+        self.shape = (len(self.F), len(self.x))
+        self.jacobian = self.F.jacobian(self.x)
+
+        m, n = self.shape
+        index_pairs = [(i, j) for i in range(m) for j in range(n) if self.jacobian[i, j] != 0]
+        self.rows = np.array([i for i, _ in index_pairs], dtype=int)
+        self.cols = np.array([j for _, j in index_pairs], dtype=int)
+        exprs = [self.jacobian[i, j] for i, j in index_pairs]
+        self._func = sp.lambdify([*self.x, *self.params], exprs, modules="numpy")
+
+    @property
+    def nnz(self):
+        return len(self.rows)
+
+    @property
+    def pattern(self):
+        """
+        boolean sparse matrix of structurally nonzero entries
+        """
+        import numpy as np
+        import scipy.sparse
+
+        return scipy.sparse.csr_matrix((np.ones(self.nnz, dtype=bool), (self.rows, self.cols)), shape=self.shape)
+
+    def values(self, X, *param_values):
+        """
+        :param X:   array of shape (N, n) (operating points)
+        :return:    array of shape (N, nnz) (values of the nonzero entries in the order of `self.rows`, `self.cols`)
+        """
+        import numpy as np
+
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        if self.nnz == 0:
+            return np.zeros((X.shape[0], 0))
+        values = self._func(*X.T, *param_values)
+        # constant entries are returned as scalars -> broadcast them to the number of points
+        return np.stack([np.broadcast_to(v, X.shape[:1]) for v in values], axis=1)
+
+    def dense(self, X, *param_values):
+        """
+        :return:    array of shape (N, m, n)
+        """
+        import numpy as np
+
+        values = self.values(X, *param_values)
+        res = np.zeros((values.shape[0], *self.shape))
+        res[:, self.rows, self.cols] = values
+        return res
+
+    def sparse(self, X, *param_values):
+        """
+        :return:    list of N scipy.sparse.csr_matrix objects
+        """
+        import scipy.sparse
+
+        return [
+            scipy.sparse.csr_matrix((row, (self.rows, self.cols)), shape=self.shape)
+            for row in self.values(X, *param_values)
+        ]
+
+
+# maps (F, x, params) to JacobianEvaluator objects
+JACOBIAN_EVALUATOR_CACHE = LRUCache(maxsize=128)
+
+
+def get_jacobian_evaluator(F, x, params=()):
+    import sympy as sp
+
+    key = (tuple(sp.sympify(fi) for fi in F), tuple(x), tuple(params))
+    evaluator = JACOBIAN_EVALUATOR_CACHE.get(key)
+    if evaluator is None:
+        evaluator = JACOBIAN_EVALUATOR_CACHE[key] = JacobianEvaluator(*key)
+    return evaluator
+
+
+def I7481_compute(self, F, x):
+    """
+    :param self:    operator item (to which this function will be attached)
+    :param F:       sequence of sympy expressions (vector field)
+    :param x:       sequence of sympy symbols (coordinates)
+    :return:        sympy Matrix
+    """
+    return get_jacobian_evaluator(F, x).jacobian
+
+
+def I7481_linearize(self, F, x, X, params=(), param_values=(), sparse=False):
+    """
+    :param self:            operator item (to which this function will be attached)
+    :param X:               array of shape (N, n) (operating points)
+    :param sparse:          if True return a list of scipy.sparse.csr_matrix objects instead of an (N, m, n) array
+    """
+    evaluator = get_jacobian_evaluator(F, x, params)
+    if sparse:
+        return evaluator.sparse(X, *param_values)
+    return evaluator.dense(X, *param_values)
+
+
+I7481["Jacobian"].add_method(I7481_compute, "compute")
+I7481["Jacobian"].add_method(I7481_linearize, "linearize")
+
 I2378 = p.create_item(
     R1__has_label="solution to a mathematical algorithm",
     R2__has_description="",
@@ -1497,9 +2607,10 @@ I9148 = p.create_item(
     R11__has_range_of_result=p.I33["tuple"],
 )
 
-I9148["get polygon sides ordered by length"].add_method(p.create_evaluated_mapping, "_custom_call")
+I9148["get polygon sides ordered by length"].add_method(instrumented_evaluated_mapping, "_custom_call")
 
 
+@instrument_post_process
 def I9148_cc_pp(self, res, *args, **kwargs):
     """
     :param self:    mapping item (to which this function will be attached)
@@ -1578,6 +2689,34 @@ with I6117["definition of positive definiteness (matrix)"].scope("assertion") as
 I3648["positive definiteness (matrix)"].set_relation(p.R37["has definition"], I6117)
 
 
+def positive_definiteness_mask(M):
+    """
+    Numerically check I3648["positive definiteness (matrix)"] for a stack of symmetric matrices by means of a
+    Cholesky decomposition which is performed for all matrices simultaneously.
+
+    :param M:   array-like of shape (N, n, n) (or (n, n) for a single matrix)
+    :return:    bool array of shape (N,)
+    """
+    import numpy as np
+
+    M = np.asarray(M, dtype=float)
+    if M.ndim == 2:
+        M = M[np.newaxis, :, :]
+    N, n, _ = M.shape
+
+    mask = np.all(np.isfinite(M), axis=(1, 2))
+    L = np.zeros_like(M)
+    for j in range(n):
+        d = M[:, j, j] - np.sum(L[:, j, :j] ** 2, axis=1)
+        mask &= d > 0
+
+        # dummy value for rows which already failed (prevents nan-warnings)
+        L[:, j, j] = np.sqrt(np.where(mask, d, 1.0))
+        col = M[:, j + 1:, j] - np.einsum("bik,bk->bi", L[:, j + 1:, :j], L[:, j, :j])
+        L[:, j + 1:, j] = col / L[:, j, j, np.newaxis]
+    return mask
+
+
 
 
 I5073 = p.create_item(
@@ -1623,9 +2762,11 @@ with I5073.scope("premise") as cm:
 
     def cond_func(_, arg1, arg2):
         # first argument (anchor item) can be ignored here
-        cond  = arg1.R5939 is not None \
-            and arg2.R5938 is not None \
-            and  arg1.R5939 != arg2.R5938
+        # define uri context to make the short keys work if the rule is applied in other modules
+        with p.uri_context(uri=__URI__):
+            cond  = arg1.R5939 is not None \
+                and arg2.R5938 is not None \
+                and  arg1.R5939 != arg2.R5938
         return cond
 
     cm.new_condition_func(cond_func, cm.arg1, cm.arg2)
@@ -1667,6 +2808,347 @@ P.set_relation(R5939["has column number"], 5)
 
 failed_multiplication = I5177["matmul"](A,P)
 
+
+# <rule statistics>
+# `p.ruleengine.apply_semantic_rule` only returns the final result. The following code applies a rule in the same way
+# but additionally collects match statistics which help to understand why a rule is slow (and to reorder premises).
+# The rule engine offers no hooks for this. Thus the (public) methods of the RuleApplicator workers which do the
+# matching are wrapped for timing and counting. They are checked before use: if they are not as expected, the rule is
+# applied without details and only the total time is measured. The join of the premise relations is not observable at
+# all: it is estimated by a separate join (see `_estimate_premise_join`) after the rule was applied.
+
+# attributes of the RuleApplicator and of its workers which are used (and partially wrapped) below
+RULE_APPLICATOR_ATTRIBUTES = ("G", "ra_workers", "premise_type", "apply")
+RULE_WORKER_ATTRIBUTES = (
+    "parent",
+    "P",
+    "local_node_names",
+    "_node_matcher",
+    "match_subgraph_P",
+    "get_condition_funcs_and_args",
+    "prepare_consequent_functions",
+)
+
+
+class RuleMatchStatistics:
+    """
+    Match statistics of one application of a semantic rule (see `apply_rule_with_statistics`). For every premise
+    branch (OR-subscopes lead to several branches) `branches` contains a dict with the keys:
+
+    - "raw_matches":        number of subgraph matches (before applying the condition functions)
+    - "match_seconds":      time for the subgraph matching
+    - "cond_func_calls", "cond_func_passed", "cond_func_seconds"
+    - "consequent_calls", "new_entities", "new_statements"
+
+    These values are measured during the rule application. The following values are estimates, computed by a separate
+    join of the premise relations (the rule engine uses networkx subgraph matching which does not expose intermediate
+    results):
+
+    - "candidates":                 {variable name: number of graph nodes which match the node and its relations}
+    - "estimated_relation_steps":   list of dicts describing the join of the premise relations in the order of the
+                                    rule (number of partial matches before/after each relation and how many of them
+                                    could not be extended, i.e. were pruned by the relation)
+
+    If the internals of the pyirk rule engine are not as expected `detailed` is False and only `result` and
+    `total_seconds` are available.
+    """
+
+    def __init__(self, rule: p.Item):
+        self.rule = rule
+        self.detailed = True
+        self.result = None
+        self.total_seconds = 0.0
+        self.analysis_seconds = 0.0
+        self.graph_nodes = 0
+        self.graph_edges = 0
+        self.branches = []
+
+    def _sum(self, key):
+        return sum(branch[key] for branch in self.branches)
+
+    @property
+    def cond_func_calls(self):
+        return self._sum("cond_func_calls")
+
+    @property
+    def cond_func_seconds(self):
+        return self._sum("cond_func_seconds")
+
+    @property
+    def new_entities(self):
+        return self._sum("new_entities")
+
+    @property
+    def new_statements(self):
+        return self._sum("new_statements")
+
+    def as_dict(self) -> dict:
+        return {
+            "rule": self.rule.uri,
+            "label": str(self.rule.R1__has_label),
+            "total_seconds": self.total_seconds,
+            "analysis_seconds": self.analysis_seconds,
+            "graph_nodes": self.graph_nodes,
+            "graph_edges": self.graph_edges,
+            "branches": self.branches,
+        }
+
+    def report(self) -> str:
+        lines = [
+            f"{self.rule}: {self.total_seconds:.3f} s (graph: {self.graph_nodes} nodes, {self.graph_edges} edges)"
+        ]
+        for i, branch in enumerate(self.branches):
+            lines.append(
+                f"branch {i}: {branch['raw_matches']} raw matches ({branch['match_seconds']:.3f} s), "
+                f"cond_func: {branch['cond_func_calls']} calls, {branch['cond_func_passed']} passed "
+                f"({branch['cond_func_seconds']:.3f} s), consequents: {branch['consequent_calls']} calls, "
+                f"{branch['new_entities']} new entities, {branch['new_statements']} new statements"
+            )
+            if not branch["estimated_relation_steps"]:
+                continue
+            lines.append("  estimated join of the premise relations (separate computation):")
+            lines.append("  candidates: " + ", ".join(f"{k}: {v}" for k, v in branch["candidates"].items()))
+            for step in branch["estimated_relation_steps"]:
+                lines.append(
+                    f"  {step['relation']}: {step['matches_before']} -> {step['matches_after']} "
+                    f"(pruned: {step['pruned']}{', truncated' if step['truncated'] else ''})"
+                )
+        return "\n".join(lines)
+
+
+def _prototype_node_name(worker, node) -> str:
+    data = worker.P.nodes[node]
+    if data.get("is_literal"):
+        return repr(data["value"])
+    entity = data["entity"]
+    if name := worker.local_node_names.a.get(entity.uri):
+        return str(name)
+    return f"{entity.short_key}[{entity.R1}]"
+
+
+def _estimate_premise_join(worker, max_partial_matches: int) -> dict:
+    """
+    Compute the candidates for every node of the prototype graph P (of one rule applicator worker) and join the
+    edges of P in their original order (i.e. the order of the statements in the setting and premise scopes).
+
+    Note: this is not the computation of the rule engine, but an estimate of how selective each premise relation is.
+    """
+    from collections import defaultdict
+
+    G, P = worker.parent.G, worker.P
+    wildcard_uri = p.R58["wildcard relation"].uri
+
+    out_rels, in_rels, rel_pairs = defaultdict(set), defaultdict(set), defaultdict(list)
+    for g1, g2, data in G.edges(data=True):
+        out_rels[g1].add(data["rel_uri"])
+        in_rels[g2].add(data["rel_uri"])
+        rel_pairs[data["rel_uri"]].append((g1, g2))
+    # wildcard relations are treated as "any relation" here (their relation properties are ignored)
+    rel_pairs[wildcard_uri] = list(G.edges())
+
+    names = {node: _prototype_node_name(worker, node) for node in P.nodes}
+    candidates = {}
+    for node, node_data in P.nodes(data=True):
+        required_out = {d["rel_uri"] for _, _, d in P.out_edges(node, data=True)} - {wildcard_uri}
+        required_in = {d["rel_uri"] for _, _, d in P.in_edges(node, data=True)} - {wildcard_uri}
+        candidates[node] = {
+            g
+            for g, g_data in G.nodes(data=True)
+            if required_out <= out_rels[g] and required_in <= in_rels[g] and worker._node_matcher(g_data, node_data)
+        }
+
+    steps = []
+    matches = None
+    for u, v, data in P.edges(data=True):
+        rel_uri = data["rel_uri"]
+        pairs = [(a, b) for a, b in rel_pairs[rel_uri] if a in candidates[u] and b in candidates[v]]
+        pair_set = set(pairs)
+        forward, backward = defaultdict(list), defaultdict(list)
+        for a, b in pairs:
+            forward[a].append(b)
+            backward[b].append(a)
+
+        matches_before = 0 if matches is None else len(matches)
+        considered = 0
+        pruned = 0
+        truncated = False
+        new_matches = []
+        for m in [{}] if matches is None else matches:
+            if u in m and v in m:
+                extensions = [{}] if (m[u], m[v]) in pair_set else []
+                considered += 1
+            elif u in m:
+                extensions = [{v: b} for b in forward[m[u]]]
+                considered += len(extensions)
+            elif v in m:
+                extensions = [{u: a} for a in backward[m[v]]]
+                considered += len(extensions)
+            else:
+                extensions = [{u: a, v: b} for a, b in pairs if (a == b) == (u == v)]
+                considered += len(extensions)
+            used = set(m.values())
+            n_matches = len(new_matches)
+            for ext in extensions:
+                # subgraph monomorphism: different nodes of P must be mapped to different nodes of G
+                if used.isdisjoint(ext.values()):
+                    new_matches.append({**m, **ext})
+            if m and len(new_matches) == n_matches:
+                # this partial match could not be extended
+                pruned += 1
+            if len(new_matches) >= max_partial_matches:
+                new_matches = new_matches[:max_partial_matches]
+                truncated = True
+                break
+        matches = new_matches
+
+        rel = p.ds.get_entity_by_uri(rel_uri)
+        steps.append(
+            {
+                "relation": f"{names[u]} --{rel.short_key}[{rel.R1}]--> {names[v]}",
+                "candidate_pairs": len(pairs),
+                "matches_before": matches_before,
+                "considered": considered,
+                "matches_after": len(matches),
+                "pruned": pruned,
+                "truncated": truncated,
+            }
+        )
+
+    return {"candidates": {names[node]: len(c) for node, c in candidates.items()}, "estimated_relation_steps": steps}
+
+
+def _has_expected_internals(ra) -> bool:
+    if not all(hasattr(ra, name) for name in RULE_APPLICATOR_ATTRIBUTES):
+        return False
+    return all(hasattr(worker, name) for worker in ra.ra_workers for name in RULE_WORKER_ATTRIBUTES)
+
+
+def _apply_rule_applicator(ra, rule: p.Item):
+    """
+    Apply the rule via `ra` and create the result in the same way as `p.ruleengine.apply_semantic_rule`.
+
+    :return:    (ReportingRuleResult instance, raw result or None)
+    """
+    try:
+        raw_res = ra.apply()
+        return p.ruleengine.ReportingRuleResult.get_new_instance(raw_res), raw_res
+    except p.aux.RuleTermination as ex:
+        res = p.ruleengine.ReportingRuleResult(raworker=None)
+        res._rule = rule
+        res.exception = ex
+        return res, None
+
+
+def apply_rule_with_statistics(
+    rule: p.Item, mod_context_uri: str = None, analyze_premises=True, max_partial_matches=100000
+) -> RuleMatchStatistics:
+    """
+    Apply a semantic rule (like `p.ruleengine.apply_semantic_rule`) and collect match statistics.
+
+    :param rule:                    instance of I41__semantic_rule (e.g. a constraint rule)
+    :param mod_context_uri:         uri of the module where new entities are created
+    :param analyze_premises:        bool; estimate candidates and the stepwise join of the premise relations
+    :param max_partial_matches:     upper limit for the number of partial matches during the stepwise join
+
+    :return:    RuleMatchStatistics instance (the RuleResult is stored as `.result`)
+    """
+    stats = RuleMatchStatistics(rule)
+    t0 = time.perf_counter()
+
+    if not hasattr(p.ruleengine, "RuleApplicator") or not hasattr(p.ruleengine, "ReportingRuleResult"):
+        stats.detailed = False
+        stats.result = p.ruleengine.apply_semantic_rule(rule, mod_context_uri)
+        stats.total_seconds = time.perf_counter() - t0
+        return stats
+
+    ra = p.ruleengine.RuleApplicator(rule, mod_context_uri=mod_context_uri)
+    if not _has_expected_internals(ra):
+        # apply the rule without details (but do not create a second RuleApplicator)
+        stats.detailed = False
+        stats.result, _ = _apply_rule_applicator(ra, rule)
+        stats.total_seconds = time.perf_counter() - t0
+        return stats
+
+    stats.graph_nodes, stats.graph_edges = ra.G.number_of_nodes(), ra.G.number_of_edges()
+
+    def timed(func, branch, prefix):
+        def wrapper(*args):
+            t1 = time.perf_counter()
+            res = func(*args)
+            branch[f"{prefix}_calls"] += 1
+            branch[f"{prefix}_seconds"] += time.perf_counter() - t1
+            if prefix == "cond_func":
+                branch["cond_func_passed"] += bool(res)
+            return res
+
+        return wrapper
+
+    # wrap the relevant methods of the worker instances (one worker per premise branch)
+    for worker in ra.ra_workers:
+        branch = {
+            "raw_matches": 0,
+            "match_seconds": 0.0,
+            "cond_func_calls": 0,
+            "cond_func_passed": 0,
+            "cond_func_seconds": 0.0,
+            "consequent_calls": 0,
+            "consequent_seconds": 0.0,
+            "new_entities": 0,
+            "new_statements": 0,
+            "candidates": {},
+            "estimated_relation_steps": [],
+        }
+        stats.branches.append(branch)
+
+        def match_subgraph_P(worker=worker, branch=branch, method=worker.match_subgraph_P):
+            t1 = time.perf_counter()
+            res = method()
+            branch["match_seconds"] += time.perf_counter() - t1
+            branch["raw_matches"] += len(res)
+            return res
+
+        def get_condition_funcs_and_args(branch=branch, method=worker.get_condition_funcs_and_args):
+            funcs, args = method()
+            return [timed(func, branch, "cond_func") for func in funcs], args
+
+        def prepare_consequent_functions(branch=branch, method=worker.prepare_consequent_functions):
+            funcs, args, names = method()
+            return [timed(func, branch, "consequent") for func in funcs], args, names
+
+        worker.match_subgraph_P = match_subgraph_P
+        worker.get_condition_funcs_and_args = get_condition_funcs_and_args
+        worker.prepare_consequent_functions = prepare_consequent_functions
+
+    stats.result, raw_res = _apply_rule_applicator(ra, rule)
+    for branch, part in zip(stats.branches, getattr(raw_res, "partial_results", [])):
+        branch["new_entities"] = len(part.new_entities)
+        branch["new_statements"] = len(part.new_statements)
+    stats.total_seconds = time.perf_counter() - t0
+
+    if analyze_premises and ra.premise_type == p.ruleengine.PremiseType.GRAPH:
+        t1 = time.perf_counter()
+        for worker, branch in zip(ra.ra_workers, stats.branches):
+            branch.update(_estimate_premise_join(worker, max_partial_matches))
+        stats.analysis_seconds = time.perf_counter() - t1
+
+    return stats
+
+
+def I5073_apply_with_statistics(self, mod_context_uri: str = None, **kwargs) -> RuleMatchStatistics:
+    """
+    :param self:    rule item (to which this function will be attached)
+
+    see `apply_rule_with_statistics` for the other arguments
+    """
+    return apply_rule_with_statistics(self, mod_context_uri, **kwargs)
+
+
+I5073["create I48__constraint_violation for invalid matmul calls"].add_method(
+    I5073_apply_with_statistics, "apply_with_statistics"
+)
+
+# </rule statistics>
+
 # <new_entities>
 
 # this section in the source file is helpful for bulk-insertion of new items
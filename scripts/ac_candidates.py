@@ -0,0 +1,313 @@
+"""
+Incremental generation of the `.ac_candidates.txt` file which is used for autocompletion in editors (see
+https://github.com/ackrep-org/irk-fzf).
+
+Usage (from the root directory of this repo):
+
+    python scripts/ac_candidates.py           # fast update (e.g. as editor-save hook)
+    python scripts/ac_candidates.py --full    # load all modules with pyirk and refresh the snapshot
+
+Unlike `pyirk -ac` the fast update neither imports pyirk nor loads the modules. Instead, the candidates of every module
+are stored in a snapshot file together with the size, mtime and hash of the module source. Only modules which have
+changed since then are scanned again. The scanner uses regular expressions for the top-level definitions
+(`I1234 = p.create_item(R1__has_label="...", ...)`, `I1234 = create_person("Rudolf", "Kalman", ...)`, ...), i.e. it
+is linear in the size of the module but does not see entities which are created dynamically (e.g. inside of
+functions). Such entities are only known from the last `--full` run and are kept from the snapshot.
+
+Every entity results in two lines (sorted by module prefix, entity type and key number):
+
+    ct.I7641["general system model"]
+    ct__I7641__general_system_model
+
+Like with `pyirk -ac` the builtin entities of pyirk (source: `pyirk/builtin_entities.py`) are included without prefix:
+
+    R4["is instance of"]
+    R4__is_instance_of
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+from os.path import join as pjoin
+from pathlib import Path
+
+PACKAGE_ROOT_PATH = Path(__file__).parent.parent.absolute().as_posix()
+
+# module prefix -> file name (relative to PACKAGE_ROOT_PATH)
+ONTOLOGY_MODULES = {"ag": "agents1.py", "ma": "math1.py", "ct": "control_theory1.py"}
+
+# the builtin entities are written without prefix
+BUILTINS_PREFIX = ""
+# same as `pyirk.settings.BUILTINS_URI`
+BUILTINS_URI = "irk:/builtins"
+
+OUTPUT_FNAME = ".ac_candidates.txt"
+SNAPSHOT_FNAME = ".ac_candidates_snapshot.json"
+SNAPSHOT_VERSION = 1
+
+# top-level definition of an entity: everything from `I1234 = ...(` up to the next line which is not indented
+re_definition = re.compile(r"^([IR]\d+)\s*=\s*([\w.]+)\((.*?)^(?=\S|\Z)", flags=re.MULTILINE | re.DOTALL)
+re_label = re.compile(r"""\bR1(?:__has_label)?\s*=\s*[rRuU]?(["'])(.*?)\1""")
+re_language_label = re.compile(r"""\bR1__has_label__(\w+)\s*=\s*[rRuU]?(["'])(.*?)\2""")
+re_r1_argument = re.compile(r"""\br1\s*=\s*[rRuU]?(["'])(.*?)\1""")
+re_person = re.compile(r"""^\s*(["'])(.*?)\1\s*,\s*(["'])(.*?)\3""")
+re_mod_uri = re.compile(r"""^__URI__\s*=\s*(["'])(.*?)\1""", flags=re.MULTILINE)
+# label which is set after the definition (bootstrapping of R1 and R32 in pyirk/builtin_entities.py)
+re_late_label = re.compile(r"""^([IR]\d+)\.set_relation\(R1\s*,\s*[rRuU]?(["'])(.*?)\2\s*\)""", flags=re.MULTILINE)
+re_short_key = re.compile(r"^([IR])(\d+)$")
+
+
+def get_builtins_fpath():
+    """
+    :return:    absolute path of `pyirk/builtin_entities.py` (without importing pyirk) or None if pyirk is not installed
+    """
+    spec = importlib.util.find_spec("pyirk")
+    if spec is None or spec.origin is None:
+        return None
+    return pjoin(os.path.dirname(spec.origin), "builtin_entities.py")
+
+
+def get_default_modules() -> dict:
+    """
+    :return:    dict {prefix: file name} of the ontology modules and (if available) the pyirk builtins
+    """
+    builtins_fpath = get_builtins_fpath()
+    if builtins_fpath is None:
+        return dict(ONTOLOGY_MODULES)
+    return {BUILTINS_PREFIX: builtins_fpath, **ONTOLOGY_MODULES}
+
+
+def ilk2nlk(label: str) -> str:
+    # same as `pyirk.core.ilk2nlk` (importing pyirk alone takes longer than a complete update)
+    return label.replace(" ", "_").replace("-", "_")
+
+
+def get_label_from_definition(func_name: str, args: str):
+    """
+    :param func_name:   name of the called function, e.g. "p.create_item"
+    :param args:        source code of the arguments
+    :return:            label or None (if it cannot be determined without executing the code)
+    """
+    if match := re_label.search(args):
+        return match.group(2)
+    if func_name.split(".")[-1] == "create_person" and (match := re_person.search(args)):
+        # see agents1.create_person
+        return f"{match.group(2)} {match.group(4)}"
+    if match := re_r1_argument.search(args):
+        return match.group(2)
+    language_labels = {lang: label for lang, _, label in re_language_label.findall(args)}
+    if language_labels:
+        return language_labels.get("en", sorted(language_labels.items())[0][1])
+    return None
+
+
+def scan_module_source(source: str) -> dict:
+    """
+    :return:    dict {short_key: label} for all entities which are defined on the top level of the module
+    """
+    res = {}
+    for short_key, func_name, args in re_definition.findall(source):
+        label = get_label_from_definition(func_name, args)
+        if label is not None:
+            res[short_key] = label
+    for short_key, _, label in re_late_label.findall(source):
+        res.setdefault(short_key, label)
+    return res
+
+
+def collect_loaded_candidates(mod_uri: str) -> dict:
+    """
+    :return:    dict {short_key: label} for all entities of an already loaded module (like `pyirk -ac`, but without
+                automatically created entities and variables of scopes)
+    """
+    import pyirk as p
+
+    res = {}
+    for entity in list(p.ds.items.values()) + list(p.ds.relations.values()):
+        if not entity.uri.startswith(f"{mod_uri}#") or not re_short_key.match(entity.short_key):
+            continue
+        if isinstance(entity, p.Item) and entity.R20__has_defining_scope:
+            continue
+        label = entity.R1__has_label
+        if label is not None:
+            res[entity.short_key] = str(label)
+    return res
+
+
+def sort_key(short_key: str):
+    match = re_short_key.match(short_key)
+    return match.group(1), int(match.group(2))
+
+
+def format_candidates(modules: dict) -> str:
+    """
+    :param modules:     dict {prefix: {short_key: label}}
+    """
+    lines = []
+    for prefix in sorted(modules):
+        candidates = modules[prefix]
+        for short_key in sorted(candidates, key=sort_key):
+            label = candidates[short_key]
+            if prefix == BUILTINS_PREFIX:
+                lines.append(f'{short_key}["{label}"]\n')
+                lines.append(f"{short_key}__{ilk2nlk(label)}\n")
+            else:
+                lines.append(f'{prefix}.{short_key}["{label}"]\n')
+                lines.append(f"{prefix}__{short_key}__{ilk2nlk(label)}\n")
+    return "".join(lines)
+
+
+def write_if_changed(fpath: str, content: str) -> bool:
+    """
+    Write the file atomically (editors might read it at any time) and only if the content has changed.
+
+    :return:    True if the file was written
+    """
+    try:
+        with open(fpath, encoding="utf8") as fp:
+            if fp.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = f"{fpath}.tmp"
+    with open(tmp_path, "w", encoding="utf8") as fp:
+        fp.write(content)
+    os.replace(tmp_path, fpath)
+    return True
+
+
+class CandidateSnapshot:
+    """
+    Candidates of every module together with the information which is needed to detect changes of the source.
+
+    The entries of a module are stored as {short_key: [label, origin]} where origin is "static" (found by the
+    scanner) or "dynamic" (only known from loading the module).
+    """
+
+    def __init__(self, fpath, modules=None):
+        """
+        :param modules:     dict {prefix: file name (relative to the root path or absolute)}; default: see
+                            `get_default_modules`
+        """
+        self.fpath = fpath
+        self.modules = get_default_modules() if modules is None else modules
+        self.data = {}
+
+        try:
+            with open(fpath, encoding="utf8") as fp:
+                data = json.load(fp)
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+        if data.get("version") == SNAPSHOT_VERSION:
+            self.data = data["modules"]
+
+    def save(self):
+        write_if_changed(self.fpath, json.dumps({"version": SNAPSHOT_VERSION, "modules": self.data}, sort_keys=True))
+
+    def get_candidates(self) -> dict:
+        """
+        :return:    dict {prefix: {short_key: label}}
+        """
+        res = {}
+        for prefix in self.modules:
+            entries = self.data.get(prefix, {}).get("entries", {})
+            res[prefix] = {short_key: label for short_key, (label, _) in entries.items()}
+        return res
+
+    def _read_changed_source(self, prefix, fpath):
+        """
+        :return:    (source, file info) or (None, None) if the module is unchanged since the last update
+        """
+        stat = os.stat(fpath)
+        info = {"fname": os.path.basename(fpath), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        old = self.data.get(prefix, {})
+        if all(old.get(key) == value for key, value in info.items()):
+            return None, None
+        with open(fpath, "rb") as fp:
+            raw = fp.read()
+        info["sha1"] = hashlib.sha1(raw).hexdigest()
+        if old.get("sha1") == info["sha1"]:
+            # e.g. file was touched or saved without changes
+            old.update(info)
+            return None, None
+        return raw.decode("utf8"), info
+
+    def update(self, root_path=PACKAGE_ROOT_PATH) -> list:
+        """
+        Scan all modules whose source has changed since the last update.
+
+        :return:    list of the prefixes of the scanned modules
+        """
+        changed = []
+        for prefix, fname in self.modules.items():
+            source, info = self._read_changed_source(prefix, pjoin(root_path, fname))
+            if source is None:
+                continue
+            entries = {short_key: [label, "static"] for short_key, label in scan_module_source(source).items()}
+            for short_key, (label, origin) in self.data.get(prefix, {}).get("entries", {}).items():
+                if origin == "dynamic" and short_key not in entries:
+                    entries[short_key] = [label, origin]
+            self.data[prefix] = dict(info, entries=entries)
+            changed.append(prefix)
+        return changed
+
+    def update_full(self, root_path=PACKAGE_ROOT_PATH) -> list:
+        """
+        Load all modules with pyirk (slow) and use the labels of all their entities.
+
+        :return:    list of the prefixes of all modules
+        """
+        old_cwd = os.getcwd()
+        # math1 is loaded by control_theory1 via a relative path
+        os.chdir(root_path)
+        try:
+            import pyirk as p
+
+            for prefix, fname in self.modules.items():
+                if prefix != BUILTINS_PREFIX:
+                    p.irkloader.load_mod_from_path(pjoin(root_path, fname), prefix=prefix, reuse_loaded=True)
+        finally:
+            os.chdir(old_cwd)
+
+        for prefix, fname in self.modules.items():
+            self.data.pop(prefix, None)
+            source, info = self._read_changed_source(prefix, pjoin(root_path, fname))
+            static_keys = scan_module_source(source).keys()
+            mod_uri = BUILTINS_URI if prefix == BUILTINS_PREFIX else re_mod_uri.search(source).group(2)
+            loaded = collect_loaded_candidates(mod_uri)
+            entries = {
+                short_key: [label, "static" if short_key in static_keys else "dynamic"]
+                for short_key, label in loaded.items()
+            }
+            self.data[prefix] = dict(info, entries=entries)
+        return list(self.modules)
+
+
+def main(argv=None):
+    """
+    :param argv:    list of command line arguments (default: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--full", action="store_true", help="load all modules with pyirk (slow but complete)")
+    parser.add_argument("--output", default=pjoin(PACKAGE_ROOT_PATH, OUTPUT_FNAME))
+    parser.add_argument("--snapshot", default=pjoin(PACKAGE_ROOT_PATH, SNAPSHOT_FNAME))
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    snapshot = CandidateSnapshot(args.snapshot)
+    changed = snapshot.update_full() if args.full else snapshot.update()
+    snapshot.save()
+    written = write_if_changed(args.output, format_candidates(snapshot.get_candidates()))
+
+    if not args.quiet:
+        msg = f"file written: {args.output}" if written else "candidates unchanged"
+        names = [prefix or "builtins" for prefix in changed]
+        print(f"{msg} (scanned modules: {', '.join(names) or '-'})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Infrastructure for the irk-modules of this package which is independent of their content (plain python module, not an
+irk-module). The irk-modules load it by path and register it as `sys.modules["ocse_statement_index"]`, such that it is
+executed only once and all of them share the same classes.
+"""
+
+import abc
+
+import pyirk as p
+
+
+class IncrementalStatementIndex(abc.ABC):
+    """
+    Base class for indices over `p.ds.relation_statements` which are updated incrementally: `.update()` only passes
+    those statements to `_process_new_statements` which were created since its last call. If already processed
+    statements have been removed (e.g. due to unloading a module, also if other statements were created afterwards)
+    the index is rebuilt from scratch.
+
+    Subclasses extend `clear()` by their own data structures and fetch the statements in `_process_new_statements()`
+    via `_get_new_statements(relation)`.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        # {relation uri: (number of processed statements, uri of the last processed statement)}
+        self.processed_stms = {}
+
+    def _get_new_statements(self, relation) -> list:
+        """
+        :param relation:    relation or relation uri
+        """
+        rel_uri = getattr(relation, "uri", relation)
+        stm_list = p.ds.relation_statements[rel_uri]
+        n, _ = self.processed_stms.get(rel_uri, (0, None))
+        if stm_list:
+            self.processed_stms[rel_uri] = (len(stm_list), stm_list[-1].uri)
+        return stm_list[n:]
+
+    def _has_removed_statements(self) -> bool:
+        # statements are only appended or removed -> if one of the processed statements was removed, the list is
+        # shorter or the last processed statement has moved
+        for rel_uri, (n, last_uri) in self.processed_stms.items():
+            stm_list = p.ds.relation_statements[rel_uri]
+            if len(stm_list) < n or stm_list[n - 1].uri != last_uri:
+                return True
+        return False
+
+    def update(self):
+        if self._has_removed_statements():
+            self.clear()
+        self._process_new_statements()
+        return self
+
+    @abc.abstractmethod
+    def _process_new_statements(self):
+        """
+        process the statements which are not yet known to the index (fetched via `_get_new_statements`)
+        """
@@ -0,0 +1,227 @@
+"""
+Benchmark suite for the irkpackage (intentionally not named test_*.py such that it is not collected by unittest/pytest).
+
+Usage (from the root directory of this repo):
+
+    python -m tests.benchmarks --quick
+    python -m tests.benchmarks --output benchmark_results.json
+    python -m tests.benchmarks --only loading,rules --compare old_results.json
+
+Every benchmark is repeated several times. The results (all durations in seconds and the minimum/median/maximum)
+are stored as JSON together with some meta data (git revision, versions) such that runs can be compared over time.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from os.path import join as pjoin
+from pathlib import Path
+
+import pyirk as p
+
+from tests.workloads import WorkloadGenerator, WorkloadModule
+
+PACKAGE_ROOT_PATH = Path(__file__).parent.parent.absolute().as_posix()
+
+SYSTEM_COUNTS = (10, 100, 1000, 10000, 100000)
+QUICK_SYSTEM_COUNTS = (10, 100)
+
+GRAPH_SIZES = (10, 100, 1000)
+QUICK_GRAPH_SIZES = (10, 50)
+
+POLYNOMIAL_TERMS = (2, 8, 32, 128)
+QUICK_POLYNOMIAL_TERMS = (2, 8)
+
+# upper bound for the number of keys (entities and statements) per generated system model or matmul call
+KEYS_PER_ENTITY = 60
+
+
+# this is executed in a fresh interpreter for every repetition (loading is not idempotent within one process)
+LOAD_SNIPPET = """
+import json
+import time
+import pyirk as p
+
+t0 = time.perf_counter()
+ag = p.irkloader.load_mod_from_path("agents1.py", prefix="ag")
+t1 = time.perf_counter()
+ma = p.irkloader.load_mod_from_path("math1.py", prefix="ma", reuse_loaded=True)
+t2 = time.perf_counter()
+ct = p.irkloader.load_mod_from_path("control_theory1.py", prefix="ct", reuse_loaded=True)
+t3 = time.perf_counter()
+print(json.dumps({"agents1": t1 - t0, "math1": t2 - t1, "control_theory1": t3 - t2}))
+"""
+
+
+def summarize(name, params, times):
+    return {
+        "name": name,
+        "params": params,
+        "times": times,
+        "min": min(times),
+        "median": statistics.median(times),
+        "max": max(times),
+    }
+
+
+def measure(func, repeat, setup=None, teardown=None):
+    """
+    :param func:        function which is timed
+    :param setup:       optional function which is called (untimed) before every repetition
+    :param teardown:    optional function which is called (untimed) after every repetition
+    :return:            list of durations
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - t0)
+        if teardown is not None:
+            teardown()
+    return times
+
+
+def bench_loading(repeat):
+    results = {"agents1": [], "math1": [], "control_theory1": []}
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", LOAD_SNIPPET], cwd=PACKAGE_ROOT_PATH, capture_output=True, text=True, check=True
+        ).stdout
+        for key, value in json.loads(out.strip().splitlines()[-1]).items():
+            results[key].append(value)
+    return [summarize(f"load_{key}", {}, times) for key, times in results.items()]
+
+
+def bench_theorem_linking(gen, ct, repeat, system_counts):
+    results = []
+    for n in system_counts:
+        with WorkloadModule(n_keys=KEYS_PER_ENTITY * n + 10**5):
+            gen.create_systems(n)
+            times = measure(ct.apply_theorems_to_systems, repeat)
+        results.append(summarize("apply_theorems_to_systems", {"systems": n}, times))
+    return results
+
+
+def bench_constraint_rules(gen, ma, ct, repeat, graph_sizes):
+    results = []
+    rules = [
+        ("constraint_rule_matmul", ma.I5073, gen.create_matmul_expressions),
+        (
+            "constraint_rule_opposite_relation",
+            ct.I5073["create I48__constraint_violation for is_opposite_of relation"],
+            gen.create_equilibrium_points,
+        ),
+    ]
+    for name, rule, create_graph in rules:
+        for n in graph_sizes:
+            times = []
+            for _ in range(repeat):
+                # the rule creates new entities -> use a fresh graph for every repetition
+                with WorkloadModule(n_keys=KEYS_PER_ENTITY * n + 10**5) as mod:
+                    create_graph(n)
+                    times.extend(measure(lambda: p.ruleengine.apply_semantic_rule(rule, mod.uri), 1))
+            results.append(summarize(name, {"graph_size": n}, times))
+    return results
+
+
+def bench_symbolic_conversion(ma, repeat, polynomial_terms):
+    results = []
+    for n in polynomial_terms:
+        with WorkloadModule():
+            items = [p.instance_of(p.I35["real number"], r1=f"b{i}") for i in range(2 * n)]
+            symbols = ma.items_to_symbols(*items)
+            # multilinear polynomial (the converter supports sums and products)
+            expr = sum(symbols[2 * i] * symbols[2 * i + 1] for i in range(n))
+            times = measure(lambda: ma.symbolic_expression_to_graph_expression(expr), repeat)
+        results.append(summarize("symbolic_expression_to_graph_expression", {"terms": n}, times))
+    return results
+
+
+def get_meta_data(seed):
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=PACKAGE_ROOT_PATH, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "git_revision": revision,
+        "python_version": platform.python_version(),
+        "pyirk_version": p.__version__,
+        "platform": platform.platform(),
+        "seed": seed,
+        "consistency_checking": not os.environ.get("PYIRK_DISABLE_CONSISTENCY_CHECKING", "").lower() == "true",
+    }
+
+
+def compare(results, old_results):
+    """
+    Print the ratio of the median durations (new/old) for all benchmarks which are present in both runs.
+    """
+    old = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in old_results["results"]}
+    for r in results["results"]:
+        key = (r["name"], json.dumps(r["params"], sort_keys=True))
+        if key in old:
+            ratio = r["median"] / old[key]["median"]
+            print(f"{r['name']:45s} {key[1]:25s} {old[key]['median']:10.4f}s -> {r['median']:10.4f}s  ({ratio:.2f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="use small problem sizes only")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--only", help="comma separated subset of: loading, theorems, rules, conversion")
+    parser.add_argument("--compare", help="json file of a previous run")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic workload generator")
+    args = parser.parse_args()
+
+    selected = set(args.only.split(",")) if args.only else {"loading", "theorems", "rules", "conversion"}
+    results = []
+
+    if "loading" in selected:
+        results.extend(bench_loading(args.repeat))
+
+    if selected - {"loading"}:
+        if not os.environ.get("PYIRK_DISABLE_CONSISTENCY_CHECKING", "").lower() == "true":
+            p.cc.enable_consistency_checking()
+        os.chdir(PACKAGE_ROOT_PATH)
+        ag = p.irkloader.load_mod_from_path(pjoin(PACKAGE_ROOT_PATH, "agents1.py"), prefix="ag")
+        ma = p.irkloader.load_mod_from_path(pjoin(PACKAGE_ROOT_PATH, "math1.py"), prefix="ma", reuse_loaded=True)
+        ct = p.irkloader.load_mod_from_path(
+            pjoin(PACKAGE_ROOT_PATH, "control_theory1.py"), prefix="ct", reuse_loaded=True
+        )
+        gen = WorkloadGenerator(ag, ma, ct, seed=args.seed)
+
+        if "theorems" in selected:
+            counts = QUICK_SYSTEM_COUNTS if args.quick else SYSTEM_COUNTS
+            results.extend(bench_theorem_linking(gen, ct, args.repeat, counts))
+        if "rules" in selected:
+            sizes = QUICK_GRAPH_SIZES if args.quick else GRAPH_SIZES
+            results.extend(bench_constraint_rules(gen, ma, ct, args.repeat, sizes))
+        if "conversion" in selected:
+            terms = QUICK_POLYNOMIAL_TERMS if args.quick else POLYNOMIAL_TERMS
+            results.extend(bench_symbolic_conversion(ma, args.repeat, terms))
+
+    output = {"meta": get_meta_data(args.seed), "results": results}
+    with open(args.output, "w") as fp:
+        json.dump(output, fp, indent=2)
+
+    for r in results:
+        print(f"{r['name']:45s} {json.dumps(r['params']):25s} median: {r['median']:10.4f}s")
+
+    if args.compare:
+        with open(args.compare) as fp:
+            compare(output, json.load(fp))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Opt-in profiling of module loading (intentionally not named test_*.py such that it is not collected by unittest/pytest).
+
+Usage (from the root directory of this repo):
+
+    python tests/load_profiling.py
+    python tests/load_profiling.py --top 50 --folded load_profile.folded
+
+The profiler records wall time and the number of created entities/statements for
+
+- every top-level statement of the ontology modules (item definitions, `with ...scope(...)` blocks, function calls
+  like `apply_theorems_to_systems()`),
+- every call of a function which is defined in an ontology module (e.g. the `_custom_call_post_process` hooks of
+  operators or condition functions of rules),
+- every call of some pyirk functions of interest (see `PYIRK_FUNCTIONS`).
+
+It prints a report (sorted by inclusive time) and writes a "folded stacks" file which can be rendered e.g. by
+`flamegraph.pl load_profile.folded > load_profile.svg` or by speedscope (the values are microseconds of self time).
+Note that tracing slows down loading (roughly by a factor of 3), i.e. the absolute numbers are only meaningful
+relative to each other.
+
+The profiler can also be used directly:
+
+    with LoadProfiler() as profiler:
+        ct = p.irkloader.load_mod_from_path("control_theory1.py", prefix="ct")
+    profiler.print_report()
+"""
+
+import argparse
+import ast
+import os
+import sys
+import time
+from collections import defaultdict
+from os.path import join as pjoin
+from pathlib import Path
+
+import pyirk as p
+
+PACKAGE_ROOT_PATH = Path(__file__).parent.parent.absolute().as_posix()
+
+ONTOLOGY_MODULES = ("agents1.py", "math1.py", "control_theory1.py")
+
+PYIRK_FUNCTIONS = {"create_item", "create_relation", "instance_of", "copy_from", "new_equation", "run_hooks"}
+PYIRK_PATH = os.path.dirname(p.__file__)
+
+MAX_LABEL_LENGTH = 80
+
+
+def get_statement_labels(fpath):
+    """
+    :return:    dict {lineno: label} for every line of every top-level statement of the module
+    """
+    with open(fpath) as fp:
+        source = fp.read()
+
+    labels = {}
+    for stmt in ast.parse(source).body:
+        if isinstance(stmt, ast.Assign) and isinstance(stmt.targets[0], ast.Name):
+            label = stmt.targets[0].id
+            if isinstance(stmt.value, ast.Call):
+                for kw in stmt.value.keywords:
+                    if kw.arg == "R1__has_label" and isinstance(kw.value, ast.Constant):
+                        label = f'{label}["{kw.value.value}"]'
+        elif isinstance(stmt, ast.With):
+            label = f"with {ast.unparse(stmt.items[0].context_expr)}"
+        elif isinstance(stmt, (ast.FunctionDef, ast.ClassDef)):
+            label = f"def {stmt.name}"
+        else:
+            label = ast.unparse(stmt).split("\n")[0]
+        label = f"L{stmt.lineno} {label}".replace(";", ",")
+        if len(label) > MAX_LABEL_LENGTH:
+            label = label[: MAX_LABEL_LENGTH - 3] + "..."
+        for lineno in range(stmt.lineno, stmt.end_lineno + 1):
+            labels[lineno] = label
+    return labels
+
+
+def count_entities():
+    return len(p.ds.items) + len(p.ds.relations), len(p.ds.statement_uri_map)
+
+
+class Node:
+    """
+    Open (i.e. currently running) element of the call stack
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.t0 = time.perf_counter()
+        self.counts0 = count_entities()
+        self.child_time = 0
+
+
+class LoadProfiler:
+    """
+    Context manager which profiles all ontology modules which are loaded while it is active (based on `sys.settrace`).
+    """
+
+    def __init__(self, module_paths=None):
+        if module_paths is None:
+            module_paths = [pjoin(PACKAGE_ROOT_PATH, fname) for fname in ONTOLOGY_MODULES]
+        self.module_names = {os.path.abspath(path): Path(path).stem for path in module_paths}
+        self.statement_labels = {}
+
+        self.stack = []
+        # keys: path tuples; values: [number of calls, inclusive time, self time, new entities, new statements]
+        self.records = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])
+
+    def __enter__(self):
+        sys.settrace(self._trace)
+        return self
+
+    def __exit__(self, *args):
+        sys.settrace(None)
+        while self.stack:
+            self._pop()
+
+    def _get_module_name(self, fpath):
+        # co_filename might be a relative path (e.g. "./math1.py") -> cache the result for every filename
+        try:
+            return self.module_names[fpath]
+        except KeyError:
+            res = self.module_names[fpath] = self.module_names.get(os.path.abspath(fpath))
+            return res
+
+    def _push(self, name):
+        parent_path = self.stack[-1].path if self.stack else ()
+        self.stack.append(Node(parent_path + (name,)))
+
+    def _pop(self):
+        node = self.stack.pop()
+        duration = time.perf_counter() - node.t0
+        entities, statements = count_entities()
+        record = self.records[node.path]
+        record[0] += 1
+        record[1] += duration
+        record[2] += duration - node.child_time
+        record[3] += entities - node.counts0[0]
+        record[4] += statements - node.counts0[1]
+        if self.stack:
+            self.stack[-1].child_time += duration
+
+    def _trace(self, frame, event, arg):
+        if event != "call":
+            return None
+        code = frame.f_code
+        fpath = code.co_filename
+        if mod_name := self._get_module_name(fpath):
+            if code.co_name == "<module>":
+                if fpath not in self.statement_labels:
+                    self.statement_labels[fpath] = get_statement_labels(fpath)
+                self._push(mod_name)
+                # placeholder which is replaced by the first statement
+                self._push(None)
+                return self._trace_module_frame
+            self._push(f"{mod_name}.{code.co_name}")
+        elif code.co_name in PYIRK_FUNCTIONS and fpath.startswith(PYIRK_PATH):
+            self._push(f"pyirk.{code.co_name}")
+        else:
+            return None
+
+        frame.f_trace_lines = False
+        return self._trace_function_frame
+
+    def _trace_function_frame(self, frame, event, arg):
+        if event == "return":
+            self._pop()
+        return self._trace_function_frame
+
+    def _trace_module_frame(self, frame, event, arg):
+        if event == "line":
+            label = self.statement_labels[frame.f_code.co_filename].get(frame.f_lineno)
+            current = self.stack[-1]
+            if label is not None and label != current.path[-1]:
+                self._pop()
+                self._push(label)
+        elif event == "return":
+            # current statement and module
+            self._pop()
+            self._pop()
+        return self._trace_module_frame
+
+    def get_rows(self):
+        """
+        :return:    list of (path, calls, inclusive time, self time, new entities, new statements) sorted by
+                    inclusive time (placeholder nodes are omitted)
+        """
+        rows = [(path, *record) for path, record in self.records.items() if path[-1] is not None]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def get_aggregated_rows(self):
+        """
+        :return:    like get_rows but aggregated over all call paths of the same function / statement
+        """
+        aggregated = defaultdict(lambda: [0, 0.0, 0.0, 0, 0])
+        for path, *record in self.get_rows():
+            # avoid double counting of recursive calls in the inclusive time
+            recursive = path[-1] in path[:-1]
+            values = aggregated[path[-1]]
+            values[0] += record[0]
+            values[1] += 0 if recursive else record[1]
+            values[2] += record[2]
+            values[3] += 0 if recursive else record[3]
+            values[4] += 0 if recursive else record[4]
+        rows = [((name,), *values) for name, values in aggregated.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def print_report(self, top=30, aggregate=True):
+        rows = self.get_aggregated_rows() if aggregate else self.get_rows()
+        print(f"{'calls':>8} {'incl [s]':>10} {'self [s]':>10} {'entities':>9} {'stms':>8}  name")
+        for path, calls, incl, self_time, entities, statements in rows[:top]:
+            print(f"{calls:8d} {incl:10.4f} {self_time:10.4f} {entities:9d} {statements:8d}  {' > '.join(path)}")
+
+    def write_folded(self, fpath):
+        """
+        Write the self times (in microseconds) in the "folded stacks" format used by flamegraph tools.
+        """
+        with open(fpath, "w") as fp:
+            for path, record in sorted(self.records.items(), key=lambda item: str(item[0])):
+                value = int(record[2] * 1e6)
+                if value > 0:
+                    fp.write(f"{';'.join(str(elt) for elt in path)} {value}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=30, help="number of rows of the report")
+    parser.add_argument("--no-aggregate", action="store_true", help="report every call path separately")
+    parser.add_argument("--folded", default="load_profile.folded", help="output file for the folded stacks")
+    args = parser.parse_args()
+
+    if not os.environ.get("PYIRK_DISABLE_CONSISTENCY_CHECKING", "").lower() == "true":
+        p.cc.enable_consistency_checking()
+    os.chdir(PACKAGE_ROOT_PATH)
+
+    with LoadProfiler() as profiler:
+        p.irkloader.load_mod_from_path(pjoin(PACKAGE_ROOT_PATH, "control_theory1.py"), prefix="ct")
+
+    profiler.print_report(top=args.top, aggregate=not args.no_aggregate)
+    profiler.write_folded(args.folded)
+    print(f"\nfile written: {args.folded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest import mock
 from packaging import version
 import itertools
 from os.path import join as pjoin
@@ -100,6 +101,54 @@ class Test_02_math(unittest.TestCase):
         self.assertEqual(prod_item.get_arguments(), [a.R2495__has_length, b.R2495__has_length])
         self.assertEqual(prod_item.R4__is_instance_of, ma.I5916["product"])
 
+    def test_c03__numeric_eigenvalue_checks(self):
+        import tempfile
+        import numpy as np
+
+        rng = np.random.default_rng(seed=3)
+        matrices = rng.normal(size=(200, 3, 3)) - 1.5 * np.eye(3)
+        expected = np.array([np.linalg.eigvals(M).real.max() for M in matrices])
+
+        abscissas = ma.I9160["set of eigenvalues of a matrix"].spectral_abscissas(matrices, chunk_size=64)
+        self.assertTrue(np.allclose(abscissas, expected))
+
+        mask = ma.I2739["open left half plane"].contains_eigenvalues(matrices)
+        self.assertEqual(mask.tolist(), (expected < 0).tolist())
+
+        # results are cached by matrix key (bounded, least recently used entries are dropped)
+        cache = ma.ds["spectral_abscissa_cache"]
+        self.assertIn(ma.matrix_keys(matrices[:1])[0], cache)
+        self.assertLessEqual(len(cache), cache.maxsize)
+        ma.I9160["set of eigenvalues of a matrix"].spectral_abscissas(matrices[:10])
+        self.assertIs(ma.ds["spectral_abscissa_cache"], cache)
+
+        # keys: data of small matrices (vectorized), digest of large matrices
+        keys = ma.matrix_keys(matrices)
+        self.assertEqual(keys[5], matrices[5].tobytes())
+        self.assertEqual(len(set(keys)), len(matrices))
+        large = rng.normal(size=(3, 8, 8))
+        self.assertEqual(ma.matrix_keys(large), ma.matrix_keys(large.copy()))
+        self.assertEqual(len(ma.matrix_keys(large)[0]), 16)
+
+        # memory-mapped file
+        with tempfile.TemporaryDirectory() as dirpath:
+            fpath = os.path.join(dirpath, "matrices.npy")
+            np.save(fpath, matrices[:50])
+            self.assertEqual(ma.olhp_mask(fpath, chunk_size=7).tolist(), mask[:50].tolist())
+
+        # decide the premise of I3712 for a concrete matrix
+        A = p.instance_of(ma.I9906["square matrix"])
+        ma.set_numeric_value(A, [[-1, 5], [0, -2]])
+        eig = ma.I9160["set of eigenvalues of a matrix"](A)
+        self.assertTrue(ma.decide_eigenvalues_in_olhp(eig))
+
+        ma.set_numeric_value(A, [[-1, 5], [0, 2]])
+        self.assertFalse(ma.decide_eigenvalues_in_olhp(eig))
+        self.assertEqual(ma.I2739["open left half plane"].contains_eigenvalues([A]).tolist(), [False])
+
+        B = p.instance_of(ma.I9906["square matrix"])
+        self.assertIsNone(ma.decide_eigenvalues_in_olhp(ma.I9160["set of eigenvalues of a matrix"](B)))
+
     def test_c05__cc_matrix_dimensions(self):
 
         I5073 = ma.I5073
@@ -316,6 +365,197 @@ class Test_02_math(unittest.TestCase):
         print(res.new_statements)
         self.assertTrue(len(res.new_statements) >= 7)
 
+    def test_c08__characteristic_polynomial(self):
+        import numpy as np
+
+        rng = np.random.default_rng(seed=4)
+        for n in (2, 4, 10):
+            matrices = rng.normal(size=(20, n, n))
+            expected = np.array([np.poly(M) for M in matrices])
+            for method in ("leverrier", "hessenberg"):
+                coeffs = ma.I3058["coefficients of characteristic polynomial"].evaluate_numerically(matrices, method)
+                self.assertTrue(np.allclose(coeffs, expected))
+            self.assertTrue(all(ma.I3749["Cayley-Hamilton theorem"].verify_numerically(matrices)))
+
+        with self.assertRaises(ValueError):
+            ma.charpoly_coeffs(matrices, method="unknown")
+
+        # det(s·I - A) for a concrete matrix
+        A = p.instance_of(ma.I9906["square matrix"])
+        ma.set_numeric_value(A, [[0, 1], [-2, -3]])
+        s = p.instance_of(ma.I5030["variable"])
+        sI_A = ma.I6324["canonical first order monic polynomial matrix"](A, s)
+        self.assertEqual(ma.I5359["determinant"].evaluate_numerically(sI_A).tolist(), [1, 3, 2])
+        self.assertAlmostEqual(ma.I5359["determinant"].evaluate_numerically(A)[0], 2)
+
+    def test_c09__jacobian_evaluator(self):
+        import numpy as np
+        import sympy as sp
+
+        x1, x2, x3, a = sp.symbols("x1, x2, x3, a")
+        xx = [x1, x2, x3]
+        F = [x2, -a * sp.sin(x1), 5]
+
+        J = ma.I7481["Jacobian"].compute(F, xx)
+        self.assertEqual(J, sp.Matrix([[0, 1, 0], [-a * sp.cos(x1), 0, 0], [0, 0, 0]]))
+
+        evaluator = ma.get_jacobian_evaluator(F, xx, params=[a])
+        self.assertIs(evaluator, ma.get_jacobian_evaluator(F, xx, params=[a]))
+        self.assertEqual(evaluator.nnz, 2)
+        expected_pattern = [[False, True, False], [True, False, False], [False, False, False]]
+        self.assertEqual(evaluator.pattern.toarray().tolist(), expected_pattern)
+
+        X = np.array([[0.0, 1.0, 2.0], [np.pi, 0.0, 0.0]])
+        dense = ma.I7481["Jacobian"].linearize(F, xx, X, params=[a], param_values=[2.0])
+        self.assertEqual(dense.shape, (2, 3, 3))
+        self.assertTrue(np.allclose(dense[:, 0, 1], 1))
+        self.assertTrue(np.allclose(dense[:, 1, 0], [-2, 2]))
+
+        sparse = ma.I7481["Jacobian"].linearize(F, xx, X, params=[a], param_values=[2.0], sparse=True)
+        self.assertEqual(len(sparse), 2)
+        self.assertTrue(np.allclose(sparse[1].toarray(), dense[1]))
+
+    def test_c10__polynomial_kernel(self):
+        import numpy as np
+        import sympy as sp
+
+        x1, x2, x3 = xx = sp.symbols("x1, x2, x3")
+        expr1 = x1**2 * x2 - 3 * x3 + 1
+        expr2 = x1 - x2**2
+        P1 = ma.SparsePolynomial.from_sympy(expr1, xx)
+        P2 = ma.SparsePolynomial.from_sympy(expr2, xx)
+
+        self.assertEqual(sp.expand((P1 * P2).to_sympy(xx) - expr1 * expr2), 0)
+        self.assertEqual(sp.expand((P1 - 2 * P2 + 1).to_sympy(xx) - (expr1 - 2 * expr2 + 1)), 0)
+        self.assertEqual((P1 - P1).degree, -1)
+        self.assertEqual(P1.derivative(0).to_dict(), {(1, 1, 0): 2.0})
+        self.assertEqual(sorted(P1.homogeneous_parts()), [0, 1, 3])
+        self.assertEqual(P1.homogeneous_part(3).to_dict(), {(2, 1, 0): 1.0})
+
+        X = np.random.default_rng(seed=7).normal(size=(10, 3))
+        self.assertTrue(np.allclose(P1.evaluate(X), sp.lambdify(xx, expr1)(*X.T)))
+
+        # Lie derivative along a vector field: polynomial arithmetic and sparse operator matrix agree
+        F = [P2, P1, ma.SparsePolynomial.from_sympy(x3, xx)]
+        expected = sum(sp.diff(expr1, xi) * fi.to_sympy(xx) for xi, fi in zip(xx, F))
+        self.assertEqual(sp.expand(P1.gradient_dot(F).to_sympy(xx) - expected), 0)
+
+        basis, target_basis = ma.monomial_basis(3, 3), ma.monomial_basis(3, 6)
+        coeffs = np.arange(len(basis), dtype=float)
+        Q = ma.SparsePolynomial(basis, coeffs)
+        L = ma.lie_derivative_matrix(F, basis, target_basis)
+        self.assertTrue(np.allclose(L @ coeffs, Q.gradient_dot(F).coefficient_vector(target_basis)))
+        M = ma.multiplication_matrix(P2, basis, target_basis)
+        self.assertTrue(np.allclose(M @ coeffs, (Q * P2).coefficient_vector(target_basis)))
+        with self.assertRaises(ValueError):
+            ma.lie_derivative_matrix(F, basis, ma.monomial_basis(3, 4))
+
+        # degree and homogeneity via the operator items
+        s = sp.Symbol("s")
+        self.assertEqual(ma.I3589["monovariate polynomial degree"].compute(s**3 + 2 * s + 5, [s]), 3)
+        self.assertEqual(ma.SparsePolynomial.from_sympy(s**3 + 2 * s + 5, [s]).to_dense_coeffs().tolist(), [1, 0, 2, 5])
+        homogeneous = ma.I1778["homogeneity"].check_polynomials([x1 * x2 + x3**2, expr1], xx)
+        self.assertEqual(homogeneous.tolist(), [True, False])
+
+        # row lookup (also for exponents whose integer codes would overflow)
+        basis = np.array([[0, 1, 2], [3, 0, 0], [1, 1, 1]])
+        self.assertEqual(ma.monomial_positions([[1, 1, 1], [0, 0, 0], [0, 1, 2]], basis).tolist(), [2, -1, 0])
+        basis = np.array([[0] * 20, [10**3] + [0] * 19, [0] * 19 + [10**3]])
+        exponents = np.array([[0] * 19 + [10**3], [1] * 20, [10**3] + [0] * 19])
+        self.assertEqual(ma.monomial_positions(exponents, basis).tolist(), [2, -1, 1])
+
+    def test_c11__operator_instrumentation(self):
+        # opt-in
+        self.assertFalse(ma.OperatorInstrumentation().enabled)
+
+        instrumentation = ma.OPERATOR_INSTRUMENTATION
+        # restore the global state also if the test fails
+        self.addCleanup(instrumentation.reset)
+        self.addCleanup(setattr, instrumentation, "sample_rate", instrumentation.sample_rate)
+        self.addCleanup(setattr, instrumentation, "enabled", instrumentation.enabled)
+        instrumentation.enabled = True
+        instrumentation.sample_rate = 1.0
+        ma.get_operator_stats(reset=True)
+
+        A = p.instance_of(ma.I9904["matrix"])
+        A.set_relation(ma.R5938["has row number"], 2)
+        A.set_relation(ma.R5939["has column number"], 3)
+        AT = ma.I3263["transpose"](A)
+        self.assertIs(ma.I3263["transpose"](A), AT)
+        ma.I5177["matmul"](A, AT)
+
+        stats = ma.get_operator_stats()
+        transpose_stats = stats[ma.I3263.uri]
+        self.assertEqual(transpose_stats["label"], "transpose")
+        self.assertEqual(transpose_stats["calls"], 2)
+        self.assertEqual(transpose_stats["created"], 1)
+        self.assertEqual(transpose_stats["reused"], 1)
+        self.assertEqual(transpose_stats["post_process_calls"], 2)
+        self.assertGreater(transpose_stats["call_seconds"], 0)
+        self.assertEqual(stats[ma.I5177.uri]["created"], 1)
+
+        self.assertEqual(len(instrumentation.samples), 3)
+        self.assertEqual(instrumentation.samples[0]["args"], [A.uri])
+        self.assertEqual(instrumentation.samples[0]["result"], AT.uri)
+
+        text = ma.get_operator_stats(format="prometheus", reset=True)
+        self.assertIn(f'ocse_operator_calls_total{{operator="{ma.I3263.uri}",label="transpose"}} 2', text)
+        self.assertIn("# TYPE ocse_operator_results_reused_total counter", text)
+        self.assertEqual(ma.get_operator_stats(), {})
+
+        # other items which are created during the call do not count as new result
+        def create_evaluated_mapping(mapping, *args):
+            p.instance_of(ma.I9904["matrix"])
+            return AT
+
+        with mock.patch.object(p, "create_evaluated_mapping", create_evaluated_mapping):
+            self.assertIs(ma.instrumented_evaluated_mapping(ma.I3263["transpose"], A), AT)
+        stats = ma.get_operator_stats()[ma.I3263.uri]
+        self.assertEqual((stats["created"], stats["reused"]), (0, 1))
+
+
+    def test_c12__rule_match_statistics(self):
+        from tests.workloads import WorkloadGenerator, WorkloadModule
+
+        with WorkloadModule() as mod:
+            equilibria = WorkloadGenerator(ag, ma, ct, seed=5).create_equilibrium_points(20)
+            rule = ct.I5073["create I48__constraint_violation for is_opposite_of relation"]
+            stats = rule.apply_with_statistics(mod.uri)
+
+            for x, is_contradicting in equilibria:
+                self.assertEqual(len(x.R74__has_constraint_violation), int(is_contradicting))
+
+            branch, = stats.branches
+            self.assertEqual(stats.new_entities, len(stats.result.new_entities))
+            self.assertEqual(branch["cond_func_calls"], branch["raw_matches"])
+            self.assertEqual(branch["cond_func_passed"], branch["consequent_calls"])
+            self.assertEqual(branch["consequent_calls"], stats.new_entities)
+            self.assertGreaterEqual(branch["candidates"]["x"], len(equilibria))
+
+            # the (estimated) stepwise join of both R16-relations results in the same matches as the subgraph matching
+            step1, step2 = branch["estimated_relation_steps"]
+            self.assertEqual(step1["matches_before"], 0)
+            self.assertEqual(step2["matches_before"], step1["matches_after"])
+            self.assertEqual(step2["matches_after"], branch["raw_matches"])
+            self.assertIn("prop1", stats.report())
+
+            self.assertIn("estimated join", stats.report())
+
+            # unexpected internals of the rule engine -> application without details (by the same RuleApplicator)
+            instances = []
+
+            class CountingRuleApplicator(p.ruleengine.RuleApplicator):
+                def __init__(self, *args, **kwargs):
+                    super().__init__(*args, **kwargs)
+                    instances.append(self)
+
+            with mock.patch.object(ma, "RULE_WORKER_ATTRIBUTES", ma.RULE_WORKER_ATTRIBUTES + ("nonexistent",)):
+                with mock.patch.object(p.ruleengine, "RuleApplicator", CountingRuleApplicator):
+                    stats = rule.apply_with_statistics(mod.uri)
+            self.assertEqual(len(instances), 1)
+            self.assertFalse(stats.detailed)
+            self.assertEqual(stats.branches, [])
+            self.assertIsNotNone(stats.result)
 
 class Test_02_control_theory(unittest.TestCase):
     def setUp(self):
@@ -327,6 +567,646 @@ class Test_02_control_theory(unittest.TestCase):
     def test_b01__test_multilinguality(self):
         ct.I5290["reference value"].R1__has_label__de == "Sollwert"@p.de
 
+    def test_b02__hurwitz_and_stodola_masks(self):
+        import numpy as np
+
+        coeffs = np.array([
+            [1, 3, 2, 0],     # degree 2 (padded) -> not Hurwitz because of the root at 0
+            [1, 6, 11, 6],    # roots: -1, -2, -3
+            [1, 1, 1, 1],     # roots: -1, ±i
+            [1, 1, 2, 8],     # roots in the right half plane
+            [1, -1, 1, 1],
+            [-2, -6, -22, -6],
+        ])
+        stodola = ma.I1594["Stodolas necessary condition for polynomial coefficients"].check_coefficients(coeffs)
+        self.assertEqual(stodola.tolist(), [False, True, True, True, False, True])
+
+        hurwitz = ct.I5325["Hurwitz polynomial"].check_coefficients(coeffs)
+        self.assertEqual(hurwitz.tolist(), [False, True, False, False, False, True])
+
+        # compare with the numerically computed roots
+        rng = np.random.default_rng(seed=1)
+        coeffs = np.abs(rng.normal(size=(500, 6)))
+        expected = [np.all(np.roots(row).real < 0) for row in coeffs]
+        self.assertEqual(ma.routh_hurwitz_mask(coeffs).tolist(), expected)
+
+        # link the results to the graph only on demand
+        poly1, poly2 = [p.instance_of(ma.I4239["abstract monovariate polynomial"]) for _ in range(2)]
+        ct.I5325["Hurwitz polynomial"].check_coefficients([[1, 2, 1], [1, 0, 1]], link_items=[poly1, poly2])
+        self.assertEqual(poly1.R30__is_secondary_instance_of, [ct.I5325["Hurwitz polynomial"]])
+        self.assertEqual(poly2.R30__is_secondary_instance_of, [])
+
+    def test_b03__lyapunov_equation_solver(self):
+        import numpy as np
+
+        rng = np.random.default_rng(seed=2)
+        n = 4
+        A = rng.normal(size=(100, n, n)) - 2 * np.eye(n)
+        Q = np.eye(n)
+
+        # different matrices A (Kronecker formulation)
+        P, is_pos_def = ct.I6338["Lyapunov equation"].solve_numerically(A, Q)
+        residuals = np.swapaxes(A, 1, 2) @ P + P @ A + Q
+        self.assertLess(np.abs(residuals).max(), 1e-10)
+
+        expected = [np.all(np.linalg.eigvals(a).real < 0) for a in A]
+        self.assertEqual(is_pos_def.tolist(), expected)
+        self.assertTrue(0 < sum(expected) < len(expected))
+
+        # fixed matrix A, different matrices Q (Bartels-Stewart with cached Schur decomposition)
+        A0 = A[expected.index(True)]
+        Qs = rng.normal(size=(50, n, n))
+        Qs = Qs @ np.swapaxes(Qs, 1, 2) + np.eye(n)
+        P, is_pos_def = ct.I6338["Lyapunov equation"].solve_numerically(A0, Qs)
+        self.assertLess(np.abs(A0.T @ P + P @ A0 + Qs).max(), 1e-10)
+        self.assertTrue(all(is_pos_def))
+        self.assertIs(ct.get_lyapunov_solver(A0), ct.get_lyapunov_solver(A0.copy()))
+
+        # stack with repeated and distinct matrices A
+        A_mixed = np.concatenate([A[:10], np.repeat(A0[np.newaxis], 5, axis=0), A[10:20]])
+        P, _ = ct.I6338["Lyapunov equation"].solve_numerically(A_mixed, Q)
+        self.assertLess(np.abs(np.swapaxes(A_mixed, 1, 2) @ P + P @ A_mixed + Q).max(), 1e-10)
+
+        # no unique solution for eigenvalues on the imaginary axis
+        P, is_pos_def = ct.I6338["Lyapunov equation"].solve_numerically(np.array([[0.0, 1.0], [-1.0, 0.0]]), np.eye(2))
+        self.assertTrue(np.all(np.isnan(P)))
+        self.assertEqual(is_pos_def.tolist(), [False])
+
+        # (numerically) singular: lambda_1 + lambda_2 = -2e-10 (relative to ||A||) -> nan instead of huge values
+        # (for a single A, for repeated matrices A and in the Kronecker formulation)
+        A1 = np.array([[-1e-10, 1.0], [-1.0, -1e-10]]) * 1e3
+        self.assertTrue(np.all(np.isnan(ct.solve_lyapunov_equations(A1, np.eye(2)))))
+        A_stack = np.stack([A1, A1, A0[:2, :2] - 5 * np.eye(2), A1.T])
+        P = ct.solve_lyapunov_equations(A_stack, np.eye(2))
+        self.assertEqual(np.isnan(P).all(axis=(1, 2)).tolist(), [True, True, False, True])
+        self.assertLess(np.abs(A_stack[2].T @ P[2] + P[2] @ A_stack[2] + np.eye(2)).max(), 1e-10)
+
+    def test_b04__lie_derivatives(self):
+        import numpy as np
+        import sympy as sp
+
+        x1, x2, a = sp.symbols("x1, x2, a")
+        xx = [x1, x2]
+        f = [x2, -a * sp.sin(x1)]
+        h = x1
+
+        L = ct.I1371["iterated Lie derivative of scalar field"]
+        self.assertEqual(ct.I1347["Lie derivative of scalar field"].compute(h, f, xx), x2)
+        self.assertEqual(L.compute(h, f, xx, 2), -a * sp.sin(x1))
+        self.assertEqual(L.compute(h, f, xx, 3), -a * x2 * sp.cos(x1))
+
+        # the higher order result reuses (and extends) the cached list
+        key = ct._lie_derivative_key(h, f, xx)
+        self.assertEqual(len(ct.LIE_DERIVATIVE_CACHE[key]), 4)
+        self.assertEqual(ct.iterated_lie_derivatives(h, f, xx, 1), [x1, x2])
+
+        # equivalent (unexpanded) inputs share the cache entry, the results are stored in expanded form
+        self.assertEqual(ct._lie_derivative_key((x1 + 1) ** 2 - 2 * x1, f, xx), ct._lie_derivative_key(x1**2 + 1, f, xx))
+        res = ct.iterated_lie_derivatives((x1 + x2) ** 2, [x2, x1], xx, 2)
+        self.assertEqual(res, [sp.expand(r) for r in res])
+        self.assertEqual(res[2], 4 * x1**2 + 8 * x1 * x2 + 4 * x2**2)
+
+        with self.assertRaises(ValueError):
+            ct.iterated_lie_derivatives(h, f, [x1], 1)
+
+        func = L.lambdify(h, f, xx, 3, params=[a])
+        self.assertIs(func, L.lambdify(h, f, xx, 3, params=[a]))
+        X = np.array([[0.0, 1.0], [np.pi / 2, 2.0], [1.0, 0.0]])
+        values = func(X, 2.0)
+        self.assertEqual(values.shape, (3, 4))
+        expected = np.column_stack([X[:, 0], X[:, 1], -2 * np.sin(X[:, 0]), -2 * X[:, 1] * np.cos(X[:, 0])])
+        self.assertTrue(np.allclose(values, expected))
+
+    def test_b05__controllability_and_observability(self):
+        import numpy as np
+
+        # double integrator with different input and output matrices
+        A = [[0, 1], [0, 0]]
+        B = np.array([[[0], [1]], [[1], [0]]])
+        C = np.array([[[1, 0]], [[0, 1]]])
+
+        self.assertEqual(ct.kalman_controllability_matrices(A, B)[0].tolist(), [[0, 1], [1, 0]])
+        self.assertEqual(ct.kalman_observability_matrices(A, C)[1].tolist(), [[0, 1], [0, 0]])
+
+        for method in ("kalman", "pbh"):
+            self.assertEqual(ct.I7864["controllability"].check_numerically(A, B, method=method).tolist(), [True, False])
+            self.assertEqual(ct.I3227["observability"].check_numerically(A, C, method=method).tolist(), [True, False])
+
+        # uncontrollable but stable mode -> stabilizable
+        A2 = [[-1, 0], [0, 1]]
+        b2 = [[0], [1]]
+        self.assertEqual(ct.I7864["controllability"].check_numerically(A2, b2).tolist(), [False])
+        self.assertEqual(ct.I9210["stabilizability"].check_numerically(A2, b2).tolist(), [True])
+        self.assertEqual(ct.I9853["detectability"].check_numerically(A2, [[1, 0]]).tolist(), [False])
+
+        # batch: Kalman and PBH test agree for random systems
+        rng = np.random.default_rng(seed=5)
+        As = rng.normal(size=(200, 4, 4))
+        Bs = rng.normal(size=(200, 4, 1))
+        Bs[::3] = 0
+        kalman = ct.controllability_mask(As, Bs)
+        self.assertEqual(kalman.tolist(), ct.controllability_mask(As, Bs, method="pbh").tolist())
+        self.assertTrue(0 < sum(kalman) < len(kalman))
+
+        # PBH test: the tolerance refers to the norm of [A, B] and the accuracy of the eigenvalues
+        # -> invariant w.r.t. scaling of the system
+        # (uncontrollable systems: block triangular form with unreachable last state in random coordinates)
+        As[:, 3, :3] = 0
+        Bs[:, 3] = 0
+        T = rng.normal(size=(200, 4, 4))
+        As, Bs = T @ As @ np.linalg.inv(T), T @ Bs
+        # (the tolerance has to cover the errors of the eigenvalues for ill-conditioned T)
+        for s in (1e-6, 1, 1e6):
+            self.assertEqual(sum(ct.controllability_mask(s * As, s * Bs, method="pbh")), 0)
+
+        # attach the results to system model items
+        sys1, sys2 = [p.instance_of(ct.I7641["general system model"]) for _ in range(2)]
+        ct.I7864["controllability"].check_numerically(A, B, link_items=[sys1, sys2])
+        self.assertEqual(sys1.R8303__has_general_system_property, [ct.I7864["controllability"]])
+        self.assertEqual(sys2.R6458__does_not_have_general_system_property, [ct.I7864["controllability"]])
+
+    def test_b06__flow_simulation(self):
+        import tempfile
+        import numpy as np
+        import sympy as sp
+
+        x1, x2, a = sp.symbols("x1, x2, a")
+        f = [x2, -a * x1]
+        flow = ct.I2753["flow of a vector field"]
+
+        rng = np.random.default_rng(seed=6)
+        X0 = rng.normal(size=(500, 2))
+        t_eval = np.linspace(0, np.pi, 5)
+        res = flow.simulate(f, [x1, x2], X0, t_eval, params=[a], param_values=[1.0], chunk_size=128)
+        self.assertEqual(res.shape, (500, 5, 2))
+        expected_x1 = X0[:, 0:1] * np.cos(t_eval) + X0[:, 1:2] * np.sin(t_eval)
+        self.assertLess(np.abs(res[:, :, 0] - expected_x1).max(), 1e-4)
+
+        # finite escape time (x1 = 1 / (1 - t) for x1(0) = 1)
+        res = flow.simulate([x1**2], [x1], [[1.0], [-1.0]], [0, 0.5, 2])
+        self.assertAlmostEqual(res[0, 1, 0], 2, places=4)
+        self.assertTrue(np.isnan(res[0, 2, 0]))
+        self.assertAlmostEqual(res[1, 2, 0], -1 / 3, places=4)
+
+        # evaluation times close to each other must not shrink the step size for the remaining interval
+        n_calls = []
+        for t_eval2 in ([0, 10], [0, 1e-6, 1e-3, 10]):
+            calls = []
+            rhs = ct.compile_vector_field(f, [x1, x2], [a])
+            ct.FlowSimulator(lambda X: calls.append(1) or rhs(X, 1.0)).integrate(X0[:20], t_eval2)
+            n_calls.append(len(calls))
+        self.assertLessEqual(n_calls[1], n_calls[0] + 2 * 7)
+
+        # stream the results to a file (the initial values are read chunk by chunk from a file as well)
+        with tempfile.TemporaryDirectory() as dirpath:
+            fpath = os.path.join(dirpath, "trajectories.npy")
+            X0_path = os.path.join(dirpath, "initial_values.npy")
+            np.save(X0_path, X0[:50].astype(np.float32))
+            flow.simulate(f, [x1, x2], X0_path, t_eval, params=[a], param_values=[1.0], fpath=fpath, chunk_size=16)
+            stored = np.load(fpath)
+            self.assertEqual(stored.shape, (50, 5, 2))
+            self.assertLess(np.abs(stored[:, :, 0] - expected_x1[:50]).max(), 1e-4)
+
+    def test_b07__lyapunov_candidate_verification(self):
+        import sympy as sp
+
+        x1, x2 = sp.symbols("x1, x2")
+        xx = [x1, x2]
+        V = x1**2 + x2**2
+        bounds = [(-1, 1), (-1, 1)]
+        verify = ct.I2933["Lyapunov Function"].verify_candidate
+
+        candidate1 = p.instance_of(ma.I9923["scalar field"])
+        report = verify(V, [-x1, -x2], xx, bounds, link_item=candidate1)
+        self.assertEqual(report.lyapunov_class, ct.I9199["strong Lyapunov Function"])
+        self.assertEqual(candidate1.R30__is_secondary_instance_of, [ct.I9199["strong Lyapunov Function"]])
+
+        # damped oscillator: L_f V = -2 x2^2 is only negative semidefinite
+        candidate2 = p.instance_of(ma.I9923["scalar field"])
+        report = verify(V, [x2, -x1 - x2], xx, bounds, link_item=candidate2)
+        self.assertTrue(report.LfV_negative_semidefinite)
+        self.assertFalse(report.LfV_negative_definite)
+        self.assertEqual(candidate2.R30__is_secondary_instance_of, [ct.I9208["weak Lyapunov Function"]])
+
+        # L_f V = -2 (x1^4 + x2^4) is negative definite (but small compared to |x|^2 near the origin)
+        report = verify(V, [-x1**3, -x2**3], xx, bounds)
+        self.assertTrue(report.LfV_negative_definite)
+        self.assertEqual(report.lyapunov_class, ct.I9199["strong Lyapunov Function"])
+
+        # mixed degrees: L_f V = -2 x1^2 - 2 x2^4 is negative definite (also on small boxes)
+        for r in (0.2, 0.05):
+            candidate3 = p.instance_of(ma.I9923["scalar field"])
+            report = verify(V, [-x1, -x2**3], xx, [(-r, r), (-r, r)], link_item=candidate3)
+            self.assertEqual(len(report.counterexamples["LfV_definite"]), 0)
+            self.assertEqual(candidate3.R30__is_secondary_instance_of, [ct.I9199["strong Lyapunov Function"]])
+
+        # L_f V = 2 x1^2 (4 x1^2 - 1) is positive for |x1| > 0.5
+        report = verify(V, [-x1 + 4 * x1**3, -x2], xx, bounds, method="grid")
+        self.assertIsNone(report.lyapunov_class)
+        self.assertGreater(abs(report.counterexamples["LfV_semidefinite"][0, 0]), 0.5)
+
+        # V is not positive definite
+        report = verify(x1**2 - x2**2, [-x1, -x2], xx, bounds)
+        self.assertFalse(report.V_positive_definite)
+        self.assertTrue(len(report.counterexamples["V"]) > 0)
+
+    def test_b08__vannelli_algorithm(self):
+        import sympy as sp
+
+        x1, x2 = sp.symbols("x1, x2")
+        f = [-x1 + x2**2 - x1 * x2, -2 * x2 + x1**2 * x2 + x1**3]
+        algorithm = ct.I4432["Vannelli recursive algorithm to find Lyapunov function"]
+
+        V = algorithm.compute(f, [x1, x2], max_degree=5, record=True)
+
+        # L_f V = -x^T Q x + terms of degree > 5
+        LfV = sp.Poly(sp.expand(sp.diff(V, x1) * f[0] + sp.diff(V, x2) * f[1]), x1, x2)
+        low_order_terms = {e: c for e, c in LfV.terms() if sum(e) <= 5 and abs(c) > 1e-10}
+        self.assertEqual(low_order_terms.keys(), {(2, 0), (0, 2)})
+        self.assertAlmostEqual(low_order_terms[(2, 0)], -1)
+        self.assertAlmostEqual(low_order_terms[(0, 2)], -1)
+
+        solution = algorithm.ma__R3263__has_solution[-1]
+        self.assertEqual(solution.R4__is_instance_of, ma.I2378["solution to a mathematical algorithm"])
+        self.assertEqual(solution.R30__is_secondary_instance_of, [ct.I2933["Lyapunov Function"]])
+        self.assertEqual(ma.get_symbolic_value(solution), V)
+
+        # recording the same solution again does not create a new one
+        n_solutions = len(algorithm.ma__R3263__has_solution)
+        algorithm.compute(f, [x1, x2], max_degree=5, record=True)
+        self.assertEqual(len(algorithm.ma__R3263__has_solution), n_solutions)
+        self.assertIs(ct.ALGORITHM_SOLUTION_INDEX.get_solution(algorithm, V), solution)
+
+        # the factorizations are reused
+        n_cached = len(ct.VANNELLI_FACTORIZATION_CACHE)
+        algorithm.compute([-x1 + x2**3, -2 * x2], [x1, x2], max_degree=5)
+        self.assertEqual(len(ct.VANNELLI_FACTORIZATION_CACHE), n_cached)
+
+        # unstable linearization
+        self.assertIsNone(algorithm.compute([x1, -x2 + x1**2], [x1, x2]))
+        with self.assertRaises(ValueError):
+            algorithm.compute([1 - x1, -x2], [x1, x2])
+
+    def test_b09__darboux_polynomials(self):
+        import sympy as sp
+
+        x1, x2 = sp.symbols("x1, x2")
+        xx = [x1, x2]
+        f = [-x1, -3 * x2 + x1**2]
+        algorithm = ct.I7006["Goubault algorithm to find Lyapunov function"]
+
+        def check_pairs(pairs):
+            for p_expr, cofactor in pairs:
+                LfP = sp.diff(p_expr, x1) * f[0] + sp.diff(p_expr, x2) * f[1]
+                self.assertEqual(sp.expand(LfP - cofactor * p_expr).evalf(chop=True), 0)
+
+        for backend in ("svd", "linprog"):
+            pairs = algorithm.compute(f, xx, degrees=(1, 2), backend=backend)
+            check_pairs(pairs)
+            monic_polys = [sp.nsimplify(sp.Poly(p_expr, *xx).monic().as_expr()) for p_expr, _ in pairs]
+            self.assertIn(x1**2 - x2, monic_polys)
+            self.assertIn(x1, monic_polys)
+
+        # explicitly given (non-constant) cofactors
+        pairs = algorithm.compute([x1 * x2, -x2], xx, degrees=(1,), cofactors=[x2], record=True)
+        self.assertEqual(len(pairs), 1)
+        self.assertEqual(sp.nsimplify(pairs[0][0]), x1)
+
+        solution = algorithm.ma__R3263__has_solution[-1]
+        self.assertEqual(ma.get_symbolic_value(solution), pairs)
+        algorithm.compute([x1 * x2, -x2], xx, degrees=(1,), cofactors=[x2], record=True)
+        self.assertEqual(algorithm.ma__R3263__has_solution[-1], solution)
+        self.assertIs(ma.monomial_basis(2, 3), ma.monomial_basis(2, 3))
+
+    def test_b10__transfer_functions(self):
+        import numpy as np
+        import sympy as sp
+
+        s = sp.Symbol("s")
+        exprs = [1 / (s + 1), (s**2 + 1) / (s**2 + 2 * s + 1), s**2 / (s + 1), 1 / (s - 1), (s - 1) / (s**3 + s**2 + s)]
+        batch = ct.I2640["transfer function representation"].create_batch(
+            [[1], [1, 0, 1], [1, 0, 0], [1], [1, -1]], [[1, 1], [1, 2, 1], [1, 1], [1, -1], [1, 1, 1, 0]]
+        )
+        self.assertEqual(batch.num_degrees.tolist(), [0, 2, 2, 0, 1])
+        self.assertEqual(batch.den_degrees.tolist(), [1, 2, 1, 1, 3])
+
+        tf_reps = [p.instance_of(ct.I2640["transfer function representation"]) for _ in exprs]
+        proper = ct.I8181["properness"].check_transfer_functions(batch, link_items=tf_reps)
+        self.assertEqual(proper.tolist(), [True, True, False, True, True])
+        self.assertEqual(tf_reps[0].R16__has_property, [ct.I8181["properness"]])
+        self.assertEqual(tf_reps[2].R16__has_property, [])
+        strictly_proper = ct.I8182["strict properness"].check_transfer_functions(batch)
+        self.assertEqual(strictly_proper.tolist(), [True, False, False, True, True])
+        bibo = ct.I7208["BIBO stability"].check_transfer_functions(batch)
+        self.assertEqual(bibo.tolist(), [True, True, False, False, False])
+
+        # frequency response
+        omega = np.logspace(-2, 2, 200)
+        G = batch.frequency_response(omega)
+        self.assertEqual(G.shape, (5, 200))
+        for expr, row in zip(exprs, G):
+            self.assertTrue(np.allclose(row, sp.lambdify(s, expr)(1j * omega)))
+        magnitude, phase = batch.bode(omega)
+        self.assertAlmostEqual(magnitude[0, 0], 20 * np.log10(abs(1 / (0.01j + 1))))
+        self.assertAlmostEqual(phase[0, -1], np.degrees(np.angle(1 / (100j + 1))))
+
+        batch2 = ct.TransferFunctionBatch.from_sympy(exprs, s)
+        self.assertTrue(np.allclose(batch2.frequency_response(omega), G))
+        with self.assertRaises(ValueError):
+            ct.TransferFunctionBatch([[1]], [[0, 0]])
+
+    def test_b11__pole_placement(self):
+        import numpy as np
+
+        rng = np.random.default_rng(seed=8)
+        A = rng.normal(size=(300, 4, 4))
+        b = rng.normal(size=(300, 4, 1))
+        poles = np.array([-1, -2, -1 + 1j, -1 - 1j])
+
+        K = ct.I4201["Ackermanns Formula"].compute_gains(A, b, poles)
+        self.assertEqual(K.shape, (300, 1, 4))
+        # (the closed loop matrices are not added to the charpoly cache)
+        n_cached = len(ma.ds.get("charpoly_cache", ()))
+        self.assertLess(ct.closed_loop_charpoly_errors(A, b, K, poles).max(), 1e-6)
+        self.assertEqual(len(ma.ds.get("charpoly_cache", ())), n_cached)
+
+        K2 = ct.I7916["pole placement"].compute_gains(A[:20], b[:20], poles, method="robust")
+        self.assertTrue(np.allclose(K2, K[:20], rtol=1e-5, atol=1e-6))
+
+        # repeated poles, multiple inputs, larger systems
+        K = ct.I7916["pole placement"].compute_gains(A[0], b[0], [-1, -1, -2, -2], method="robust")
+        self.assertLess(ct.closed_loop_charpoly_errors(A[0], b[0], K, [-1, -1, -2, -2]).max(), 1e-6)
+        A8 = rng.normal(size=(5, 8, 8))
+        B8 = rng.normal(size=(5, 8, 2))
+        poles8 = -np.arange(1, 9)
+        K = ct.I7916["pole placement"].compute_gains(A8, B8, poles8)
+        eigvals = np.sort(np.linalg.eigvals(A8 - B8 @ K).real, axis=1)
+        self.assertTrue(np.allclose(eigvals, np.sort(poles8)[np.newaxis, :], atol=1e-6))
+
+        # uncontrollable system
+        K = ct.ackermann_gains([[-1, 0], [0, 1]], [[0], [1]], [-1, -2])
+        self.assertTrue(np.all(np.isnan(K)))
+
+    def test_b12__workload_generator(self):
+        from tests.workloads import WorkloadGenerator, WorkloadModule
+
+        def property_structure(workload):
+            return [
+                (sorted(rep.get_relations("ct__R5100", return_obj=True), key=str),
+                 sorted(sys.get_relations("ct__R8303", return_obj=True), key=str))
+                for sys, rep in workload["systems"]
+            ]
+
+        with WorkloadModule() as mod:
+            workload = WorkloadGenerator(ag, ma, ct, seed=3).build("tiny", matmuls=20)
+            structure = property_structure(workload)
+            self.assertEqual(len(workload["systems"]), 10)
+            self.assertEqual(len(workload["matmuls"]), 20)
+            self.assertTrue(all(s.uri.startswith(mod.uri) for s, _ in workload["systems"]))
+            self.assertTrue(all(src.ag__R8433__has_authors for src in workload["sources"]))
+
+            # the matmul constraint rule finds exactly the invalid products
+            p.ruleengine.apply_semantic_rule(ma.I5073, mod.uri)
+            for A, B, AB, is_valid in workload["matmuls"]:
+                self.assertEqual(len(AB.R74__has_constraint_violation), 0 if is_valid else 1)
+
+        # same seed -> same graph structure
+        with WorkloadModule():
+            workload2 = WorkloadGenerator(ag, ma, ct, seed=3).build("tiny", matmuls=20)
+            self.assertEqual(property_structure(workload2), structure)
+
+    def test_b14__label_search_index(self):
+        from tests.workloads import WorkloadModule
+
+        index = ct.get_label_search_index()
+        entity, score, text = index.search("Sollwert")[0]
+        self.assertEqual(entity, ct.I5290["reference value"])
+        self.assertEqual((str(text), text.language), ("Sollwert", "de"))
+        self.assertEqual(index.search("Sollwert", lang="en"), [])
+        self.assertEqual(index.search("Lyapunov fucntion")[0][0], ct.I2933["Lyapunov Function"])
+        self.assertEqual(index.search("controllability")[0][0], ct.I7864["controllability"])
+        self.assertIn(ct.I7864["controllability"], [res[0] for res in index.search("contr")])
+        self.assertIn(ct.I9903, [res[0] for res in index.search("Krasovskii LaSalle")])
+        self.assertEqual(index.search("xyzxyz"), [])
+
+        # incremental update
+        with WorkloadModule() as mod:
+            index = ct.LabelSearchIndex(namespaces=[mod.uri]).update()
+            self.assertEqual(index.search("quaternion"), [])
+            itm = p.instance_of(ma.I9904["matrix"], r1="quaternion matrix")
+            self.assertEqual(index.update().search("quaternoin")[0][0], itm)
+            # (new words are merged into the sorted vocabulary for the prefix search)
+            itm2 = p.instance_of(ma.I9904["matrix"], r1="quasi triangular matrix")
+            self.assertEqual({res[0].uri for res in index.update().search("qua", fuzzy=False)}, {itm.uri, itm2.uri})
+
+    def test_b15__ac_candidates(self):
+        import shutil
+        import tempfile
+        from scripts.ac_candidates import (
+            CandidateSnapshot,
+            collect_loaded_candidates,
+            format_candidates,
+            get_builtins_fpath,
+            main,
+            scan_module_source,
+        )
+
+        # the scanner must agree with the loaded modules (and the pyirk builtins)
+        for fpath, mod_uri in [(mod.__file__, mod.__URI__) for mod in (ag, ma, ct)] + [
+            (get_builtins_fpath(), p.settings.BUILTINS_URI)
+        ]:
+            with open(fpath) as fp:
+                scanned = scan_module_source(fp.read())
+            loaded = collect_loaded_candidates(mod_uri)
+            self.assertGreater(len(scanned), 0.9 * len(loaded))
+            self.assertEqual(scanned, {key: loaded[key] for key in scanned})
+
+        # builtins are written without prefix (like `pyirk -ac`)
+        content = format_candidates({"": {"R4": "is instance of"}, "ct": {"I7641": "general system model"}})
+        self.assertEqual(
+            content.splitlines(),
+            [
+                'R4["is instance of"]',
+                "R4__is_instance_of",
+                'ct.I7641["general system model"]',
+                "ct__I7641__general_system_model",
+            ],
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            shutil.copy(pjoin(PACKAGE_ROOT_PATH, "control_theory1.py"), tmpdir)
+            snapshot_path = pjoin(tmpdir, "snapshot.json")
+            snapshot = CandidateSnapshot(snapshot_path, modules={"ct": "control_theory1.py"})
+            self.assertEqual(snapshot.update(tmpdir), ["ct"])
+            # simulate an entity which is only known from a full update
+            snapshot.data["ct"]["entries"]["I1"] = ["dynamic entity", "dynamic"]
+            snapshot.save()
+
+            snapshot = CandidateSnapshot(snapshot_path, modules={"ct": "control_theory1.py"})
+            self.assertEqual(snapshot.update(tmpdir), [])
+            with open(pjoin(tmpdir, "control_theory1.py"), "a") as fp:
+                fp.write('\nI2 = p.create_item(\n    R1__has_label="new item",\n    R2__has_description="..."\n)\n')
+            self.assertEqual(snapshot.update(tmpdir), ["ct"])
+            candidates = snapshot.get_candidates()["ct"]
+            self.assertEqual(candidates["I2"], "new item")
+            self.assertEqual(candidates["I1"], "dynamic entity")
+            self.assertEqual(candidates["I7641"], "general system model")
+
+            # command line entry point (fast update of the real modules)
+            output_path = pjoin(tmpdir, "ac_candidates.txt")
+            main(["--output", output_path, "--snapshot", pjoin(tmpdir, "snapshot2.json"), "--quiet"])
+            with open(output_path) as fp:
+                lines = fp.read().splitlines()
+            self.assertIn('ct.I7641["general system model"]', lines)
+            self.assertIn('ma.I9904["matrix"]', lines)
+
+    def test_b16__property_profile_queries(self):
+        from tests.workloads import WorkloadGenerator, WorkloadModule
+
+        # (other tests might add further system models to ct)
+        labels = [str(sys.R1) for sys in ct.query_system_models("linearity and time invariance")]
+        self.assertIn("testsyslti", labels)
+        self.assertNotIn("testsyslin", labels)
+        labels = [str(sys.R1) for sys in ct.query_system_models("time invariance, without I4761")]
+        self.assertEqual([label for label in labels if label.startswith("testsys")][:2], ["testsystipoly", "testsysti"])
+        with self.assertRaises(KeyError):
+            ct.query_system_models("unknown property")
+
+        with WorkloadModule() as mod:
+            index = ct.PropertyProfileIndex().update()
+
+            def query(q):
+                return [sys for sys in index.update().query(q) if sys.uri.startswith(mod.uri)]
+
+            sys1 = p.instance_of(ct.I7641["general system model"])
+            sys1.set_relation(ct.R8303["has general system property"], ct.I1898["lti"])
+            sys2 = p.instance_of(ct.I7641["general system model"])
+            sys2.set_relation(ct.R6458["does not have general system property"], ct.I9210["stabilizability"])
+            sys3 = p.instance_of(ct.I7641["general system model"])
+
+            # R17 hierarchy: lti is a subproperty of time invariance, controllability of stabilizability
+            self.assertEqual(query("time invariance"), [sys1])
+            self.assertEqual(query("not controllability"), [sys2])
+            self.assertEqual(query("without time invariance"), [sys2, sys3])
+
+            # properties of the model representation (also if they are added after the link)
+            rep = p.instance_of(ct.I2928["general model representation"])
+            sys3.set_relation(ct.R2928["has model representation"], rep)
+            # (lti -> linearity -> polynomial)
+            self.assertEqual(query("polynomial"), [sys1])
+            rep.set_relation(ct.R5100["has model representation property"], ct.I4761["linearity"])
+            self.assertEqual(query("polynomial"), [sys1, sys3])
+            self.assertEqual(query('ct__I4761["linearity"] but without lti'), [sys3])
+
+            # compare with a brute force evaluation on a larger graph
+            systems = [sys for sys, rep in WorkloadGenerator(ag, ma, ct, seed=5).create_systems(100)]
+
+            def has(sys, prop):
+                props = sys.get_relations("ct__R8303", return_obj=True)
+                for rep in sys.get_relations("ct__R2928", return_obj=True):
+                    props += rep.get_relations("ct__R5100", return_obj=True)
+                return any(prop.uri in index._closure(obj.uri, index.parents) for obj in props)
+
+            expected = [sys for sys in systems if has(sys, ct.I7733) and not has(sys, ct.I4761)]
+            res = [sys for sys in query("time invariance and without I4761") if sys in systems]
+            self.assertEqual(res, expected)
+
+    def test_b17__theorem_catalog(self):
+        from tests.workloads import WorkloadGenerator, WorkloadModule
+
+        catalog = ct.get_theorem_catalog()
+        theorems = [itm for itm in p.ds.items.values() if p.is_instance(itm, p.I14["mathematical proposition"])]
+        self.assertEqual(len(catalog), len(theorems))
+
+        record = catalog[ct.I2613["theorem for Lyapunov functions for linear systems"]]
+        setting_types = {label: types for uri, label, types in record.variables["setting"]}
+        self.assertEqual(setting_types["sys"], (ct.I7641.uri,))
+        self.assertEqual(setting_types["ode_sys"], (ct.I6850.uri,))
+        self.assertEqual([label for uri, label, types in record.variables["assertion"]], ["V", "mr"])
+        self.assertIn((ct.R5100.uri, ct.I4761.uri), [stm[1:] for stm in record.statements["setting"]])
+        self.assertIn(p.R16.uri, [stm[1] for stm in record.statements["premise"]])
+        self.assertEqual(record.required_representation_properties, {ct.I4761.uri})
+        self.assertIn(ct.I2613, catalog.get_theorems_requiring(ct.I4761["linearity"]))
+
+        # rules have scopes too but are not part of the catalog
+        with self.assertRaises(KeyError):
+            catalog[ct.I5073]
+
+        # incremental update
+        with WorkloadModule():
+            gen = WorkloadGenerator(ag, ma, ct, seed=2)
+            th, = gen.create_theorems(1, max_properties=0)
+            with th.scope("premise") as cm:
+                cm.new_rel(cm.sys, ct.R8303["has general system property"], ct.I7864["controllability"])
+            segment = ag.get_source_segment(gen.create_sources(1)[0], "Theorem 1")
+            th.set_relation(ag.R8439["is described by source"], segment)
+            record = ct.get_theorem_catalog()[th]
+            self.assertEqual(record.required_system_properties, {ct.I7864.uri})
+            self.assertEqual(record.sources, (segment.uri,))
+            self.assertEqual([label for uri, label, types in record.variables["assertion"]], ["V"])
+            self.assertIn(th, catalog.get_theorems_requiring(ct.I7864["controllability"]))
+        self.assertEqual(len(ct.get_theorem_catalog()), len(theorems))
+
+    def test_b18__theorem_inference(self):
+        from tests.workloads import WorkloadModule
+
+        def create_linear_system(A_value):
+            # concrete counterpart of the setting of I2613 with x_dot = A x
+            n = p.instance_of(p.I39["positive integer"], r1="n")
+            rep = p.instance_of(ct.I6850["state space model representation"], r1="rep")
+            rep.set_relation(ct.R5100["has model representation property"], ct.I4761["linearity"])
+            sys = p.instance_of(ct.I7641["general system model"], r1="sys")
+            sys.set_relation(ct.R2928["has model representation"], rep)
+
+            D = p.instance_of(ma.I5167["state space"], r1="D")
+            D.set_relation(ma.R3326["has dimension"], n)
+            rep.set_relation(ma.R5405["has associated state space"], D)
+            x0 = p.instance_of(ma.I1168["point in state space"], r1="x0")
+            D.set_relation(ma.R3798["has origin"], x0)
+            x = p.instance_of(ma.I1168["point in state space"], r1="x")
+            x.set_relation(p.R15["is element of"], D)
+
+            A = p.instance_of(ma.I9906["square matrix"], r1="A")
+            A.set_relation(ma.R5938["has row number"], n)
+            ma.set_numeric_value(A, A_value)
+
+            f = p.instance_of(ma.I9841["vector field"], r1="f")
+            rep.set_relation(ct.R4122["has associated drift vector field"], f)
+            x_mat = ma.I9489["vector to matrix"](ma.I1284["point in vector space to vector"](x))
+            p.new_equation(f(x), ma.I4218["matrix to vector"](ma.I5177["matmul"](A, x_mat)))
+            return sys, x0
+
+        with WorkloadModule():
+            sys1, x0_1 = create_linear_system([[-1, 2], [0, -3]])
+            sys2, x0_2 = create_linear_system([[1, 2], [0, -3]])
+
+            res = ct.apply_theorems_to_systems()
+            applied = [(stm.subject, stm.object) for stm in res.new_statements]
+            self.assertIn((ct.I2613, sys1), applied)
+            self.assertIn((ct.I2613, sys2), applied)
+
+            engine = ct.TheoremInferenceEngine()
+            res = engine.run()
+
+            # A1 is Hurwitz -> Lyapunov equation has a solution P (I3712) -> origin is globally asymptotically stable
+            self.assertEqual(x0_1.R16__has_property, [ct.I5677["global asymptotic stability"]])
+            self.assertEqual(x0_2.R16__has_property, [])
+            rule_uris = [rule_uri for fact, rule_uri in engine.derivations]
+            self.assertIn(ct.I3712.uri, rule_uris)
+            self.assertIn(ct.I2613.uri, rule_uris)
+            labels = [str(itm.R1__has_label) for itm in res.new_entities if isinstance(itm, p.Item)]
+            self.assertEqual(labels.count("P"), 1)
+            self.assertEqual(labels.count("V"), 1)
+            # the universally quantified Q of I3712 is instantiated by the identity matrix
+            (Q,) = [itm for itm in res.new_entities if isinstance(itm, p.Item) and str(itm.R1__has_label) == "Q"]
+            self.assertEqual(Q.R4__is_instance_of, ma.I1608["identity matrix"])
+
+            # fixpoint: neither the same engine nor a new one derives anything new
+            n_statements = len(res.new_statements)
+            self.assertEqual(len(engine.run().new_statements), n_statements)
+            res2 = ct.infer_theorem_assertions()
+            self.assertEqual((res2.new_statements, res2.new_entities), ([], []))
+
 
 class Test_03_agents(unittest.TestCase):
     def setUp(self):
@@ -344,3 +1224,49 @@ class Test_03_agents(unittest.TestCase):
 
         segment2 = ag.get_source_segment(ag.I7558["2002_Khalil"], "Section 4.1")
         self.assertTrue(segment2 is segment)
+
+    def test_c04__citation_index(self):
+        author = p.instance_of(ag.I7435["human"], r1="test author")
+        doc = p.instance_of(ag.I6591["source document"], r1="test document")
+        doc.set_relation(ag.R8433["has authors"], author)
+
+        segment1 = ag.get_source_segment(doc, "Section 1")
+        segment2 = ag.get_source_segment(doc, "Section 2")
+        self.assertEqual(segment1.ag__R8438__is_segment_of, doc)
+
+        art1, art2, art3 = [p.instance_of(p.I15["implication proposition"]) for _ in range(3)]
+        art1.set_relation(ag.R8439["is described by source"], segment1)
+        art2.set_relation(ag.R8439["is described by source"], segment1)
+        art3.set_relation(ag.R8439["is described by source"], doc)
+
+        cidx = ag.get_citation_index()
+        res = cidx.get_described_artifacts(segment1, segment2, doc)
+        self.assertEqual(res[segment1.uri], [art1, art2])
+        self.assertEqual(res[segment2.uri], [])
+        self.assertEqual(res[doc.uri], [art3, art1, art2])
+
+        self.assertEqual(cidx.get_documents_by_author(author), {author.uri: [doc]})
+        self.assertEqual(cidx.get_sources(art1, art3), {art1.uri: [doc], art3.uri: [doc]})
+        self.assertEqual(cidx.get_citation_counts()[segment1.uri], 2)
+        self.assertEqual(cidx.get_citation_counts(level="document")[doc.uri], 3)
+
+        # incremental update
+        art4 = p.instance_of(p.I15["implication proposition"])
+        art4.set_relation(ag.R8439["is described by source"], segment2)
+        res = ag.get_citation_index().get_artifacts_by_author(author)
+        self.assertEqual(res[author.uri], [art3, art1, art2, art4])
+
+        # removed and replaced statement (same number of statements) -> rebuild
+        (stm,) = art1.get_relations(ag.R8439.uri)
+        stm.unlink()
+        art1.set_relation(ag.R8439["is described by source"], segment2)
+        res = ag.get_citation_index().get_described_artifacts(segment1, segment2)
+        self.assertEqual(res, {segment1.uri: [art2], segment2.uri: [art4, art1]})
+
+        # the base class is shared by all modules and can only be used via subclasses
+        self.assertIs(ct.si, ag.si)
+        with self.assertRaises(TypeError):
+            ag.si.IncrementalStatementIndex()
+
+        most_cited_segment, count = cidx.get_most_cited(1)[0]
+        self.assertGreaterEqual(count, 2)
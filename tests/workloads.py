@@ -0,0 +1,239 @@
+"""
+Generator for synthetic OCSE workloads (large graphs which are shaped like the real ones).
+
+The entities are created directly via the APIs of the `ag`, `ma` and `ct` modules. All random choices are drawn
+from a seeded `random.Random` instance, i.e. the same profile and seed always result in the same graph structure.
+
+Usage:
+
+    with WorkloadModule():
+        gen = WorkloadGenerator(ag, ma, ct, seed=0)
+        workload = gen.build("small")
+        ...
+
+The module is intentionally not named test_*.py such that it is not collected by unittest/pytest.
+"""
+
+import itertools
+import random
+
+import pyirk as p
+
+WORKLOAD_MOD_URI = "irk:/ocse/0.2/workload"
+
+# number of entities which are created for each kind of workload
+PROFILES = {
+    "tiny": dict(systems=10, theorems=2, matmuls=10, equilibria=10, people=10, sources=5),
+    "small": dict(systems=100, theorems=10, matmuls=100, equilibria=100, people=100, sources=30),
+    "medium": dict(systems=1000, theorems=50, matmuls=1000, equilibria=1000, people=1000, sources=300),
+    "large": dict(systems=10000, theorems=200, matmuls=10000, equilibria=10000, people=5000, sources=2000),
+}
+
+GIVEN_NAMES = ["Ada", "Emmy", "Kurt", "Sofia", "Alan", "Grace", "Henri", "Olga", "Rudolf", "Aleksandr"]
+FAMILY_NAMES = ["Lovelace", "Noether", "Goedel", "Kovalevskaya", "Turing", "Hopper", "Poincare", "Ladyzhenskaya"]
+
+
+class WorkloadModule:
+    """
+    Context manager for a temporary module which holds all generated entities (they are removed afterwards).
+
+    Every instance uses its own module uri because some caches (e.g. `ag.SOURCE_SEGMENT_CACHE` or the
+    item-symbol-map of math1) are keyed by uri and would otherwise return entities of an already unloaded module.
+    """
+
+    counter = itertools.count()
+
+    def __init__(self, n_keys=10**6):
+        """
+        :param n_keys:  size of the key reservoir (a system model needs ~20 keys, a matmul expression ~60 keys)
+        """
+        self.uri = f"{WORKLOAD_MOD_URI}/{next(self.counter)}"
+        self.n_keys = n_keys
+
+        self._uri_context = p.uri_context(uri=self.uri)
+
+    def __enter__(self):
+        keymanager = p.KeyManager(minval=1000, maxval=1000 + self.n_keys)
+        p.register_mod(self.uri, keymanager, check_uri=False)
+        # (unlike `p.start_mod`) this also works if another module is active (e.g. in unittests)
+        self._uri_context.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        self._uri_context.__exit__(*args)
+        p.unload_mod(self.uri, strict=False)
+
+
+class WorkloadGenerator:
+    """
+    Create synthetic system models, theorems, matmul expressions, equilibrium points, people and sources in the
+    active module.
+    """
+
+    def __init__(self, ag, ma, ct, seed=0):
+        self.ag = ag
+        self.ma = ma
+        self.ct = ct
+        self.rng = random.Random(seed)
+
+        # use all properties which are defined in control_theory1 (sorted by uri for reproducibility)
+        self.representation_properties = self._get_instances(ct.I1793["general model representation property"])
+        self.system_properties = self._get_instances(ct.I5356["general system property"])
+
+        self.people = []
+
+    def _get_instances(self, cls):
+        res = [itm for itm in p.ds.items.values() if itm.uri.startswith(self.ct.__URI__) and p.is_instance(itm, cls)]
+        return sorted(res, key=lambda itm: itm.uri)
+
+    def _sample(self, population, max_number):
+        return self.rng.sample(population, self.rng.randint(0, min(max_number, len(population))))
+
+    def create_systems(self, n, max_properties=3):
+        """
+        Create n I7641__general_system_model items, each with a model representation and random subsets of
+        model representation properties and general system properties.
+
+        :return:    list of (system, representation)-pairs
+        """
+        ct = self.ct
+        res = []
+        for i in range(n):
+            rep = p.instance_of(ct.I2928["general model representation"], r1=f"rep{i}")
+            for prop in self._sample(self.representation_properties, max_properties):
+                rep.set_relation(ct.R5100["has model representation property"], prop)
+            sys = p.instance_of(ct.I7641["general system model"], r1=f"sys{i}")
+            sys.set_relation(ct.R2928["has model representation"], rep)
+            for prop in self._sample(self.system_properties, max_properties):
+                sys.set_relation(ct.R8303["has general system property"], prop)
+            res.append((sys, rep))
+        return res
+
+    def create_theorems(self, n, max_properties=2):
+        """
+        Create n theorems whose setting consists of a system model with a model representation (both with random
+        properties), i.e. theorems which can be linked by `ct.apply_theorems_to_systems`.
+        """
+        ct = self.ct
+        res = []
+        for i in range(n):
+            th = p.instance_of(p.I17["equivalence proposition"], r1=f"synthetic theorem {i}")
+            with th.scope("setting") as cm:
+                sys = cm.new_var(sys=p.instance_of(ct.I7641["general system model"]))
+                rep = cm.new_var(rep=p.instance_of(ct.I2928["general model representation"]))
+                cm.new_rel(sys, ct.R2928["has model representation"], rep)
+                for prop in self._sample(self.representation_properties, max_properties):
+                    cm.new_rel(rep, ct.R5100["has model representation property"], prop)
+                for prop in self._sample(self.system_properties, max_properties):
+                    cm.new_rel(sys, ct.R8303["has general system property"], prop)
+            with th.scope("assertion") as cm:
+                cm.new_var(V=p.instance_of(ct.I2933["Lyapunov Function"]))
+            res.append(th)
+        return res
+
+    def create_matmul_expressions(self, n, max_dim=6, invalid_fraction=0.5):
+        """
+        Create n matmul calls with random matrix dimensions. A fraction of them has incompatible dimensions
+        (and thus should be found by the corresponding constraint rule of math1).
+
+        :return:    list of (A, B, result, is_valid)-tuples
+        """
+        ma = self.ma
+        res = []
+        for _ in range(n):
+            rows, inner, cols = (self.rng.randint(1, max_dim) for _ in range(3))
+            is_valid = self.rng.random() >= invalid_fraction
+            inner2 = inner if is_valid else inner + self.rng.randint(1, max_dim)
+            A = p.instance_of(ma.I9904["matrix"], r1="A")
+            A.set_relation(ma.R5938["has row number"], rows)
+            A.set_relation(ma.R5939["has column number"], inner)
+            B = p.instance_of(ma.I9904["matrix"], r1="B")
+            B.set_relation(ma.R5938["has row number"], inner2)
+            B.set_relation(ma.R5939["has column number"], cols)
+            res.append((A, B, ma.I5177["matmul"](A, B), is_valid))
+        return res
+
+    def create_equilibrium_points(self, n, contradiction_fraction=0.5):
+        """
+        Create n equilibrium points with stability properties. A fraction of them has contradicting properties
+        (and thus should be found by the is_opposite_of constraint rule of control_theory1).
+
+        :return:    list of (equilibrium point, is_contradicting)-pairs
+        """
+        ct = self.ct
+        res = []
+        for _ in range(n):
+            x = p.instance_of(ct.I9820["equilibrium point"])
+            x.set_relation(p.R16["has property"], ct.I2931["local Lyapunov stability"])
+            is_contradicting = self.rng.random() < contradiction_fraction
+            if is_contradicting:
+                x.set_relation(p.R16["has property"], ct.I8303["strict Lyapunov instability"])
+            else:
+                x.set_relation(p.R16["has property"], ct.I6467["saddle"])
+            res.append((x, is_contradicting))
+        return res
+
+    def create_people(self, n):
+        """
+        Create n instances of ag.I7435__human (same relations as `ag.create_person`, which relies on source
+        inspection and thus cannot be used in a loop).
+        """
+        ag = self.ag
+        res = []
+        for _ in range(n):
+            given_name = self.rng.choice(GIVEN_NAMES)
+            family_name = self.rng.choice(FAMILY_NAMES)
+            person = p.create_item(
+                key_str=p.pop_uri_based_key("I"),
+                R1__has_label=f"{given_name} {family_name}",
+                R2__has_description="synthetic person",
+                R4__is_instance_of=ag.I7435["human"],
+                ag__R7781__has_family_name=family_name,
+                ag__R7782__has_given_name=given_name,
+            )
+            res.append(person)
+        self.people.extend(res)
+        return res
+
+    def create_sources(self, n, max_authors=3):
+        """
+        Create n source documents (with random authors from the already created people) and one segment per
+        document.
+        """
+        ag = self.ag
+        if not self.people:
+            self.create_people(max_authors)
+        res = []
+        for i in range(n):
+            authors = self.rng.sample(self.people, self.rng.randint(1, min(max_authors, len(self.people))))
+            year = self.rng.randint(1950, 2023)
+            source = p.create_item(
+                key_str=p.pop_uri_based_key("I"),
+                R1__has_label=f"{year}_{authors[0].ag__R7781__has_family_name[0]}_{i}",
+                R2__has_description="synthetic publication",
+                R4__is_instance_of=ag.I6591["source document"],
+                ag__R8433__has_authors=authors,
+                ag__R8434__has_title=f"synthetic title {i}",
+                ag__R8435__has_year=year,
+            )
+            ag.get_source_segment(source, f"Section {self.rng.randint(1, 9)}")
+            res.append(source)
+        return res
+
+    def build(self, profile="small", **kwargs):
+        """
+        Create a complete workload.
+
+        :param profile:     key of PROFILES
+        :param kwargs:      override single entries of the profile (e.g. systems=500)
+        :return:            dict with the created entities for each kind
+        """
+        sizes = dict(PROFILES[profile], **kwargs)
+        return {
+            "systems": self.create_systems(sizes["systems"]),
+            "theorems": self.create_theorems(sizes["theorems"]),
+            "matmuls": self.create_matmul_expressions(sizes["matmuls"]),
+            "equilibria": self.create_equilibrium_points(sizes["equilibria"]),
+            "people": self.create_people(sizes["people"]),
+            "sources": self.create_sources(sizes["sources"]),
+        }